@@ -3,16 +3,34 @@ import os
 import uuid
 import time
 import json
+import hashlib
+import mimetypes
+import threading
+import collections
+from urllib.parse import quote
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-from flask import Flask, render_template, request, redirect, url_for, flash, send_from_directory, jsonify, session
+from flask import Flask, render_template, request, redirect, url_for, flash, send_from_directory, jsonify, session, Response, stream_with_context, abort
 from werkzeug.utils import secure_filename
-import cv2
-from PIL import Image
 import logging
 from datetime import datetime
 
-# Set environment variables to avoid TensorFlow warnings
-os.environ['TF_ENABLE_ONEDNN_OPTS'] = '0'
+from prediction_cache import PredictionCache
+from perceptual_hash import PerceptualHashIndex
+from prediction_jobs import JobQueue
+from image_decoding import decode_image
+from image_quality import QualityGate
+from embedding_index import EmbeddingIndex
+from explanations import ExplanationStore
+from derivatives import DerivativeCache, FORMATS as DERIVATIVE_FORMATS
+from thread_budget import plan_thread_budget, apply_thread_budget
+from inference_profile import load_inference_profile, DEFAULT_PROFILE_PATH
+
+# Runtime profile written by autotune.py; its values are defaults that environment variables override
+INFERENCE_PROFILE = load_inference_profile(os.environ.get('INFERENCE_PROFILE', DEFAULT_PROFILE_PATH))
+
+# Set environment variables to avoid TensorFlow warnings; oneDNN stays off unless autotune chose it
+os.environ.setdefault('TF_ENABLE_ONEDNN_OPTS', '1' if INFERENCE_PROFILE['onednn'] else '0')
 os.environ['TF_CPP_MIN_LOG_LEVEL'] = '2'
 
 # Initialize Flask application
@@ -29,9 +47,131 @@ app.config['DEBUG'] = DEBUG_MODE
 # Configure paths - use /tmp for Render's ephemeral filesystem
 UPLOAD_FOLDER = os.path.join('/tmp', 'uploads') if 'RENDER' in os.environ else os.path.join('user_data', 'uploads')
 LOG_FOLDER = os.path.join('/tmp', 'logs') if 'RENDER' in os.environ else os.path.join('logs')
+DERIVATIVE_FOLDER = os.path.join(os.path.dirname(UPLOAD_FOLDER), 'derived')
+MEDIA_ROOT = os.path.dirname(UPLOAD_FOLDER)  # Parent of the upload and derivative folders
 ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 
+# Serving stored images - originals never change (uuid names) and are cached for a year; vis_ and cam_
+# files can be regenerated, so browsers revalidate them against their content-hash ETag
+UPLOAD_MAX_AGE = int(os.environ.get('UPLOAD_MAX_AGE', 31536000))
+GENERATED_MAX_AGE = int(os.environ.get('GENERATED_MAX_AGE', 300))
+# Hand file bytes to the front proxy: 'x-sendfile' (Apache/lighttpd) or 'x-accel' (nginx, with an internal
+# location at MEDIA_ACCEL_PREFIX aliased to MEDIA_ROOT); empty streams them from the worker
+MEDIA_SENDFILE = os.environ.get('MEDIA_SENDFILE', '')
+MEDIA_ACCEL_PREFIX = os.environ.get('MEDIA_ACCEL_PREFIX', '/protected-media/')
+app.config['USE_X_SENDFILE'] = MEDIA_SENDFILE == 'x-sendfile'
+
+# Inference tuning - micro-batching only helps when a worker serves concurrent requests (e.g. gunicorn --threads)
+INFERENCE_BATCHING = os.environ.get('INFERENCE_BATCHING', '1' if INFERENCE_PROFILE['batching'] else '0') == '1'
+INFERENCE_MAX_BATCH = int(os.environ.get('INFERENCE_MAX_BATCH', INFERENCE_PROFILE['max_batch_size']))
+INFERENCE_MAX_WAIT_MS = float(os.environ.get('INFERENCE_MAX_WAIT_MS', INFERENCE_PROFILE['max_wait_ms']))
+INFERENCE_MODE = os.environ.get('INFERENCE_MODE', INFERENCE_PROFILE['inference_mode'])  # 'keras' or 'compiled'
+INFERENCE_JIT = os.environ.get('INFERENCE_JIT', '1' if INFERENCE_PROFILE['jit_compile'] else '0') == '1'
+INFERENCE_BACKEND = os.environ.get('INFERENCE_BACKEND')  # 'keras' or 'tflite', inferred from MODEL_PATH if unset
+TOP_K_DISPLAY = 5  # Predictions shown in the result page chart
+MODEL_PATH = os.environ.get('MODEL_PATH', INFERENCE_PROFILE['model_path'] or os.path.join('models', 'plant_disease_model_best.keras'))
+
+# Hand decoded images to dedicated inference_server.py processes over shared memory instead of
+# loading the model in every web worker (set to the server socket path to enable)
+INFERENCE_SERVER = os.environ.get('INFERENCE_SERVER')
+INFERENCE_SERVER_PROCESSES = int(os.environ.get('INFERENCE_SERVER_PROCESSES', 1))
+
+# Split CPU cores across gunicorn workers so their TensorFlow thread pools do not oversubscribe the box
+INFERENCE_WORKERS = int(os.environ.get('INFERENCE_WORKERS', os.environ.get('WEB_CONCURRENCY', 1)))
+INFERENCE_INTRA_OP_THREADS = int(os.environ.get('INFERENCE_INTRA_OP_THREADS', INFERENCE_PROFILE['num_threads'] or 0))  # 0 = cores per worker
+INFERENCE_INTER_OP_THREADS = int(os.environ.get('INFERENCE_INTER_OP_THREADS', INFERENCE_PROFILE['inter_op_threads'] or 0))  # 0 = 1, or 2 on 8+ cores
+INFERENCE_PIN_CPUS = os.environ.get('INFERENCE_PIN_CPUS', '0') == '1'
+
+# Load TensorFlow and the model on a background thread (set LOAD_MODEL_IN_BACKGROUND=0 to block at import)
+LOAD_MODEL_IN_BACKGROUND = os.environ.get('LOAD_MODEL_IN_BACKGROUND', '1') == '1'
+
+# Run synthetic inputs through every serving batch shape before reporting ready
+MODEL_WARMUP = os.environ.get('MODEL_WARMUP', '1') == '1'
+
+# Uploads are decoded at the smallest JPEG DCT scale that still covers the display size
+DISPLAY_SIZE = (640, 480)
+DECODE_QUALITY = os.environ.get('DECODE_QUALITY', 'balanced')  # 'fast', 'balanced' or 'full'
+DECODE_BACKEND = os.environ.get('DECODE_BACKEND', 'pil')  # 'pil' or 'cv2'
+
+# Write original uploads to disk in the background; PERSIST_UPLOADS=0 keeps them in memory only
+PERSIST_UPLOADS = os.environ.get('PERSIST_UPLOADS', '1') == '1'
+
+# Prediction cache keyed by image content - set PREDICTION_CACHE_DIR to persist results across restarts
+PREDICTION_CACHE_SIZE = int(os.environ.get('PREDICTION_CACHE_SIZE', 1024))
+PREDICTION_CACHE_MB = float(os.environ.get('PREDICTION_CACHE_MB', 16))
+PREDICTION_CACHE_TTL = int(os.environ.get('PREDICTION_CACHE_TTL', 24 * 3600))
+PREDICTION_CACHE_DIR = os.environ.get('PREDICTION_CACHE_DIR')
+
+# Near-duplicate reuse for re-photographed leaves - NEAR_DUPLICATE_DISTANCE=-1 disables it
+NEAR_DUPLICATE_DISTANCE = int(os.environ.get('NEAR_DUPLICATE_DISTANCE', 6))
+NEAR_DUPLICATE_CAPACITY = int(os.environ.get('NEAR_DUPLICATE_CAPACITY', 200000))
+NEAR_DUPLICATE_METHOD = os.environ.get('NEAR_DUPLICATE_METHOD', 'dhash')  # 'dhash' or 'phash'
+
+# Test-time augmentation: flips/rotations/crops in one extra batch when confidence is below the
+# threshold (or when a request sends tta=1), with the extra latency capped at TTA_MAX_MS
+TTA_CONFIDENCE_THRESHOLD = float(os.environ.get('TTA_CONFIDENCE_THRESHOLD', 0.5))  # -1 disables automatic TTA
+TTA_AGGREGATE = os.environ.get('TTA_AGGREGATE', 'mean')  # 'mean' or 'geometric'
+TTA_MAX_VIEWS = int(os.environ.get('TTA_MAX_VIEWS', 8))
+TTA_MAX_MS = float(os.environ.get('TTA_MAX_MS', 150))
+
+# Confidence cascade: a small student model answers first and the full model only runs when the
+# student's confidence or top-1 margin is below threshold (see calibrate_cascade.py)
+CASCADE_MODEL_PATH = os.environ.get('CASCADE_MODEL_PATH', INFERENCE_PROFILE['cascade_model_path'] or '')  # Empty disables
+CASCADE_THRESHOLD = float(os.environ.get('CASCADE_THRESHOLD', INFERENCE_PROFILE['cascade_threshold']))
+CASCADE_MARGIN = float(os.environ.get('CASCADE_MARGIN', INFERENCE_PROFILE['cascade_margin']))
+
+# Crop-scoped predictions (requests send crop=tomato): CROP_HEADS=1 scores only the crop's classes with
+# per-crop heads over a cached backbone embedding instead of masking the full output (Keras backend only)
+CROP_HEADS = os.environ.get('CROP_HEADS', '0') == '1'
+CROP_HEADS_PATH = os.environ.get('CROP_HEADS_PATH')  # Optional .npz of separately fitted heads
+EMBEDDING_CACHE_SIZE = int(os.environ.get('EMBEDDING_CACHE_SIZE', 256))
+
+# Similar confirmed cases: an upload's backbone embedding is searched against an append-only index of
+# embeddings of uploads whose diagnosis a user confirmed (Keras backend only). The lookup runs on demand
+# from the result page, so /predict keeps the batched, compiled and cascade inference paths
+SIMILAR_CASES_INDEX = os.environ.get('SIMILAR_CASES_INDEX', '')  # Index path prefix, empty disables
+SIMILAR_CASES_K = int(os.environ.get('SIMILAR_CASES_K', 3))
+SIMILAR_CASES_NPROBE = int(os.environ.get('SIMILAR_CASES_NPROBE', 8))  # IVF lists scanned per query
+SIMILAR_CASES_MIN_SCORE = float(os.environ.get('SIMILAR_CASES_MIN_SCORE', 0.5))  # Cosine similarity
+
+# Visualizations are rendered on first GET (or in the background when uploads are not kept), and
+# pages show resized JPEG/WebP derivatives from a size-bounded cache instead of full-size files
+VIS_JPEG_QUALITY = int(os.environ.get('VIS_JPEG_QUALITY', 85))
+DERIVATIVE_WIDTHS = [int(w) for w in os.environ.get('DERIVATIVE_WIDTHS', '160,320,640').split(',') if w.strip()]
+DERIVATIVE_CACHE_MB = float(os.environ.get('DERIVATIVE_CACHE_MB', 64))
+DERIVATIVE_JPEG_QUALITY = int(os.environ.get('DERIVATIVE_JPEG_QUALITY', 82))
+DERIVATIVE_WEBP_QUALITY = int(os.environ.get('DERIVATIVE_WEBP_QUALITY', 78))
+
+# Grad-CAM explanations, computed on first view of an upload's explanation and cached (Keras backend only)
+EXPLANATION_CACHE_SIZE = int(os.environ.get('EXPLANATION_CACHE_SIZE', 64))  # Heatmaps kept in memory
+
+# Tiled sliding-window mode for field and drone shots (requests send tiled=1)
+TILED_MAX_SIDE = int(os.environ.get('TILED_MAX_SIDE', 896))  # Analysis resolution of the long side
+TILED_STRIDE = int(os.environ.get('TILED_STRIDE', 0))  # 0 = half a tile
+TILED_DISEASE_THRESHOLD = float(os.environ.get('TILED_DISEASE_THRESHOLD', 0.5))
+
+# Multi-leaf mode: segment leaves and classify each one (requests send leaves=1)
+LEAF_MAX_REGIONS = int(os.environ.get('LEAF_MAX_REGIONS', 8))  # Caps the per-request batch size
+LEAF_MIN_AREA_FRACTION = float(os.environ.get('LEAF_MIN_AREA_FRACTION', 0.02))
+LEAF_DISEASE_THRESHOLD = float(os.environ.get('LEAF_DISEASE_THRESHOLD', 0.5))
+
+# Pre-inference quality gate: 'reject' skips inference for unusable photos, 'flag' only annotates the result
+QUALITY_GATE = os.environ.get('QUALITY_GATE', 'reject')
+QUALITY_MIN_SHARPNESS = float(os.environ.get('QUALITY_MIN_SHARPNESS', 25.0))  # Laplacian variance at 256px
+QUALITY_MIN_BRIGHTNESS = float(os.environ.get('QUALITY_MIN_BRIGHTNESS', 35.0))
+QUALITY_MAX_BRIGHTNESS = float(os.environ.get('QUALITY_MAX_BRIGHTNESS', 225.0))
+QUALITY_MIN_VEGETATION = float(os.environ.get('QUALITY_MIN_VEGETATION', 0.05))  # Fraction of leaf-colored pixels
+
+# Asynchronous prediction jobs - set PREDICTION_JOBS_DB to a SQLite path to share job state across workers
+PREDICTION_JOB_WORKERS = int(os.environ.get('PREDICTION_JOB_WORKERS', 2))
+PREDICTION_JOB_MAX_PENDING = int(os.environ.get('PREDICTION_JOB_MAX_PENDING', 256))
+PREDICTION_JOB_TTL = int(os.environ.get('PREDICTION_JOB_TTL', 3600))
+PREDICTION_JOBS_DB = os.environ.get('PREDICTION_JOBS_DB')
+# The upload page polls job status by default; an open SSE stream holds a sync gunicorn worker for the whole
+# job, so only set this with a threaded or async worker (gunicorn -k gthread --threads 8, or -k gevent)
+PREDICTION_JOB_EVENTS = os.environ.get('PREDICTION_JOB_EVENTS', '0') == '1'
+
 # Ensure directories exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 os.makedirs('models', exist_ok=True)
@@ -102,2014 +242,8 @@ except (FileNotFoundError, json.JSONDecodeError) as e:
     "Tomato___healthy"
 ]
 
-# Disease information database
-disease_database = {
-    
-    'Apple___Apple_scab': {
-        'name': 'Apple Scab',
-        'scientific_name': 'Venturia inaequalis',
-        'description': 'A fungal disease that causes dark, scabby lesions on leaves and fruit. Severe infections can cause defoliation and reduce fruit quality and yield. Scab lesions start as olive-green spots that later become dark brown and corky.',
-        'symptoms': [
-            'Olive-green to brown spots on leaves',
-            'Dark, corky lesions on fruit',
-            'Deformed fruit',
-            'Premature leaf drop',
-            'Cracking of fruit skin'
-        ],
-        'treatment': {
-            'organic': [
-                'Apply sulfur or copper-based fungicides every 7-10 days during wet periods',
-                'Neem oil applications at 7-14 day intervals',
-                'Potassium bicarbonate sprays for light infections',
-                'Bacillus subtilis biological fungicide applications'
-            ],
-            'chemical': [
-                'Myclobutanil (Rally) applications at 7-14 day intervals',
-                'Captan fungicide applications during the growing season',
-                'Propiconazole sprays at recommended rates',
-                'Chlorothalonil for protective treatment before infection'
-            ]
-        },
-        'prevention': [
-            'Plant resistant apple varieties like Liberty, Enterprise, or Jonafree',
-            'Prune trees to improve air circulation',
-            'Rake and destroy fallen leaves in autumn',
-            'Apply dormant oil spray with lime sulfur during the dormant season',
-            'Maintain proper tree spacing (15-20 feet apart)'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1 inch per week',
-            'recommendations': [
-                'Avoid overhead irrigation which promotes leaf wetness',
-                'Water at the base of trees in the morning',
-                'Ensure good soil drainage',
-                'Reduce irrigation during rainy periods'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '59-75°F (15-24°C) optimal for disease development',
-            'humidity': 'High humidity (>90%) promotes infection',
-            'conditions': 'Wet spring weather significantly increases risk'
-        },
-        'crop_impact': {
-            'yield_reduction': '50-70% in severe cases',
-            'quality_impact': 'Significant reduction in fruit marketability',
-            'economic_threshold': 'Treatment justified when 1-5% of leaves show symptoms'
-        }
-    },
-    
-    'Apple___Black_rot': {
-        'name': 'Apple Black Rot',
-        'scientific_name': 'Botryosphaeria obtusa',
-        'description': 'A fungal disease affecting apple trees that causes leaf spots, fruit rot, and cankers on branches. The disease can overwinter in cankers and mummified fruit, spreading during warm, wet conditions.',
-        'symptoms': [
-            'Purple spots on leaves that develop tan or brown centers',
-            'Dark, sunken lesions on fruit that eventually turn black',
-            'Mummified fruit that remain attached to the tree',
-            'Cankers on branches and twigs',
-            'Leaf yellowing and premature drop'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based fungicides applied at 7-10 day intervals',
-                'Neem oil applications during the growing season',
-                'Potassium bicarbonate sprays for mild infections',
-                'Bacillus subtilis biological treatments'
-            ],
-            'chemical': [
-                'Thiophanate-methyl fungicides during the growing season',
-                'Captan applications at 10-14 day intervals',
-                'Myclobutanil treatments from petal fall through harvest',
-                'Mancozeb sprays during early season development'
-            ]
-        },
-        'prevention': [
-            'Remove and destroy infected plant material including mummified fruit',
-            'Prune out cankers and dead wood during dormant season',
-            'Maintain tree vigor through proper fertilization',
-            'Ensure adequate spacing between trees for air circulation',
-            'Apply dormant oil sprays before bud break'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1 inch per week',
-            'recommendations': [
-                'Avoid overhead irrigation to reduce leaf wetness',
-                'Water at the base of trees in early morning',
-                'Ensure proper soil drainage',
-                'Adjust irrigation during rainy periods'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '68-75°F (20-24°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection',
-            'conditions': 'Warm, wet weather accelerates disease spread'
-        },
-        'crop_impact': {
-            'yield_reduction': '30-50% in severe cases',
-            'quality_impact': 'Significant reduction in marketable fruit',
-            'economic_threshold': 'Treatment warranted when 3-5% of fruit show symptoms'
-        }
-    },
-        'Apple___Cedar_apple_rust': {
-        'name': 'Cedar Apple Rust',
-        'scientific_name': 'Gymnosporangium juniperi-virginianae',
-        'description': 'A fungal disease requiring both apple trees and cedar/juniper trees to complete its life cycle. It causes bright orange-yellow spots on apple leaves and fruit, and gelatinous orange telial horns on cedar trees.',
-        'symptoms': [
-            'Bright orange-yellow spots on apple leaves and fruit',
-            'Small, raised bumps on the undersides of infected leaves',
-            'Defoliation in severe cases',
-            'Distorted fruit with yellow-orange lesions',
-            'Reduced fruit quality and yield'
-        ],
-        'treatment': {
-            'organic': [
-                'Sulfur-based fungicides applied preventatively',
-                'Neem oil applications every 7-10 days during spring',
-                'Potassium bicarbonate sprays for light infections',
-                'Bacillus subtilis biological fungicide treatments'
-            ],
-            'chemical': [
-                'Myclobutanil (Rally) applications starting at pink bud stage',
-                'Propiconazole sprays at 10-14 day intervals',
-                'Mancozeb treatments during primary infection periods',
-                'Fenarimol applications from green tip through petal fall'
-            ]
-        },
-        'prevention': [
-            'Remove nearby cedar/juniper trees if possible (within 1-2 miles)',
-            'Plant resistant apple varieties like Liberty, Redfree, or Williams Pride',
-            'Apply preventative fungicides before infection periods',
-            'Maintain good air circulation through proper pruning',
-            'Destroy fallen infected leaves'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1 inch per week',
-            'recommendations': [
-                'Avoid overhead irrigation which promotes spore germination',
-                'Water at the base of trees in the morning',
-                'Ensure good soil drainage',
-                'Reduce irrigation during high humidity periods'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '50-75°F (10-24°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection',
-            'conditions': 'Spring rains and moderate temperatures increase risk'
-        },
-        'crop_impact': {
-            'yield_reduction': '20-40% in severe cases',
-            'quality_impact': 'Reduced marketability of spotted fruit',
-            'economic_threshold': 'Treatment justified when disease appears on 5% of leaves'
-        }
-    },
-    
-    'Apple___healthy': {
-        'name': 'Healthy Apple',
-        'scientific_name': 'Malus domestica',
-        'description': 'Healthy apple trees display vibrant green leaves, sturdy branches, and produce firm, well-colored fruit. Proper maintenance ensures continued tree health and productivity.',
-        'symptoms': [
-            'Vibrant green leaves without spots or discoloration',
-            'Uniform leaf size and shape',
-            'Firm, well-developed fruit',
-            'Strong, flexible branches',
-            'Consistent annual growth'
-        ],
-        'treatment': {
-            'organic': [
-                'Regular applications of compost tea for soil health',
-                'Foliar seaweed sprays to boost micronutrients',
-                'Beneficial insect releases for pest management',
-                'Organic mulch application around tree base'
-            ],
-            'chemical': [
-                'Balanced NPK fertilizer applications as needed',
-                'Preventative fungicide program during wet seasons',
-                'Dormant oil sprays during winter',
-                'Calcium sprays to prevent bitter pit in fruit'
-            ]
-        },
-        'prevention': [
-            'Regular pruning to maintain tree structure and air circulation',
-            'Annual soil testing and appropriate amendments',
-            'Proper tree spacing (15-20 feet apart)',
-            'Mulching to retain moisture and suppress weeds',
-            'Integrated pest management monitoring'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-1.5 inches per week during growing season',
-            'recommendations': [
-                'Deep watering to encourage deep root development',
-                'Drip irrigation to deliver water efficiently',
-                'Morning watering to reduce evaporation',
-                'Adjust watering based on rainfall and temperature'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '60-75°F (15-24°C) optimal for growth',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun (6-8 hours daily) for best fruit production'
-        },
-        'crop_impact': {
-            'yield_potential': '100-300 pounds per mature tree annually',
-            'quality_characteristics': 'Firm, well-colored, properly sized fruit',
-            'economic_value': 'Maximum marketability and storage potential'
-        }
-    },
-    
-    'Blueberry___healthy': {
-        'name': 'Healthy Blueberry',
-        'scientific_name': 'Vaccinium corymbosum',
-        'description': 'Healthy blueberry plants have vibrant green leaves, strong canes, and produce plump, dusty-blue berries. They require acidic soil and consistent moisture for optimal growth and production.',
-        'symptoms': [
-            'Bright green leaves with no spots or discoloration',
-            'Firm, upright canes with no lesions',
-            'Abundant white or pink bell-shaped flowers in spring',
-            'Plump, dusty-blue berries with a waxy bloom',
-            'Consistent annual growth of new canes'
-        ],
-        'treatment': {
-            'organic': [
-                'Application of acidic organic matter like pine needles or coffee grounds',
-                'Elemental sulfur to maintain soil pH',
-                'Organic fish emulsion fertilizer during growing season',
-                'Compost tea applications to boost soil biology'
-            ],
-            'chemical': [
-                'Balanced acidic fertilizer (specifically for acid-loving plants)',
-                'Chelated iron supplements for iron chlorosis prevention',
-                'Ammonium sulfate applications to maintain acidity',
-                'Micronutrient sprays as indicated by soil tests'
-            ]
-        },
-        'prevention': [
-            'Maintain soil pH between 4.5-5.5',
-            'Mulch with pine bark, sawdust, or pine needles',
-            'Proper plant spacing (4-6 feet apart)',
-            'Regular pruning to remove old canes and maintain vigor',
-            'Bird netting to protect ripening fruit'
-        ],
-        'water_management': {
-            'requirements': 'Consistent moisture - 1-2 inches per week',
-            'recommendations': [
-                'Drip irrigation to provide consistent moisture',
-                'Avoid overhead watering which can promote disease',
-                'Ensure good drainage as plants dislike wet feet',
-                'Increase watering during fruit development and hot periods'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '60-75°F (15-24°C) optimal for growth',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun to partial shade, with protection from harsh afternoon sun in hot climates'
-        },
-        'crop_impact': {
-            'yield_potential': '5-10 pounds per mature bush annually',
-            'quality_characteristics': 'Firm, sweet berries with good size and bloom',
-            'economic_value': 'High marketability for fresh consumption and processing'
-        }
-    },
-    
-    'Cherry_(including_sour)___Powdery_mildew': {
-        'name': 'Cherry Powdery Mildew',
-        'scientific_name': 'Podosphaera clandestina',
-        'description': 'A fungal disease affecting cherry trees that appears as a white powdery coating on leaves, shoots, and fruit. Severe infections can reduce photosynthesis, stunt growth, and decrease fruit quality and yield.',
-        'symptoms': [
-            'White powdery coating on leaves, especially the undersides',
-            'Curling, twisting, or stunting of new leaves and shoots',
-            'Reduced fruit size and quality',
-            'Premature leaf drop in severe cases',
-            'Russeting or scarring of fruit'
-        ],
-        'treatment': {
-            'organic': [
-                'Sulfur applications at 7-10 day intervals',
-                'Potassium bicarbonate sprays for active infections',
-                'Neem oil treatments every 7-14 days',
-                'Milk spray (1:10 milk to water ratio) as a preventative'
-            ],
-            'chemical': [
-                'Myclobutanil applications at first sign of disease',
-                'Trifloxystrobin sprays at 14-day intervals',
-                'Propiconazole treatments during growing season',
-                'Tebuconazole applications for severe infections'
-            ]
-        },
-        'prevention': [
-            'Plant resistant cherry varieties when available',
-            'Prune trees to improve air circulation',
-            'Avoid excessive nitrogen fertilization',
-            'Remove and destroy infected plant parts',
-            'Space trees properly to reduce humidity in canopy'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-1.5 inches per week',
-            'recommendations': [
-                'Avoid overhead irrigation which increases humidity',
-                'Water at the base of trees in the morning',
-                'Ensure good soil drainage',
-                'Avoid overwatering which can increase humidity around plants'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '60-80°F (15-27°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection, but free water inhibits spore germination',
-            'conditions': 'Shade and poor air circulation increase disease severity'
-        },
-        'crop_impact': {
-            'yield_reduction': '20-30% in severe cases',
-            'quality_impact': 'Reduced marketability due to fruit scarring',
-            'economic_threshold': 'Treatment warranted when disease appears on 3-5% of leaves'
-        }
-    },
-        'Cherry_(including_sour)___healthy': {
-        'name': 'Healthy Cherry',
-        'scientific_name': 'Prunus avium (sweet) / Prunus cerasus (sour)',
-        'description': 'Healthy cherry trees display glossy, dark green leaves, strong branches, and produce firm, brightly colored fruit. Proper maintenance ensures tree health, longevity, and optimal fruit production.',
-        'symptoms': [
-            'Glossy, dark green leaves without spots or discoloration',
-            'Uniform leaf size and shape',
-            'Firm, well-developed fruit with bright coloration',
-            'Strong, flexible branches with smooth bark',
-            'Consistent annual growth and flowering'
-        ],
-        'treatment': {
-            'organic': [
-                'Balanced organic fertilizer applications in spring',
-                'Compost tea applications to boost soil biology',
-                'Seaweed extract foliar sprays for micronutrients',
-                'Beneficial insect releases for pest management'
-            ],
-            'chemical': [
-                'Balanced NPK fertilizer applications based on soil tests',
-                'Preventative fungicide program during wet seasons',
-                'Dormant oil sprays during winter dormancy',
-                'Calcium sprays to improve fruit firmness'
-            ]
-        },
-        'prevention': [
-            'Regular pruning to maintain open canopy and air circulation',
-            'Annual soil testing and appropriate amendments',
-            'Proper tree spacing (15-20 feet for sweet, 12-15 feet for sour)',
-            'Mulching to retain moisture and suppress weeds',
-            'Integrated pest management monitoring'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-1.5 inches per week during growing season',
-            'recommendations': [
-                'Deep watering to encourage deep root development',
-                'Drip irrigation to deliver water efficiently',
-                'Morning watering to reduce evaporation',
-                'Adjust watering based on rainfall and temperature'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '60-75°F (15-24°C) optimal for growth',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun (6-8 hours daily) for best fruit production'
-        },
-        'crop_impact': {
-            'yield_potential': '30-50 pounds per mature sweet cherry tree; 15-20 pounds for sour cherry',
-            'quality_characteristics': 'Firm, well-colored, properly sized fruit with good sugar content',
-            'economic_value': 'Maximum marketability and storage potential'
-        }
-    },
-    
-    'Corn_(maize)___Cercospora_leaf_spot Gray_leaf_spot': {
-        'name': 'Gray Leaf Spot',
-        'scientific_name': 'Cercospora zeae-maydis',
-        'description': 'A fungal disease of corn that causes rectangular, grayish-brown lesions on leaves. Severe infections can lead to significant yield losses by reducing photosynthetic area and weakening plants.',
-        'symptoms': [
-            'Rectangular, grayish-brown to tan lesions parallel to leaf veins',
-            'Lesions with a distinct yellow halo in early stages',
-            'Lesions that expand and coalesce under favorable conditions',
-            'Lower leaves affected first with upward progression',
-            'Premature death of leaves in severe cases'
-        ],
-        'treatment': {
-            'organic': [
-                'Limited effective organic treatments available',
-                'Copper-based fungicides may provide some suppression',
-                'Biological fungicides containing Bacillus subtilis',
-                'Crop rotation to non-host crops for at least one year'
-            ],
-            'chemical': [
-                'Strobilurin (QoI) fungicides like azoxystrobin or pyraclostrobin',
-                'Triazole fungicides such as propiconazole or tebuconazole',
-                'Combination products containing both QoI and triazole fungicides',
-                'Timing applications at early disease detection through tasseling'
-            ]
-        },
-        'prevention': [
-            'Plant resistant hybrids with high gray leaf spot tolerance',
-            'Implement crop rotation with non-host crops for 1-2 years',
-            'Practice conservation tillage to bury infected residue',
-            'Avoid excessive nitrogen applications',
-            'Plant in well-drained fields with good air circulation'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Avoid overhead irrigation which promotes leaf wetness',
-                'If irrigating, do so in early morning to allow leaves to dry',
-                'Ensure proper field drainage',
-                'Manage irrigation to avoid drought stress which can weaken plants'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '75-85°F (24-29°C) optimal for disease development',
-            'humidity': 'High humidity (>90%) and leaf wetness for 12+ hours promotes infection',
-            'conditions': 'Disease severity increases with extended periods of warm, humid weather'
-        },
-        'crop_impact': {
-            'yield_reduction': '20-50% in severe cases',
-            'quality_impact': 'Reduced grain fill and lower test weights',
-            'economic_threshold': 'Treatment warranted when lesions appear on lower third of plant before tasseling'
-        }
-    },
-    
-    'Corn_(maize)___Common_rust_': {
-        'name': 'Common Rust of Corn',
-        'scientific_name': 'Puccinia sorghi',
-        'description': 'A fungal disease characterized by small, circular to elongated, brick-red to brown pustules on corn leaves. The disease can reduce photosynthetic area and yield in severe cases, particularly in sweet corn.',
-        'symptoms': [
-            'Small, circular to elongated brick-red to brown pustules on both leaf surfaces',
-            'Pustules that rupture to release reddish-brown spores',
-            'Pustules turning black as they age',
-            'Chlorotic (yellow) areas surrounding pustules',
-            'Severe infections causing leaf death and reduced plant vigor'
-        ],
-        'treatment': {
-            'organic': [
-                'Limited effective organic treatments available',
-                'Sulfur-based fungicides may provide some protection',
-                'Copper-based fungicides as preventative treatment',
-                'Biological fungicides containing Bacillus subtilis'
-            ],
-            'chemical': [
-                'Strobilurin (QoI) fungicides like azoxystrobin or pyraclostrobin',
-                'Triazole fungicides such as propiconazole or tebuconazole',
-                'Chlorothalonil as a protective fungicide',
-                'Mancozeb applications at 7-14 day intervals'
-            ]
-        },
-        'prevention': [
-            'Plant resistant hybrids with rust tolerance',
-            'Early planting to avoid peak rust spore periods',
-            'Proper plant spacing to improve air circulation',
-            'Balanced fertilization to promote plant health',
-            'Scout fields regularly for early detection'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Avoid overhead irrigation which promotes spore germination',
-                'If irrigating, do so in early morning to allow leaves to dry quickly',
-                'Ensure proper field drainage',
-                'Manage irrigation to avoid plant stress'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '60-77°F (16-25°C) optimal for disease development',
-            'humidity': 'High humidity and 6+ hours of leaf wetness promotes infection',
-            'conditions': 'Cool, moist conditions favor disease development'
-        },
-        'crop_impact': {
-            'yield_reduction': '10-30% in severe cases, higher in sweet corn',
-            'quality_impact': 'Reduced ear size and kernel fill',
-            'economic_threshold': 'Treatment warranted in sweet corn when rust appears before silking; field corn typically has higher tolerance'
-        }
-    },
-    
-    'Corn_(maize)___Northern_Leaf_Blight': {
-        'name': 'Northern Corn Leaf Blight',
-        'scientific_name': 'Exserohilum turcicum (formerly Helminthosporium turcicum)',
-        'description': 'A fungal disease characterized by large, cigar-shaped lesions on corn leaves. Severe infections can cause significant yield losses by reducing photosynthetic area and weakening plants.',
-        'symptoms': [
-            'Large, cigar-shaped gray-green to tan lesions (1-6 inches long)',
-            'Lesions that develop dark areas of fungal sporulation',
-            'Lower leaves affected first with upward progression',
-            'Lesions that may coalesce to blight entire leaves',
-            'Premature death of leaves in severe cases'
-        ],
-        'treatment': {
-            'organic': [
-                'Limited effective organic treatments available',
-                'Copper-based fungicides may provide some suppression',
-                'Biological fungicides containing Bacillus subtilis',
-                'Crop rotation to non-host crops for at least one year'
-            ],
-            'chemical': [
-                'Strobilurin (QoI) fungicides like azoxystrobin or pyraclostrobin',
-                'Triazole fungicides such as propiconazole or tebuconazole',
-                'Combination products containing both QoI and triazole fungicides',
-                'Timing applications at early disease detection through silking'
-            ]
-        },
-        'prevention': [
-            'Plant resistant hybrids with Ht genes for NCLB resistance',
-            'Implement crop rotation with non-host crops for 1-2 years',
-            'Practice conservation tillage to bury infected residue',
-            'Balanced fertilization to promote plant health',
-            'Plant in well-drained fields with good air circulation'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Avoid overhead irrigation which promotes leaf wetness',
-                'If irrigating, do so in early morning to allow leaves to dry',
-                'Ensure proper field drainage',
-                'Manage irrigation to avoid drought stress which can weaken plants'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '65-80°F (18-27°C) optimal for disease development',
-            'humidity': 'High humidity and 6+ hours of leaf wetness promotes infection',
-            'conditions': 'Disease severity increases with extended periods of wet, moderate temperature weather'
-        },
-        'crop_impact': {
-            'yield_reduction': '30-50% in severe cases',
-            'quality_impact': 'Reduced grain fill and lower test weights',
-            'economic_threshold': 'Treatment warranted when lesions appear on lower third of plant before tasseling'
-        }
-    },
-        'Corn_(maize)___healthy': {
-        'name': 'Healthy Corn',
-        'scientific_name': 'Zea mays',
-        'description': 'Healthy corn plants display vibrant green leaves, strong stalks, and well-developed ears. Proper maintenance ensures optimal growth, yield, and resistance to pests and diseases.',
-        'symptoms': [
-            'Uniform, vibrant green leaves without lesions or discoloration',
-            'Strong, upright stalks without lodging',
-            'Well-formed tassels with abundant pollen',
-            'Properly filled ears with plump kernels',
-            'Consistent growth rate and development'
-        ],
-        'treatment': {
-            'organic': [
-                'Balanced organic fertilizer applications based on soil tests',
-                'Compost or manure incorporation before planting',
-                'Foliar seaweed or fish emulsion sprays during growth',
-                'Beneficial insect releases for pest management'
-            ],
-            'chemical': [
-                'Balanced NPK fertilizer applications based on soil tests',
-                'Split nitrogen applications for optimal utilization',
-                'Micronutrient supplements as indicated by tissue tests',
-                'Preventative fungicide program in high-risk situations'
-            ]
-        },
-        'prevention': [
-            'Crop rotation with non-grass crops',
-            'Proper hybrid selection for local conditions',
-            'Optimal planting date for your region',
-            'Appropriate plant population (28,000-34,000 plants/acre)',
-            'Regular scouting for early pest and disease detection'
-        ],
-        'water_management': {
-            'requirements': 'Moderate to high - 1-2 inches per week, critical during silking and grain fill',
-            'recommendations': [
-                'Ensure adequate moisture during critical growth stages',
-                'Monitor soil moisture to avoid stress',
-                'Implement efficient irrigation systems if available',
-                'Maintain field drainage to prevent waterlogging'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '77-91°F (25-33°C) optimal for growth',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun for maximum photosynthesis and yield'
-        },
-        'crop_impact': {
-            'yield_potential': '150-250 bushels per acre under optimal conditions',
-            'quality_characteristics': 'High test weight, proper moisture content, minimal damage',
-            'economic_value': 'Maximum marketability and feeding value'
-        }
-    },
-    
-    'Grape___Black_rot': {
-        'name': 'Grape Black Rot',
-        'scientific_name': 'Guignardia bidwellii',
-        'description': 'A fungal disease affecting grapes that causes leaf spots, fruit rot, and stem lesions. Black rot is one of the most serious diseases of grapes in regions with warm, humid growing seasons.',
-        'symptoms': [
-            'Circular, tan to brown spots with dark borders on leaves',
-            'Small, black fruiting bodies (pycnidia) visible in leaf lesions',
-            'Tan to brown lesions on shoots and stems',
-            'Fruit initially showing small white dots, then brown rot',
-            'Infected berries shrivel into hard, black mummies that may remain attached to clusters'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based fungicides applied preventatively',
-                'Potassium bicarbonate sprays for light infections',
-                'Sulfur applications at 7-14 day intervals',
-                'Bacillus subtilis biological fungicide treatments'
-            ],
-            'chemical': [
-                'Mancozeb applications starting at early shoot growth',
-                'Myclobutanil treatments at 10-14 day intervals',
-                'Tebuconazole sprays from pre-bloom through veraison',
-                'Azoxystrobin applications during critical infection periods'
-            ]
-        },
-        'prevention': [
-            'Remove all mummified berries and infected canes during dormant pruning',
-            'Maintain open canopy through proper pruning for air circulation',
-            'Remove infected leaves and fruit during the growing season',
-            'Plant resistant varieties when possible',
-            'Apply preventative fungicides before rainfall events'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water in the morning to allow foliage to dry quickly',
-                'Avoid overhead irrigation which promotes disease',
-                'Ensure good soil drainage to prevent root issues'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '70-85°F (21-29°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection',
-            'conditions': 'Rainfall or extended periods of leaf wetness (6+ hours) significantly increases infection risk'
-        },
-        'crop_impact': {
-            'yield_reduction': '50-80% in severe cases',
-            'quality_impact': 'Complete loss of affected fruit',
-            'economic_threshold': 'Treatment warranted at first sign of disease'
-        }
-    },
-    
-    'Grape___Esca_(Black_Measles)': {
-        'name': 'Esca (Black Measles)',
-        'scientific_name': 'Complex of fungi including Phaeomoniella chlamydospora, Phaeoacremonium spp., and Fomitiporia mediterranea',
-        'description': 'A complex fungal disease affecting the woody tissue of grapevines, causing leaf discoloration, fruit spotting, and eventual vine decline. Also known as black measles or apoplexy when symptoms develop rapidly.',
-        'symptoms': [
-            'Interveinal chlorosis and necrosis on leaves, creating a tiger-stripe pattern',
-            'Small, dark purple to black spots on fruit',
-            'Stunted shoot growth and dieback',
-            'Cross-sectional wood discoloration and decay',
-            'Sudden wilting and death of entire vines (apoplexy) in hot weather'
-        ],
-        'treatment': {
-            'organic': [
-                'Limited effective treatments once established',
-                'Wound protectants containing boric acid after pruning',
-                'Trichoderma-based biological products for pruning wounds',
-                'Trunk renewal by training new shoots from the base'
-            ],
-            'chemical': [
-                'No chemical treatments cure established infections',
-                'Fungicide wound protectants after pruning',
-                'Thiophanate-methyl applications to protect pruning wounds',
-                'Preventative fungicides during early vine establishment'
-            ]
-        },
-        'prevention': [
-            'Use clean, certified planting material',
-            'Prune during dry weather to reduce infection risk',
-            'Apply wound protectants immediately after pruning',
-            'Remove and destroy infected wood and dead vines',
-            'Avoid pruning stress by maintaining balanced crop loads'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Avoid water stress which can trigger apoplexy symptoms',
-                'Maintain consistent soil moisture',
-                'Use drip irrigation for efficient water delivery',
-                'Ensure good soil drainage to prevent root stress'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': 'High temperatures (>90°F/32°C) can trigger apoplexy in infected vines',
-            'humidity': 'Wet conditions during pruning increase infection risk',
-            'conditions': 'Stress factors like drought or excessive crop can worsen symptoms'
-        },
-        'crop_impact': {
-            'yield_reduction': '10-50% depending on severity',
-            'quality_impact': 'Reduced fruit quality and marketability',
-            'economic_threshold': 'Progressive disease requiring preventative management; no threshold for treatment'
-        }
-    },
-    
-    'Grape___Leaf_blight_(Isariopsis_Leaf_Spot)': {
-        'name': 'Grape Leaf Blight',
-        'scientific_name': 'Pseudocercospora vitis (formerly Isariopsis leaf spot)',
-        'description': 'A fungal disease affecting grape leaves, causing spots that can coalesce into blighted areas. Severe infections can cause premature defoliation, reducing vine vigor and fruit quality.',
-        'symptoms': [
-            'Small, irregular dark brown to black spots on leaves',
-            'Spots that enlarge and develop gray-brown centers with dark borders',
-            'Lesions that may coalesce to form larger blighted areas',
-            'Premature leaf drop in severe cases',
-            'Reduced fruit ripening due to defoliation'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based fungicides applied preventatively',
-                'Sulfur applications at 7-14 day intervals',
-                'Potassium bicarbonate sprays for light infections',
-                'Bacillus subtilis biological fungicide treatments'
-            ],
-            'chemical': [
-                'Mancozeb applications starting at early shoot growth',
-                'Azoxystrobin treatments at 10-14 day intervals',
-                'Tebuconazole sprays during critical infection periods',
-                'Myclobutanil applications from pre-bloom through veraison'
-            ]
-        },
-        'prevention': [
-            'Maintain open canopy through proper pruning for air circulation',
-            'Remove infected leaves during the growing season',
-            'Apply preventative fungicides before rainfall events',
-            'Ensure balanced nutrition to promote vine health',
-            'Avoid overhead irrigation which promotes leaf wetness'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water in the morning to allow foliage to dry quickly',
-                'Avoid overhead irrigation which promotes disease',
-                'Ensure good soil drainage to prevent root issues'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '68-82°F (20-28°C) optimal for disease development',
-            'humidity': 'High humidity (>85%) promotes infection',
-            'conditions': 'Prolonged leaf wetness (6+ hours) significantly increases infection risk'
-        },
-        'crop_impact': {
-            'yield_reduction': '10-30% in severe cases',
-            'quality_impact': 'Reduced fruit quality due to poor ripening',
-            'economic_threshold': 'Treatment warranted when disease appears on 3-5% of leaves'
-        }
-    },
-        'Grape___healthy': {
-        'name': 'Healthy Grape',
-        'scientific_name': 'Vitis vinifera / Vitis labrusca / Vitis hybrid',
-        'description': 'Healthy grapevines display vibrant green leaves, strong canes, and well-developed fruit clusters. Proper maintenance ensures vine longevity, optimal yield, and high-quality fruit production.',
-        'symptoms': [
-            'Vibrant green leaves without spots or discoloration',
-            'Uniform leaf size and shape appropriate to variety',
-            'Strong, flexible canes with appropriate growth',
-            'Well-formed fruit clusters with uniform berry development',
-            'Consistent annual growth and fruit production'
-        ],
-        'treatment': {
-            'organic': [
-                'Balanced organic fertilizer applications based on soil tests',
-                'Compost applications to improve soil health',
-                'Seaweed extract foliar sprays for micronutrients',
-                'Beneficial insect releases for pest management'
-            ],
-            'chemical': [
-                'Balanced NPK fertilizer applications based on soil tests',
-                'Preventative fungicide program during critical periods',
-                'Micronutrient supplements as indicated by tissue tests',
-                'Growth regulators when needed for cluster development'
-            ]
-        },
-        'prevention': [
-            'Regular pruning to maintain open canopy and air circulation',
-            'Shoot thinning and positioning for optimal sun exposure',
-            'Leaf removal around fruit clusters when appropriate',
-            'Cover crops for soil health and beneficial insect habitat',
-            'Regular monitoring for early pest and disease detection'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Drip irrigation for efficient water delivery',
-                'Regulated deficit irrigation during specific growth stages',
-                'Soil moisture monitoring to optimize irrigation timing',
-                'Adjust watering based on growth stage and weather conditions'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '70-85°F (21-29°C) optimal for growth',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun (6-8 hours daily) for best fruit development'
-        },
-        'crop_impact': {
-            'yield_potential': '3-5 tons per acre for wine grapes; 5-10 tons for table grapes',
-            'quality_characteristics': 'Proper sugar/acid balance, varietal flavor development, uniform ripening',
-            'economic_value': 'Maximum marketability and wine quality potential'
-        }
-    },
-    
-    'Orange___Haunglongbing_(Citrus_greening)': {
-        'name': 'Citrus Greening (Huanglongbing)',
-        'scientific_name': 'Candidatus Liberibacter asiaticus',
-        'description': 'A devastating bacterial disease spread by the Asian citrus psyllid that affects all citrus varieties. It causes mottled leaves, misshapen and bitter fruit, and eventual tree decline and death.',
-        'symptoms': [
-            'Asymmetrical blotchy mottling of leaves',
-            'Yellow shoots in an otherwise green canopy',
-            'Misshapen, small fruit with uneven coloration',
-            'Bitter, inedible fruit with aborted seeds',
-            'Premature fruit drop and overall tree decline'
-        ],
-        'treatment': {
-            'organic': [
-                'No effective organic treatments for the bacteria',
-                'Psyllid management through organic insecticides like neem oil',
-                'Beneficial insect releases for psyllid control',
-                'Enhanced nutrition programs to extend productive tree life'
-            ],
-            'chemical': [
-                'No curative treatments available',
-                'Systemic insecticides for psyllid control',
-                'Foliar insecticides for adult psyllid management',
-                'Enhanced micronutrient applications to maintain tree health'
-            ]
-        },
-        'prevention': [
-            'Plant certified disease-free trees from reputable nurseries',
-            'Regular monitoring and control of Asian citrus psyllid',
-            'Remove and destroy infected trees to prevent spread',
-            'Coordinate area-wide psyllid management programs',
-            'Avoid moving plant material from infected areas'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week depending on climate',
-            'recommendations': [
-                'Maintain consistent soil moisture to reduce tree stress',
-                'Avoid drought stress which can worsen symptoms',
-                'Use efficient irrigation systems like micro-sprinklers',
-                'Adjust irrigation based on tree health and weather conditions'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': 'Disease progression faster in warm temperatures (75-85°F/24-29°C)',
-            'humidity': 'Psyllid populations higher in humid conditions',
-            'conditions': 'Year-round pressure in tropical/subtropical climates'
-        },
-        'crop_impact': {
-            'yield_reduction': '30-100% depending on infection stage',
-            'quality_impact': 'Fruit becomes unmarketable due to poor size, appearance, and taste',
-            'economic_threshold': 'Zero tolerance - management required at first detection'
-        }
-    },
-    
-    'Peach___Bacterial_spot': {
-        'name': 'Peach Bacterial Spot',
-        'scientific_name': 'Xanthomonas arboricola pv. pruni',
-        'description': 'A bacterial disease affecting peach trees that causes spots on leaves, fruit, and twigs. Severe infections can cause defoliation, reduced fruit quality, and increased susceptibility to other stresses.',
-        'symptoms': [
-            'Small, water-soaked lesions on leaves that become angular and purple-brown',
-            'Shot-hole appearance as leaf lesions fall out',
-            'Circular, sunken lesions on fruit that may crack',
-            'Sunken, dark cankers on twigs and branches',
-            'Premature leaf drop in severe cases'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based bactericides applied preventatively',
-                'Reduce application rates during active growth to prevent phytotoxicity',
-                'Bacillus subtilis biological treatments',
-                'Hydrogen dioxide products for surface sterilization'
-            ],
-            'chemical': [
-                'Copper-based bactericides applied at leaf fall and during dormancy',
-                'Oxytetracycline applications during growing season',
-                'Copper-mancozeb combinations for better efficacy',
-                'Chemical thinning to reduce fruit-to-fruit contact'
-            ]
-        },
-        'prevention': [
-            'Plant resistant varieties like Redhaven, Sunhigh, or Candor',
-            'Prune during dry weather to promote air circulation',
-            'Remove and destroy infected twigs during dormant season',
-            'Avoid overhead irrigation which promotes bacterial spread',
-            'Maintain balanced nutrition, avoiding excess nitrogen'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water at the base of trees in the morning',
-                'Ensure good soil drainage',
-                'Avoid irrigation during high humidity periods'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '75-85°F (24-29°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection',
-            'conditions': 'Rainfall, overhead irrigation, and wind-driven rain increase spread'
-        },
-        'crop_impact': {
-            'yield_reduction': '10-30% in severe cases',
-            'quality_impact': 'Reduced marketability due to fruit blemishes',
-            'economic_threshold': 'Treatment warranted when disease appears on 5% of fruit or foliage'
-        }
-    },
-    
-    'Peach___healthy': {
-        'name': 'Healthy Peach',
-        'scientific_name': 'Prunus persica',
-        'description': 'Healthy peach trees display vibrant green leaves, strong branches, and produce firm, well-colored fruit. Proper maintenance ensures tree health, productivity, and fruit quality.',
-        'symptoms': [
-            'Vibrant green leaves without spots or discoloration',
-            'Uniform leaf size and shape',
-            'Firm, well-developed fruit with appropriate blush',
-            'Strong, flexible branches with smooth bark',
-            'Consistent annual growth and flowering'
-        ],
-        'treatment': {
-            'organic': [
-                'Balanced organic fertilizer applications in spring',
-                'Compost applications to improve soil health',
-                'Seaweed extract foliar sprays for micronutrients',
-                'Beneficial insect releases for pest management'
-            ],
-            'chemical': [
-                'Balanced NPK fertilizer applications based on soil tests',
-                'Preventative fungicide program during critical periods',
-                'Dormant oil sprays during winter',
-                'Growth regulators when needed for fruit thinning'
-            ]
-        },
-        'prevention': [
-            'Regular pruning to maintain open center and air circulation',
-            'Annual dormant pruning to remove dead wood and shape tree',
-            'Proper fruit thinning to improve size and quality',
-            'Mulching to retain moisture and suppress weeds',
-            'Regular monitoring for early pest and disease detection'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Deep watering to encourage deep root development',
-                'Drip irrigation to deliver water efficiently',
-                'Morning watering to reduce evaporation',
-                'Adjust watering based on fruit development stage'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '65-80°F (18-27°C) optimal for growth',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun (6-8 hours daily) for best fruit development'
-        },
-        'crop_impact': {
-            'yield_potential': '100-150 pounds per mature tree annually',
-            'quality_characteristics': 'Firm, well-colored fruit with good sugar/acid balance',
-            'economic_value': 'Maximum marketability and storage potential'
-        }
-    },
-        'Pepper,_bell___Bacterial_spot': {
-        'name': 'Pepper Bacterial Spot',
-        'scientific_name': 'Xanthomonas campestris pv. vesicatoria',
-        'description': 'A bacterial disease affecting bell peppers that causes spots on leaves, stems, and fruit. Severe infections can lead to defoliation, sunscald of fruit, and significant yield losses.',
-        'symptoms': [
-            'Small, water-soaked lesions on leaves that become brown with yellow halos',
-            'Raised, scabby spots on fruit that start as small blisters',
-            'Defoliation in severe cases exposing fruit to sunscald',
-            'Dark, elongated lesions on stems and petioles',
-            'Premature fruit drop in severe infections'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based bactericides applied preventatively',
-                'Bacillus subtilis biological treatments',
-                'Hydrogen dioxide products for surface sterilization',
-                'Crop rotation with non-solanaceous crops for 2-3 years'
-            ],
-            'chemical': [
-                'Copper-based bactericides applied at 7-10 day intervals',
-                'Copper-mancozeb combinations for better efficacy',
-                'Acibenzolar-S-methyl (Actigard) as a plant activator',
-                'Streptomycin applications in seedling production (where legal)'
-            ]
-        },
-        'prevention': [
-            'Plant certified disease-free seeds and transplants',
-            'Use resistant varieties when available',
-            'Avoid overhead irrigation which promotes bacterial spread',
-            'Practice crop rotation with non-solanaceous crops',
-            'Remove and destroy infected plant debris after harvest'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water at the base of plants in the morning',
-                'Ensure good soil drainage',
-                'Avoid working with plants when foliage is wet'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '75-86°F (24-30°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection',
-            'conditions': 'Rainfall, overhead irrigation, and wind-driven rain increase spread'
-        },
-        'crop_impact': {
-            'yield_reduction': '10-50% in severe cases',
-            'quality_impact': 'Reduced marketability due to fruit blemishes',
-            'economic_threshold': 'Treatment warranted when disease appears on 5% of plants'
-        }
-    },
-    
-    'Pepper,_bell___healthy': {
-        'name': 'Healthy Bell Pepper',
-        'scientific_name': 'Capsicum annuum',
-        'description': 'Healthy bell pepper plants display dark green leaves, strong stems, and produce firm, well-colored fruit. Proper maintenance ensures plant vigor, productivity, and fruit quality.',
-        'symptoms': [
-            'Dark green leaves without spots or discoloration',
-            'Uniform leaf size and shape',
-            'Strong, upright stems supporting the plant structure',
-            'Firm, glossy fruit with thick walls',
-            'Consistent flowering and fruit set'
-        ],
-        'treatment': {
-            'organic': [
-                'Balanced organic fertilizer applications based on soil tests',
-                'Compost tea applications to boost soil biology',
-                'Seaweed extract foliar sprays for micronutrients',
-                'Beneficial insect releases for pest management'
-            ],
-            'chemical': [
-                'Balanced NPK fertilizer applications based on soil tests',
-                'Calcium supplements to prevent blossom end rot',
-                'Preventative fungicide program during high-risk periods',
-                'Foliar micronutrient sprays as needed'
-            ]
-        },
-        'prevention': [
-            'Proper plant spacing (18-24 inches) for air circulation',
-            'Mulching to retain moisture and suppress weeds',
-            'Support structures for heavy-fruiting varieties',
-            'Regular monitoring for early pest and disease detection',
-            'Crop rotation with non-solanaceous crops'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Consistent soil moisture to prevent blossom end rot',
-                'Drip irrigation to deliver water efficiently',
-                'Morning watering to reduce evaporation',
-                'Avoid overhead irrigation which can promote disease'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '70-85°F (21-29°C) optimal for growth',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun (6-8 hours daily) for best fruit development'
-        },
-        'crop_impact': {
-            'yield_potential': '5-10 pounds per plant in optimal conditions',
-            'quality_characteristics': 'Firm, thick-walled fruit with vibrant color',
-            'economic_value': 'Maximum marketability and shelf life'
-        }
-    },
-    
-    'Potato___Early_blight': {
-        'name': 'Potato Early Blight',
-        'scientific_name': 'Alternaria solani',
-        'description': 'A fungal disease affecting potato plants that causes dark, target-like spots on leaves. Severe infections can lead to defoliation, reduced tuber size, and yield losses.',
-        'symptoms': [
-            'Dark brown to black target-like spots with concentric rings on leaves',
-            'Yellowing of leaf tissue surrounding lesions',
-            'Lesions that coalesce causing leaf death',
-            'Lower leaves affected first with upward progression',
-            'Shallow, dark lesions on tubers in severe cases'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based fungicides applied preventatively',
-                'Sulfur applications at 7-10 day intervals',
-                'Bacillus subtilis biological fungicide treatments',
-                'Potassium bicarbonate sprays for light infections'
-            ],
-            'chemical': [
-                'Chlorothalonil applications at 7-10 day intervals',
-                'Azoxystrobin treatments for active infections',
-                'Boscalid + pyraclostrobin combination products',
-                'Mancozeb applications during high-risk periods'
-            ]
-        },
-        'prevention': [
-            'Plant certified disease-free seed potatoes',
-            'Practice crop rotation with non-solanaceous crops for 2-3 years',
-            'Maintain adequate plant spacing for air circulation',
-            'Hill soil around plants to protect tubers',
-            'Remove and destroy infected plant debris after harvest'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water deeply but infrequently to promote root development',
-                'Avoid overhead irrigation which promotes fungal spread',
-                'Water in the morning so foliage dries quickly'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '75-85°F (24-29°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection',
-            'conditions': 'Alternating wet and dry periods favor disease development'
-        },
-        'crop_impact': {
-            'yield_reduction': '20-30% in severe cases',
-            'quality_impact': 'Reduced tuber size and storage quality',
-            'economic_threshold': 'Treatment warranted when disease appears on 5% of foliage'
-        }
-    },
-    
-    'Potato___Late_blight': {
-        'name': 'Potato Late Blight',
-        'scientific_name': 'Phytophthora infestans',
-        'description': 'A devastating oomycete disease affecting potato plants that causes water-soaked lesions on leaves and stems, and tuber rot. This is the disease responsible for the Irish Potato Famine and requires aggressive management.',
-        'symptoms': [
-            'Pale green to brown water-soaked lesions on leaves, often at leaf tips or margins',
-            'White, fuzzy growth on the undersides of leaves in humid conditions',
-            'Dark brown to purplish-black lesions on stems',
-            'Rapid collapse of foliage in humid conditions',
-            'Reddish-brown, granular rot in tubers that may appear externally as purple-brown areas'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based fungicides applied preventatively before disease onset',
-                'More frequent applications (5-7 days) during high-risk periods',
-                'Bacillus subtilis biological treatments as preventatives',
-                'Immediate removal and destruction of infected plants'
-            ],
-            'chemical': [
-                'Chlorothalonil applications preventatively',
-                'Mefenoxam + chlorothalonil combinations for systemic protection',
-                'Cymoxanil + famoxadone for curative and protective action',
-                'Propamocarb + fluopicolide for systemic and translaminar activity'
-            ]
-        },
-        'prevention': [
-            'Plant certified disease-free seed potatoes',
-            'Use resistant varieties when available',
-            'Practice crop rotation with non-solanaceous crops for 3-4 years',
-            'Monitor and destroy volunteer potatoes and solanaceous weeds',
-            'Plant in well-drained soil with good air circulation'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Avoid overhead irrigation which promotes disease spread',
-                'Water in the morning so foliage dries quickly',
-                'Ensure good field drainage to prevent standing water'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '60-70°F (15-21°C) optimal for disease development',
-            'humidity': 'High humidity (>90%) essential for infection',
-            'conditions': 'Cool, wet weather with morning fog or dew promotes epidemics'
-        },
-        'crop_impact': {
-            'yield_reduction': '40-100% in severe cases',
-            'quality_impact': 'Tuber rot can continue in storage',
-            'economic_threshold': 'Zero tolerance - preventative treatment required when conditions favor disease'
-        }
-    },
-        'Potato___healthy': {
-        'name': 'Healthy Potato',
-        'scientific_name': 'Solanum tuberosum',
-        'description': 'Healthy potato plants display dark green leaves, strong stems, and produce well-formed tubers. Proper maintenance ensures plant vigor, optimal yield, and high-quality tubers.',
-        'symptoms': [
-            'Dark green leaves without spots or discoloration',
-            'Uniform leaf size and shape',
-            'Strong, upright stems supporting the plant structure',
-            'Consistent flowering and tuber development',
-            'Well-formed, smooth-skinned tubers at harvest'
-        ],
-        'treatment': {
-            'organic': [
-                'Balanced organic fertilizer applications based on soil tests',
-                'Compost incorporation before planting',
-                'Seaweed extract foliar sprays for micronutrients',
-                'Beneficial insect releases for pest management'
-            ],
-            'chemical': [
-                'Balanced NPK fertilizer applications based on soil tests',
-                'Split nitrogen applications for optimal utilization',
-                'Preventative fungicide program during high-risk periods',
-                'Micronutrient supplements as indicated by tissue tests'
-            ]
-        },
-        'prevention': [
-            'Plant certified disease-free seed potatoes',
-            'Practice crop rotation with non-solanaceous crops',
-            'Proper plant spacing (10-12 inches) for air circulation',
-            'Hill soil around plants to protect developing tubers',
-            'Regular monitoring for early pest and disease detection'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Consistent soil moisture during tuber formation',
-                'Reduce irrigation as plants mature to allow proper skin set',
-                'Drip irrigation to deliver water efficiently',
-                'Avoid overhead irrigation which can promote disease'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '60-70°F (15-21°C) optimal for tuber development',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun (6-8 hours daily) for best growth'
-        },
-        'crop_impact': {
-            'yield_potential': '300-500 cwt per acre in commercial production',
-            'quality_characteristics': 'Uniform size, smooth skin, proper specific gravity',
-            'economic_value': 'Maximum marketability and storage potential'
-        }
-    },
-    
-    'Raspberry___healthy': {
-        'name': 'Healthy Raspberry',
-        'scientific_name': 'Rubus idaeus',
-        'description': 'Healthy raspberry plants display vibrant green leaves, strong canes, and produce plump, well-colored berries. Proper maintenance ensures plant vigor, productivity, and fruit quality.',
-        'symptoms': [
-            'Vibrant green leaves without spots or discoloration',
-            'Strong, upright primocanes and floricanes',
-            'Uniform leaf size and shape',
-            'Plump, well-colored berries that separate easily from the receptacle',
-            'Consistent annual growth of new canes'
-        ],
-        'treatment': {
-            'organic': [
-                'Balanced organic fertilizer applications in spring',
-                'Compost applications to improve soil health',
-                'Seaweed extract foliar sprays for micronutrients',
-                'Beneficial insect releases for pest management'
-            ],
-            'chemical': [
-                'Balanced NPK fertilizer applications based on soil tests',
-                'Preventative fungicide program during wet periods',
-                'Dormant oil sprays during winter',
-                'Micronutrient supplements as indicated by tissue tests'
-            ]
-        },
-        'prevention': [
-            'Proper pruning to remove spent floricanes after fruiting',
-            'Thinning of primocanes to 4-5 strong canes per foot of row',
-            'Trellising to improve air circulation and light penetration',
-            'Mulching to retain moisture and suppress weeds',
-            'Regular monitoring for early pest and disease detection'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Drip irrigation to deliver water efficiently',
-                'Consistent soil moisture during fruit development',
-                'Avoid overhead irrigation which can promote disease',
-                'Mulching to conserve soil moisture'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '60-75°F (15-24°C) optimal for growth',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun to partial shade, with protection from harsh afternoon sun in hot climates'
-        },
-        'crop_impact': {
-            'yield_potential': '5-10 pounds per plant for summer-bearing; 1-2 pounds for fall-bearing',
-            'quality_characteristics': 'Firm, well-colored berries with good flavor balance',
-            'economic_value': 'Maximum marketability and shelf life'
-        }
-    },
-    
-    'Soybean___healthy': {
-        'name': 'Healthy Soybean',
-        'scientific_name': 'Glycine max',
-        'description': 'Healthy soybean plants display vibrant green leaves, strong stems, and produce well-filled pods. Proper maintenance ensures plant vigor, optimal yield, and high-quality beans.',
-        'symptoms': [
-            'Vibrant green trifoliate leaves without spots or discoloration',
-            'Strong, upright stems with appropriate branching',
-            'Uniform leaf size and shape',
-            'Well-formed pods with 2-3 beans per pod',
-            'Consistent nodulation on roots for nitrogen fixation'
-        ],
-        'treatment': {
-            'organic': [
-                'Proper inoculation with Bradyrhizobium japonicum at planting',
-                'Balanced organic fertilizer applications based on soil tests',
-                'Compost incorporation before planting',
-                'Beneficial insect releases for pest management'
-            ],
-            'chemical': [
-                'Seed treatment with appropriate inoculant',
-                'Balanced fertilizer applications based on soil tests',
-                'Preventative fungicide program during high-risk periods',
-                'Foliar micronutrient sprays as needed'
-            ]
-        },
-        'prevention': [
-            'Crop rotation with non-legume crops',
-            'Proper plant spacing for air circulation',
-            'Planting at optimal soil temperatures (55-60°F)',
-            'Seed treatment with fungicides and inoculants',
-            'Regular monitoring for early pest and disease detection'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Critical water needs during flowering and pod fill',
-                'Drip or furrow irrigation to deliver water efficiently',
-                'Avoid overhead irrigation which can promote disease',
-                'Ensure good field drainage to prevent waterlogging'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '70-85°F (21-29°C) optimal for growth',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun (6-8 hours daily) for best growth'
-        },
-        'crop_impact': {
-            'yield_potential': '40-80 bushels per acre in optimal conditions',
-            'quality_characteristics': 'Uniform seed size, appropriate protein and oil content',
-            'economic_value': 'Maximum marketability and processing quality'
-        }
-    },
-    
-    'Squash___Powdery_mildew': {
-        'name': 'Squash Powdery Mildew',
-        'scientific_name': 'Podosphaera xanthii (formerly Sphaerotheca fuliginea) and Erysiphe cichoracearum',
-        'description': 'A fungal disease affecting squash and other cucurbits that appears as a white powdery coating on leaves and stems. Severe infections can reduce photosynthesis, stunt growth, and decrease fruit quality and yield.',
-        'symptoms': [
-            'White powdery coating on leaves, stems, and sometimes fruit',
-            'Initial symptoms appear as small white spots that expand to cover leaf surfaces',
-            'Yellowing and premature death of affected leaves',
-            'Stunted plant growth in severe cases',
-            'Reduced fruit size and quality'
-        ],
-        'treatment': {
-            'organic': [
-                'Sulfur applications at 7-10 day intervals',
-                'Potassium bicarbonate sprays for active infections',
-                'Neem oil treatments every 7-14 days',
-                'Milk spray (1:9 milk to water ratio) as a preventative'
-            ],
-            'chemical': [
-                'Myclobutanil applications at first sign of disease',
-                'Trifloxystrobin sprays at 7-14 day intervals',
-                'Chlorothalonil treatments as a preventative',
-                'Azoxystrobin applications for severe infections'
-            ]
-        },
-        'prevention': [
-            'Plant resistant varieties when available',
-            'Proper plant spacing for air circulation',
-            'Avoid overhead irrigation which increases humidity',
-            'Remove and destroy infected plant parts',
-            'Crop rotation with non-cucurbit crops'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water at the base of plants in the morning',
-                'Ensure good soil drainage',
-                'Avoid overwatering which can increase humidity around plants'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '68-80°F (20-27°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection, but free water inhibits spore germination',
-            'conditions': 'Shade and poor air circulation increase disease severity'
-        },
-        'crop_impact': {
-            'yield_reduction': '20-30% in severe cases',
-            'quality_impact': 'Reduced fruit size and shortened harvest period',
-            'economic_threshold': 'Treatment warranted when disease appears on 5% of foliage'
-        }
-    },
-        'Strawberry___Leaf_scorch': {
-        'name': 'Strawberry Leaf Scorch',
-        'scientific_name': 'Diplocarpon earlianum',
-        'description': 'A fungal disease affecting strawberry plants that causes purple to red spots on leaves, which eventually develop necrotic centers. Severe infections can lead to leaf death, reduced plant vigor, and decreased fruit yield and quality.',
-        'symptoms': [
-            'Small, purple to red spots on upper leaf surfaces',
-            'Spots that develop tan to gray centers as they enlarge',
-            'Irregular, dark purple borders around lesions',
-            'Leaves that appear scorched as lesions coalesce',
-            'Premature leaf death in severe cases'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based fungicides applied preventatively',
-                'Sulfur applications at 7-10 day intervals',
-                'Potassium bicarbonate sprays for light infections',
-                'Bacillus subtilis biological fungicide treatments'
-            ],
-            'chemical': [
-                'Captan applications at 7-14 day intervals',
-                'Myclobutanil treatments during active growth',
-                'Azoxystrobin sprays for established infections',
-                'Thiophanate-methyl applications during the growing season'
-            ]
-        },
-        'prevention': [
-            'Plant resistant varieties when available',
-            'Use disease-free transplants',
-            'Practice crop rotation with non-strawberry crops for 2-3 years',
-            'Remove and destroy infected leaves during the growing season',
-            'Renovate beds immediately after harvest'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water at the base of plants in the morning',
-                'Ensure good soil drainage',
-                'Avoid overhead irrigation which promotes fungal spread'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '68-86°F (20-30°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection',
-            'conditions': 'Prolonged leaf wetness (6+ hours) significantly increases infection risk'
-        },
-        'crop_impact': {
-            'yield_reduction': '20-30% in severe cases',
-            'quality_impact': 'Reduced fruit size and sugar content',
-            'economic_threshold': 'Treatment warranted when disease appears on 5% of foliage'
-        }
-    },
-    
-    'Strawberry___healthy': {
-        'name': 'Healthy Strawberry',
-        'scientific_name': 'Fragaria × ananassa',
-        'description': 'Healthy strawberry plants display vibrant green leaves, strong crowns, and produce firm, well-colored berries. Proper maintenance ensures plant vigor, productivity, and fruit quality.',
-        'symptoms': [
-            'Vibrant green trifoliate leaves without spots or discoloration',
-            'Strong, compact crown with multiple crowns developing in mature plants',
-            'Uniform leaf size and shape',
-            'Firm, well-colored berries with seeds (achenes) evenly distributed',
-            'Vigorous runners in appropriate quantities for the variety'
-        ],
-        'treatment': {
-            'organic': [
-                'Balanced organic fertilizer applications based on soil tests',
-                'Compost applications to improve soil health',
-                'Seaweed extract foliar sprays for micronutrients',
-                'Beneficial insect releases for pest management'
-            ],
-            'chemical': [
-                'Balanced NPK fertilizer applications based on soil tests',
-                'Preventative fungicide program during wet periods',
-                'Calcium supplements to improve fruit firmness',
-                'Micronutrient supplements as indicated by tissue tests'
-            ]
-        },
-        'prevention': [
-            'Plant certified disease-free transplants',
-            'Proper plant spacing (12-18 inches) for air circulation',
-            'Mulching with straw or plastic to keep fruit clean and reduce disease',
-            'Renovation of beds after harvest',
-            'Regular monitoring for early pest and disease detection'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Drip irrigation to deliver water efficiently',
-                'Consistent soil moisture during fruit development',
-                'Avoid overhead irrigation which can promote disease',
-                'Mulching to conserve soil moisture'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '60-75°F (15-24°C) optimal for growth',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun (6-8 hours daily) for best fruit development'
-        },
-        'crop_impact': {
-            'yield_potential': '1-2 pounds per plant in first fruiting year',
-            'quality_characteristics': 'Firm, sweet berries with good size and color',
-            'economic_value': 'Maximum marketability and shelf life'
-        }
-    },
-    
-    'Tomato___Bacterial_spot': {
-        'name': 'Tomato Bacterial Spot',
-        'scientific_name': 'Xanthomonas campestris pv. vesicatoria',
-        'description': 'A bacterial disease affecting tomato plants that causes spots on leaves, stems, and fruit. Severe infections can lead to defoliation, sunscald of fruit, and significant yield losses.',
-        'symptoms': [
-            'Small, water-soaked spots on leaves that become brown with yellow halos',
-            'Spots with a greasy appearance on fruit that become scabby',
-            'Defoliation in severe cases exposing fruit to sunscald',
-            'Dark, elongated lesions on stems and petioles',
-            'Spots that may tear or fall out, giving leaves a tattered appearance'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based bactericides applied preventatively',
-                'Bacillus subtilis biological treatments',
-                'Hydrogen dioxide products for surface sterilization',
-                'Crop rotation with non-solanaceous crops for 2-3 years'
-            ],
-            'chemical': [
-                'Copper-based bactericides applied at 7-10 day intervals',
-                'Copper-mancozeb combinations for better efficacy',
-                'Acibenzolar-S-methyl (Actigard) as a plant activator',
-                'Streptomycin applications in seedling production (where legal)'
-            ]
-        },
-        'prevention': [
-            'Plant certified disease-free seeds and transplants',
-            'Use resistant varieties when available',
-            'Avoid overhead irrigation which promotes bacterial spread',
-            'Practice crop rotation with non-solanaceous crops',
-            'Remove and destroy infected plant debris after harvest'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water at the base of plants in the morning',
-                'Ensure good soil drainage',
-                'Avoid working with plants when foliage is wet'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '75-86°F (24-30°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection',
-            'conditions': 'Rainfall, overhead irrigation, and wind-driven rain increase spread'
-        },
-        'crop_impact': {
-            'yield_reduction': '10-50% in severe cases',
-            'quality_impact': 'Reduced marketability due to fruit blemishes',
-            'economic_threshold': 'Treatment warranted when disease appears on 5% of plants'
-        }
-    },
-    
-    'Tomato___Early_blight': {
-        'name': 'Tomato Early Blight',
-        'scientific_name': 'Alternaria solani',
-        'description': 'A fungal disease affecting tomato plants that causes dark, target-like spots on leaves. Severe infections can lead to defoliation, reduced fruit size, and yield losses.',
-        'symptoms': [
-            'Dark brown to black target-like spots with concentric rings on leaves',
-            'Yellowing of leaf tissue surrounding lesions',
-            'Lesions that coalesce causing leaf death',
-            'Lower leaves affected first with upward progression',
-            'Dark, sunken lesions with concentric rings on fruit, usually at the stem end'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based fungicides applied preventatively',
-                'Sulfur applications at 7-10 day intervals',
-                'Bacillus subtilis biological fungicide treatments',
-                'Potassium bicarbonate sprays for light infections'
-            ],
-            'chemical': [
-                'Chlorothalonil applications at 7-10 day intervals',
-                'Azoxystrobin treatments for active infections',
-                'Boscalid + pyraclostrobin combination products',
-                'Mancozeb applications during high-risk periods'
-            ]
-        },
-        'prevention': [
-            'Plant resistant varieties when available',
-            'Practice crop rotation with non-solanaceous crops for 2-3 years',
-            'Maintain adequate plant spacing for air circulation',
-            'Stake or cage plants to keep foliage off the ground',
-            'Remove and destroy infected plant debris after harvest'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water deeply but infrequently to promote root development',
-                'Avoid overhead irrigation which promotes fungal spread',
-                'Water in the morning so foliage dries quickly'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '75-85°F (24-29°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection',
-            'conditions': 'Alternating wet and dry periods favor disease development'
-        },
-        'crop_impact': {
-            'yield_reduction': '20-30% in severe cases',
-            'quality_impact': 'Reduced fruit size and marketability',
-            'economic_threshold': 'Treatment warranted when disease appears on 5% of foliage'
-        }
-    },
-        'Tomato___Late_blight': {
-        'name': 'Tomato Late Blight',
-        'scientific_name': 'Phytophthora infestans',
-        'description': 'A devastating oomycete disease affecting tomato plants that causes water-soaked lesions on leaves and stems, and fruit rot. This is the same pathogen that caused the Irish Potato Famine and requires aggressive management.',
-        'symptoms': [
-            'Pale green to brown water-soaked lesions on leaves, often at leaf tips or margins',
-            'White, fuzzy growth on the undersides of leaves in humid conditions',
-            'Dark brown to black lesions on stems',
-            'Rapid collapse of foliage in humid conditions',
-            'Firm, brown, greasy-looking lesions on fruit that may cover large areas'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based fungicides applied preventatively before disease onset',
-                'More frequent applications (5-7 days) during high-risk periods',
-                'Bacillus subtilis biological treatments as preventatives',
-                'Immediate removal and destruction of infected plants'
-            ],
-            'chemical': [
-                'Chlorothalonil applications preventatively',
-                'Mefenoxam + chlorothalonil combinations for systemic protection',
-                'Cymoxanil + famoxadone for curative and protective action',
-                'Propamocarb + fluopicolide for systemic and translaminar activity'
-            ]
-        },
-        'prevention': [
-            'Plant resistant varieties when available',
-            'Practice crop rotation with non-solanaceous crops for 3-4 years',
-            'Maintain adequate plant spacing for air circulation',
-            'Stake or cage plants to keep foliage off the ground',
-            'Monitor and destroy volunteer tomatoes and solanaceous weeds'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Avoid overhead irrigation which promotes disease spread',
-                'Water in the morning so foliage dries quickly',
-                'Ensure good field drainage to prevent standing water'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '60-70°F (15-21°C) optimal for disease development',
-            'humidity': 'High humidity (>90%) essential for infection',
-            'conditions': 'Cool, wet weather with morning fog or dew promotes epidemics'
-        },
-        'crop_impact': {
-            'yield_reduction': '40-100% in severe cases',
-            'quality_impact': 'Fruit rot renders produce unmarketable',
-            'economic_threshold': 'Zero tolerance - preventative treatment required when conditions favor disease'
-        }
-    },
-    
-    'Tomato___Leaf_Mold': {
-        'name': 'Tomato Leaf Mold',
-        'scientific_name': 'Passalora fulva (formerly Fulvia fulva or Cladosporium fulvum)',
-        'description': 'A fungal disease primarily affecting greenhouse tomatoes that causes yellow spots on the upper leaf surface and olive-green to grayish-brown mold on the lower surface. Severe infections can lead to defoliation and reduced yield.',
-        'symptoms': [
-            'Pale green or yellow spots on upper leaf surfaces',
-            'Olive-green to grayish-brown velvety mold on lower leaf surfaces',
-            'Leaves that curl, wither, and drop prematurely',
-            'Occasionally affects stems, blossoms, and fruit',
-            'Upward progression of symptoms from lower to upper leaves'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based fungicides applied preventatively',
-                'Sulfur applications at 7-10 day intervals',
-                'Potassium bicarbonate sprays for light infections',
-                'Bacillus subtilis biological fungicide treatments'
-            ],
-            'chemical': [
-                'Chlorothalonil applications at 7-14 day intervals',
-                'Mancozeb treatments during early disease development',
-                'Difenoconazole + cyprodinil for established infections',
-                'Azoxystrobin applications for protective and curative action'
-            ]
-        },
-        'prevention': [
-            'Plant resistant varieties when available',
-            'Maintain adequate plant spacing for air circulation',
-            'Improve greenhouse ventilation to reduce humidity',
-            'Remove and destroy infected leaves during the growing season',
-            'Practice crop rotation in greenhouse settings'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water at the base of plants in the morning',
-                'Avoid overhead irrigation which promotes fungal spread',
-                'Reduce humidity in greenhouse environments with proper ventilation'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '70-75°F (21-24°C) optimal for disease development',
-            'humidity': 'High humidity (>85%) essential for infection',
-            'conditions': 'Common in greenhouse environments with poor air circulation'
-        },
-        'crop_impact': {
-            'yield_reduction': '10-30% in severe cases',
-            'quality_impact': 'Reduced fruit size due to decreased photosynthesis',
-            'economic_threshold': 'Treatment warranted when disease appears on 5% of foliage'
-        }
-    },
-    
-    'Tomato___Septoria_leaf_spot': {
-        'name': 'Septoria Leaf Spot',
-        'scientific_name': 'Septoria lycopersici',
-        'description': 'A fungal disease affecting tomato plants that causes small, circular spots with dark borders and light centers on leaves. Severe infections can lead to significant defoliation and reduced yield.',
-        'symptoms': [
-            'Small, circular spots (1/16 to 1/8 inch) with dark borders and light gray or tan centers',
-            'Tiny black fruiting bodies (pycnidia) visible in the center of mature spots',
-            'Lower leaves affected first with upward progression',
-            'Yellowing and dropping of severely infected leaves',
-            'Rarely affects stems, blossoms, or fruit'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based fungicides applied preventatively',
-                'Sulfur applications at 7-10 day intervals',
-                'Potassium bicarbonate sprays for light infections',
-                'Bacillus subtilis biological fungicide treatments'
-            ],
-            'chemical': [
-                'Chlorothalonil applications at 7-10 day intervals',
-                'Mancozeb treatments during early disease development',
-                'Azoxystrobin sprays for established infections',
-                'Propiconazole applications during the growing season'
-            ]
-        },
-        'prevention': [
-            'Practice crop rotation with non-solanaceous crops for 2-3 years',
-            'Remove and destroy infected plant debris after harvest',
-            'Maintain adequate plant spacing for air circulation',
-            'Stake or cage plants to keep foliage off the ground',
-            'Mulch around plants to prevent soil splash onto leaves'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water at the base of plants in the morning',
-                'Avoid overhead irrigation which promotes fungal spread',
-                'Mulch to reduce soil splash during rainfall'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '68-77°F (20-25°C) optimal for disease development',
-            'humidity': 'High humidity promotes infection',
-            'conditions': 'Rainfall, overhead irrigation, and leaf wetness for 48+ hours increases infection risk'
-        },
-        'crop_impact': {
-            'yield_reduction': '15-30% in severe cases',
-            'quality_impact': 'Reduced fruit size due to decreased photosynthesis',
-            'economic_threshold': 'Treatment warranted when disease appears on 5% of foliage'
-        }
-    },
-    
-    'Tomato___Spider_mites Two-spotted_spider_mite': {
-        'name': 'Two-spotted Spider Mite',
-        'scientific_name': 'Tetranychus urticae',
-        'description': 'A common pest affecting tomato plants that causes stippling and yellowing of leaves. Severe infestations can lead to leaf drop, reduced photosynthesis, and decreased yield. Spider mites are not a disease but an arthropod pest.',
-        'symptoms': [
-            'Fine stippling or speckling on upper leaf surfaces',
-            'Yellowing or bronzing of leaves as feeding progresses',
-            'Fine webbing on the undersides of leaves and between plant parts in heavy infestations',
-            'Tiny moving dots (mites) visible with a hand lens, particularly on leaf undersides',
-            'Premature leaf drop in severe cases'
-        ],
-        'treatment': {
-            'organic': [
-                'Insecticidal soap applications targeting leaf undersides',
-                'Neem oil treatments at 7-10 day intervals',
-                'Predatory mites (Phytoseiulus persimilis) releases',
-                'Sulfur applications (note: may harm beneficial mites)'
-            ],
-            'chemical': [
-                'Abamectin applications targeting leaf undersides',
-                'Bifenazate treatments for quick knockdown',
-                'Spiromesifen for all life stages control',
-                'Fenpyroximate applications with thorough coverage'
-            ]
-        },
-        'prevention': [
-            'Regular monitoring with a hand lens, especially during hot, dry conditions',
-            'Maintain adequate plant moisture to reduce plant stress',
-            'Avoid excessive nitrogen fertilization which promotes mite reproduction',
-            'Introduce and conserve natural predators',
-            'Avoid broad-spectrum insecticides which kill beneficial predators'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Avoid water stress which increases plant susceptibility',
-                'Occasional overhead irrigation or spraying with water can reduce populations',
-                'Maintain consistent soil moisture',
-                'Increase humidity in greenhouse environments to discourage mites'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '80-90°F (27-32°C) optimal for mite reproduction',
-            'humidity': 'Low humidity (below 50%) favors mite population growth',
-            'conditions': 'Hot, dry conditions lead to rapid population increases'
-        },
-        'crop_impact': {
-            'yield_reduction': '10-40% in severe cases',
-            'quality_impact': 'Reduced fruit size and sugar content',
-            'economic_threshold': 'Treatment warranted when 25-30% of leaves show damage or 10-15 mites per leaflet'
-        }
-    },
-    
-    'Tomato___Target_Spot': {
-        'name': 'Tomato Target Spot',
-        'scientific_name': 'Corynespora cassiicola',
-        'description': 'A fungal disease affecting tomato plants that causes circular lesions with concentric rings resembling targets on leaves, stems, and fruit. Severe infections can lead to defoliation and significant yield losses.',
-        'symptoms': [
-            'Brown to dark brown circular lesions with concentric rings on leaves',
-            'Lesions that may have yellow halos and eventually dry out and tear',
-            'Similar target-like lesions on stems and petioles',
-            'Sunken, dark brown, leathery lesions on fruit',
-            'Premature defoliation in severe cases'
-        ],
-        'treatment': {
-            'organic': [
-                'Copper-based fungicides applied preventatively',
-                'Sulfur applications at 7-10 day intervals',
-                'Bacillus subtilis biological fungicide treatments',
-                'Potassium bicarbonate sprays for light infections'
-            ],
-            'chemical': [
-                'Chlorothalonil applications at 7-10 day intervals',
-                'Azoxystrobin treatments for established infections',
-                'Fluxapyroxad + pyraclostrobin combination products',
-                'Difenoconazole + cyprodinil for protective and curative action'
-            ]
-        },
-        'prevention': [
-            'Practice crop rotation with non-solanaceous crops for 2-3 years',
-            'Maintain adequate plant spacing for air circulation',
-            'Stake or cage plants to keep foliage off the ground',
-            'Remove and destroy infected plant debris after harvest',
-            'Avoid overhead irrigation which promotes fungal spread'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Use drip irrigation to keep foliage dry',
-                'Water at the base of plants in the morning',
-                'Ensure good soil drainage',
-                'Mulch to reduce soil splash during rainfall'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '70-80°F (21-27°C) optimal for disease development',
-            'humidity': 'High humidity (>80%) promotes infection',
-            'conditions': 'Prolonged leaf wetness (16+ hours) significantly increases infection risk'
-        },
-        'crop_impact': {
-            'yield_reduction': '20-40% in severe cases',
-            'quality_impact': 'Reduced marketability due to fruit lesions',
-            'economic_threshold': 'Treatment warranted when disease appears on 5% of foliage'
-        }
-    },
-    
-    'Tomato___Tomato_Yellow_Leaf_Curl_Virus': {
-        'name': 'Tomato Yellow Leaf Curl Virus',
-        'scientific_name': 'Tomato yellow leaf curl virus (TYLCV)',
-        'description': 'A devastating viral disease transmitted by whiteflies that causes stunting, leaf curling, and significant yield losses. Once infected, plants cannot be cured, making prevention critical.',
-        'symptoms': [
-            'Upward curling and cupping of leaves',
-            'Leaves that become small and yellow, particularly at plant tops',
-            'Severe stunting of plants with a bushy appearance',
-            'Flowers that may drop before fruit set',
-            'Significantly reduced fruit production'
-        ],
-        'treatment': {
-            'organic': [
-                'No treatments cure infected plants',
-                'Insecticidal soaps for whitefly control',
-                'Neem oil applications for whitefly suppression',
-                'Yellow sticky traps to monitor and reduce whitefly populations'
-            ],
-            'chemical': [
-                'No treatments cure infected plants',
-                'Systemic insecticides like imidacloprid for whitefly control',
-                'Pyrethroids for adult whitefly management',
-                'Insect growth regulators for whitefly nymph control'
-            ]
-        },
-        'prevention': [
-            'Plant resistant varieties (look for TYLCV resistance)',
-            'Use reflective mulches to repel whiteflies',
-            'Install fine mesh screens in greenhouse production',
-            'Remove and destroy infected plants immediately',
-            'Maintain a whitefly-free period between crop cycles'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Maintain consistent soil moisture to reduce plant stress',
-                'Avoid water stress which can exacerbate symptoms',
-                'Use drip irrigation for efficient water delivery',
-                'Ensure good drainage to promote overall plant health'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': 'Virus replication and symptom expression increase at 80-90°F (27-32°C)',
-            'humidity': 'Whitefly populations higher in moderate to high humidity',
-            'conditions': 'Year-round pressure in tropical/subtropical climates'
-        },
-        'crop_impact': {
-            'yield_reduction': '50-100% in severe cases',
-            'quality_impact': 'Few or no marketable fruit produced',
-            'economic_threshold': 'Zero tolerance - prevention is critical as there is no cure'
-        }
-    },
-        'Tomato___Tomato_mosaic_virus': {
-        'name': 'Tomato Mosaic Virus',
-        'scientific_name': 'Tomato mosaic virus (ToMV) and Tobacco mosaic virus (TMV)',
-        'description': 'A viral disease affecting tomato plants that causes mottling and distortion of leaves, stunted growth, and fruit discoloration. The virus is highly stable and can persist in soil and plant debris for years.',
-        'symptoms': [
-            'Light and dark green mottling or mosaic pattern on leaves',
-            'Leaves that may be distorted, curled, or reduced in size',
-            'Stunted plant growth and reduced vigor',
-            'Yellow blotches, rings, or necrotic spots on fruit',
-            'Internal fruit browning or necrosis'
-        ],
-        'treatment': {
-            'organic': [
-                'No treatments cure infected plants',
-                'Remove and destroy infected plants immediately',
-                'Milk spray (20% milk solution) on hands and tools for disinfection',
-                'Maintain optimal growing conditions to reduce stress'
-            ],
-            'chemical': [
-                'No chemical treatments cure infected plants',
-                'Disinfect tools with 10% bleach solution or 70% alcohol',
-                'Use commercial disinfectants for greenhouse surfaces',
-                'Trisodium phosphate (TSP) for seed treatment'
-            ]
-        },
-        'prevention': [
-            'Plant certified virus-free seeds and transplants',
-            'Use resistant varieties (look for Tm-2 or Tm-22 resistance genes)',
-            'Practice strict sanitation with tools and hands when handling plants',
-            'Control perennial weeds that may harbor the virus',
-            'Avoid tobacco products when working with plants (TMV can be carried on tobacco)'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Maintain consistent soil moisture to reduce plant stress',
-                'Avoid water stress which can exacerbate symptoms',
-                'Use drip irrigation to minimize plant handling',
-                'Ensure good drainage to promote overall plant health'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': 'Symptoms most severe at 80-85°F (27-29°C)',
-            'humidity': 'Not directly affected by humidity',
-            'conditions': 'High light intensity can increase symptom severity'
-        },
-        'crop_impact': {
-            'yield_reduction': '20-70% depending on infection timing and severity',
-            'quality_impact': 'Reduced marketability due to fruit symptoms',
-            'economic_threshold': 'Zero tolerance - prevention is critical as there is no cure'
-        }
-    },
-    
-    'Tomato___healthy': {
-        'name': 'Healthy Tomato',
-        'scientific_name': 'Solanum lycopersicum',
-        'description': 'Healthy tomato plants display vibrant green leaves, strong stems, and produce firm, well-colored fruit. Proper maintenance ensures plant vigor, productivity, and fruit quality.',
-        'symptoms': [
-            'Vibrant green leaves without spots or discoloration',
-            'Strong, upright stems with appropriate branching',
-            'Uniform leaf size and shape',
-            'Consistent flowering and fruit set',
-            'Firm, well-developed fruit with appropriate color for variety'
-        ],
-        'treatment': {
-            'organic': [
-                'Balanced organic fertilizer applications based on soil tests',
-                'Compost tea applications to boost soil biology',
-                'Seaweed extract foliar sprays for micronutrients',
-                'Beneficial insect releases for pest management'
-            ],
-            'chemical': [
-                'Balanced NPK fertilizer applications based on soil tests',
-                'Calcium supplements to prevent blossom end rot',
-                'Preventative fungicide program during high-risk periods',
-                'Micronutrient supplements as indicated by tissue tests'
-            ]
-        },
-        'prevention': [
-            'Proper plant spacing (18-24 inches) for air circulation',
-            'Staking, caging, or trellising to keep plants off ground',
-            'Mulching to retain moisture and suppress weeds',
-            'Pruning to improve air circulation and light penetration',
-            'Regular monitoring for early pest and disease detection'
-        ],
-        'water_management': {
-            'requirements': 'Moderate - 1-2 inches per week during growing season',
-            'recommendations': [
-                'Consistent soil moisture to prevent blossom end rot and cracking',
-                'Drip irrigation to deliver water efficiently',
-                'Morning watering to reduce evaporation and disease risk',
-                'Avoid overhead irrigation which can promote disease'
-            ]
-        },
-        'environmental_factors': {
-            'temperature': '65-85°F (18-29°C) optimal for growth',
-            'humidity': 'Moderate humidity preferred',
-            'conditions': 'Full sun (6-8 hours daily) for best fruit development'
-        },
-        'crop_impact': {
-            'yield_potential': '10-30 pounds per plant depending on variety and growing conditions',
-            'quality_characteristics': 'Firm fruit with good flavor, color, and shelf life',
-            'economic_value': 'Maximum marketability and consumer appeal'
-        }
-    }
-}
+# Crops offered on the upload form ("Tomato___Late_blight" -> "Tomato")
+CROP_CHOICES = sorted({name.split('___')[0] for name in DISEASE_CLASSES})
 
 # Custom JSON encoder to handle undefined values
 class SafeJSONEncoder(json.JSONEncoder):
@@ -2127,13 +261,74 @@ class SafeJSONEncoder(json.JSONEncoder):
         except:
             return None
 
+# OpenCV is imported on first use to keep it off the startup path
+cv2 = None
+
+def load_cv2():
+    """Import OpenCV on first use"""
+    global cv2
+    if cv2 is None:
+        import cv2 as opencv
+        cv2 = opencv
+    return cv2
+
+# Content-hash ETags of served files, keyed by path and invalidated by mtime and size
+file_etags = collections.OrderedDict()
+file_etags_lock = threading.Lock()
+FILE_ETAG_CAPACITY = 4096
+
 # Helper functions
+def file_etag(path):
+    """Strong ETag from a file's contents, hashed once per version of the file"""
+    stat = os.stat(path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    with file_etags_lock:
+        cached = file_etags.get(path)
+        if cached is not None and cached[0] == version:
+            file_etags.move_to_end(path)
+            return cached[1]
+    
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    etag = digest.hexdigest()
+    with file_etags_lock:
+        file_etags[path] = (version, etag)
+        file_etags.move_to_end(path)
+        while len(file_etags) > FILE_ETAG_CAPACITY:
+            file_etags.popitem(last=False)
+    return etag
+
+def send_media(directory, filename, etag, max_age, mimetype=None, immutable=False):
+    """Send a stored image with its ETag, answering If-None-Match and Range requests
+    
+    With MEDIA_SENDFILE set the bytes are left to the front proxy: Flask emits X-Sendfile
+    itself, and 'x-accel' returns an X-Accel-Redirect to the internal nginx location.
+    """
+    if MEDIA_SENDFILE == 'x-accel':
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            response = Response(mimetype=mimetype or mimetypes.guess_type(filename)[0] or 'application/octet-stream')
+            relative = os.path.relpath(os.path.join(directory, filename), MEDIA_ROOT).replace(os.sep, '/')
+            response.headers['X-Accel-Redirect'] = f"{MEDIA_ACCEL_PREFIX.rstrip('/')}/{quote(relative)}"
+        response.set_etag(etag)
+    else:
+        response = send_from_directory(os.path.abspath(directory), filename, mimetype=mimetype, etag=etag,
+                                       conditional=True)
+    response.headers['Cache-Control'] = f"public, max-age={max_age}" + (', immutable' if immutable else '')
+    return response
+
 def allowed_file(filename):
     """Check if the uploaded file has an allowed extension"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
 def get_disease_info(disease_class):
     """Return information about the disease from the database"""
+    # Imported on first use to keep the large literal off the startup path
+    from disease_database import disease_database
+    
     # Return disease info if available, otherwise return generic info
     return disease_database.get(disease_class, {
         'name': disease_class.replace('___', ' - ').replace('_', ' '),
@@ -2142,47 +337,109 @@ def get_disease_info(disease_class):
         'prevention': 'Follow general crop management best practices.'
     })
 
-def visualize_prediction(img_path, output_path, result):
-    """Create a visualization of the prediction on the image."""
+def load_bgr(img):
+    """Return a BGR array for OpenCV drawing from a decoded RGB array or an image path
+    
+    Paths are decoded at no less than DISPLAY_SIZE, like uploads in process_upload, since
+    every overlay is drawn at display resolution.
+    """
+    load_cv2()
+    if isinstance(img, np.ndarray):
+        return cv2.cvtColor(img, cv2.COLOR_RGB2BGR)
+    rgb = decode_image(img, min_size=DISPLAY_SIZE, quality=DECODE_QUALITY, backend=DECODE_BACKEND)
+    return cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR)
+
+def overlay_tile_heatmap(display_img, tiles, alpha=0.45):
+    """Blend the per-tile disease scores of a tiled prediction over the display image"""
+    load_cv2()
+    w, h = tiles['analysis_size']
+    tile = tiles['tile_size']
+    scores = np.asarray(tiles['disease_scores'], dtype=np.float32)
+    
+    # Average overlapping tiles at analysis resolution, then stretch to the display image
+    heat = np.zeros((h, w), dtype=np.float32)
+    coverage = np.zeros((h, w), dtype=np.float32)
+    for i, y in enumerate(tiles['ys']):
+        for j, x in enumerate(tiles['xs']):
+            heat[y:y + tile, x:x + tile] += scores[i, j]
+            coverage[y:y + tile, x:x + tile] += 1
+    heat /= np.maximum(coverage, 1)
+    return blend_heatmap(display_img, heat, alpha)
+
+def blend_heatmap(display_img, heat, alpha=0.45):
+    """Stretch a 0-1 heatmap to the display image and blend it in with the JET colormap"""
+    load_cv2()
+    heat = cv2.resize(np.asarray(heat, dtype=np.float32), (display_img.shape[1], display_img.shape[0]),
+                      interpolation=cv2.INTER_LINEAR)
+    colored = cv2.applyColorMap(np.clip(heat * 255, 0, 255).astype(np.uint8), cv2.COLORMAP_JET)
+    return cv2.addWeighted(colored, alpha, display_img, 1 - alpha, 0)
+
+def draw_label_banner(display_img, label):
+    """Write label on a semi-transparent black band along the bottom of the image"""
+    load_cv2()
+    overlay = display_img.copy()
+    overlay_height = 60
+    h, w = display_img.shape[:2]
+    cv2.rectangle(overlay, (0, h-overlay_height), (w, h), (0, 0, 0), -1)
+    cv2.addWeighted(overlay, 0.7, display_img, 0.3, 0, display_img)
+    cv2.putText(display_img, label, (10, h - 25), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+    return display_img
+
+def draw_leaf_boxes(display_img, leaves):
+    """Draw each detected leaf's box and label, red for diseased and green for healthy"""
+    load_cv2()
+    w, h = leaves['image_size']
+    sx, sy = display_img.shape[1] / w, display_img.shape[0] / h
+    font = cv2.FONT_HERSHEY_SIMPLEX
+    for index, region in enumerate(leaves['regions'], 1):
+        x, y, bw, bh = region['box']
+        x0, y0, x1, y1 = int(x * sx), int(y * sy), int((x + bw) * sx), int((y + bh) * sy)
+        diseased = 'healthy' not in str(region['class']).lower()
+        color = (40, 40, 230) if diseased else (60, 200, 60)
+        cv2.rectangle(display_img, (x0, y0), (x1, y1), color, 2)
+        
+        name = str(region['class']).replace('___', ' - ').replace('_', ' ')
+        label = f"{index}. {name} ({float(region['confidence']) * 100:.0f}%)"
+        (tw, th), baseline = cv2.getTextSize(label, font, 0.45, 1)
+        ty = max(y0, th + baseline + 2)
+        cv2.rectangle(display_img, (x0, ty - th - baseline - 2), (x0 + tw + 4, ty), color, -1)
+        cv2.putText(display_img, label, (x0 + 2, ty - baseline - 1), font, 0.45, (255, 255, 255), 1)
+    return display_img
+
+def visualize_prediction(img, output_path, result):
+    """Create a visualization of the prediction on the image.
+    
+    img is either the decoded RGB upload array or a path to the original image.
+    """
+    load_cv2()
     try:
         # Load the original image
-        img = cv2.imread(img_path)
-        if img is None:
-            # Try with PIL if OpenCV fails
-            pil_img = Image.open(img_path)
-            img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
+        img_path = img if isinstance(img, str) else None
+        img = load_bgr(img)
         
         # Resize for display if needed
-        display_img = cv2.resize(img, (640, 480)) if img.shape[0] > 480 or img.shape[1] > 640 else img.copy()
+        display_img = cv2.resize(img, DISPLAY_SIZE) if img.shape[0] > DISPLAY_SIZE[1] or img.shape[1] > DISPLAY_SIZE[0] else img.copy()
+        
+        # Tiled predictions get a per-tile disease heatmap
+        if result.get('tiles'):
+            display_img = overlay_tile_heatmap(display_img, result['tiles'])
+        
+        # Multi-leaf predictions get a labelled box per leaf
+        if result.get('leaves'):
+            display_img = draw_leaf_boxes(display_img, result['leaves'])
         
         # Format the label
         class_name = str(result['class']).replace('___', ' - ').replace('_', ' ')
         confidence = float(result['confidence']) * 100
         label = f"{class_name} ({confidence:.1f}%)"
+        if result.get('leaves'):
+            label += f" - {result['leaves']['count']} leaves"
         
-        # Add a semi-transparent overlay at the bottom
-        overlay = display_img.copy()
-        overlay_height = 60
-        h, w = display_img.shape[:2]
-        cv2.rectangle(overlay, (0, h-overlay_height), (w, h), (0, 0, 0), -1)
-        
-        # Correct way to use addWeighted
-        alpha = 0.7
-        beta = 0.3
-        cv2.addWeighted(overlay, alpha, display_img, beta, 0, display_img)
-        
-        # Add text with prediction
-        font = cv2.FONT_HERSHEY_SIMPLEX
-        font_scale = 0.7
-        font_thickness = 2
-        text_color = (255, 255, 255)  # White text
-        
-        # Position text in the overlay
-        text_position = (10, h - 25)
-        cv2.putText(display_img, label, text_position, font, font_scale, text_color, font_thickness)
+        # Add the prediction on a semi-transparent band at the bottom
+        draw_label_banner(display_img, label)
         
         # Save the visualization
-        cv2.imwrite(output_path, display_img)
+        cv2.imwrite(output_path, display_img, [cv2.IMWRITE_JPEG_QUALITY, VIS_JPEG_QUALITY])
         return output_path
     except Exception as e:
         logger.error(f"Error in visualization: {str(e)}")
@@ -2197,6 +454,18 @@ def visualize_prediction(img_path, output_path, result):
             cv2.imwrite(output_path, blank_img)
         return output_path
 
+def render_explanation(img, explanation, output_path):
+    """Blend a Grad-CAM heatmap over the upload, the way visualize_prediction draws results"""
+    load_cv2()
+    img = load_bgr(img)
+    display_img = cv2.resize(img, DISPLAY_SIZE) if img.shape[0] > DISPLAY_SIZE[1] or img.shape[1] > DISPLAY_SIZE[0] else img.copy()
+    display_img = blend_heatmap(display_img, explanation['heatmap'])
+    
+    class_name = str(explanation['class']).replace('___', ' - ').replace('_', ' ')
+    draw_label_banner(display_img, f"Grad-CAM: {class_name} ({float(explanation['confidence']) * 100:.1f}%)")
+    cv2.imwrite(output_path, display_img, [cv2.IMWRITE_JPEG_QUALITY, VIS_JPEG_QUALITY])
+    return output_path
+
 def ensure_serializable(obj):
     """Ensure all values in a dictionary are JSON serializable."""
     if isinstance(obj, dict):
@@ -2249,33 +518,581 @@ def debug_json(obj, path=""):
             logger.error(f"Non-serializable value at {path}: {type(obj)} - {obj}")
             print(f"⚠️ Non-serializable value at {path}: {type(obj)} - {obj}")
 
-# Initialize the crop disease detector
-try:
-    from crop_detection import CropDiseaseDetector
-    
-    # Specify paths explicitly
-    model_path = os.path.join('models', 'plant_disease_model_best.keras')
-    class_indices_path = os.path.join('models', 'class_indices.json')
-    
-    # Check if files exist before attempting to load
-    if not os.path.exists(model_path):
-        logger.error(f"Model file not found: {model_path}")
-        print(f"⚠️ Model file not found: {model_path}")
-        detector = None
-    elif not os.path.exists(class_indices_path):
-        logger.error(f"Class indices file not found: {class_indices_path}")
-        print(f"⚠️ Class indices file not found: {class_indices_path}")
-        detector = None
-    else:
+# Size thread pools (and optionally pin this worker) before TensorFlow is imported; with a
+# dedicated inference server the model runs there, so web workers keep the defaults
+thread_plan = None
+if not INFERENCE_SERVER:
+    thread_plan = apply_thread_budget(plan_thread_budget(workers=INFERENCE_WORKERS,
+                                                         intra_op_threads=INFERENCE_INTRA_OP_THREADS,
+                                                         inter_op_threads=INFERENCE_INTER_OP_THREADS,
+                                                         pin=INFERENCE_PIN_CPUS))
+
+# Initialize the crop disease detector on a background thread so the server accepts
+# connections (and answers liveness probes) while TensorFlow and the model load
+detector = None
+detector_status = {
+    'state': 'loading',  # 'loading', 'ready' or 'failed'
+    'started_at': time.time(),
+    'load_seconds': None,
+    'warmup': None,
+    'error': None
+}
+
+def load_detector():
+    """Load the disease detector and publish it once it is ready to serve"""
+    global detector
+    start_time = time.time()
+    try:
+        from crop_detection import CropDiseaseDetector
+        
+        # Specify paths explicitly
+        model_path = MODEL_PATH
+        class_indices_path = os.path.join('models', 'class_indices.json')
+        
+        backend = INFERENCE_BACKEND
+        if INFERENCE_SERVER:
+            # Thin client: the inference server owns the model and batches across workers
+            model_path, backend = INFERENCE_SERVER, 'remote'
+        
+        # Check if files exist before attempting to load
+        if backend != 'remote' and not os.path.exists(model_path):
+            raise FileNotFoundError(f"Model file not found: {model_path}")
+        if not os.path.exists(class_indices_path):
+            raise FileNotFoundError(f"Class indices file not found: {class_indices_path}")
+        
         # Initialize with explicit paths
-        detector = CropDiseaseDetector(model_path, class_indices_path)
-        logger.info("Successfully loaded disease detector model")
+        loaded = CropDiseaseDetector(model_path, class_indices_path,
+                                     batching=INFERENCE_BATCHING and backend != 'remote',
+                                     max_batch_size=INFERENCE_MAX_BATCH,
+                                     max_wait_ms=INFERENCE_MAX_WAIT_MS,
+                                     inference_mode=INFERENCE_MODE,
+                                     jit_compile=INFERENCE_JIT,
+                                     backend=backend,
+                                     num_servers=INFERENCE_SERVER_PROCESSES,
+                                     num_threads=thread_plan['intra_op_threads'] if thread_plan else None,
+                                     inter_op_threads=thread_plan['inter_op_threads'] if thread_plan else None,
+                                     decode_quality=DECODE_QUALITY,
+                                     tta_threshold=TTA_CONFIDENCE_THRESHOLD if TTA_CONFIDENCE_THRESHOLD >= 0 else None,
+                                     tta_aggregate=TTA_AGGREGATE,
+                                     tta_max_views=TTA_MAX_VIEWS,
+                                     tta_max_ms=TTA_MAX_MS,
+                                     cascade_model_path=CASCADE_MODEL_PATH or None,
+                                     cascade_threshold=CASCADE_THRESHOLD,
+                                     cascade_margin=CASCADE_MARGIN,
+                                     crop_heads=CROP_HEADS,
+                                     crop_heads_path=CROP_HEADS_PATH,
+                                     embedding_cache_size=EMBEDDING_CACHE_SIZE,
+                                     warmup=MODEL_WARMUP)
+        detector = loaded
+        detector_status['warmup'] = loaded.warmup_stats
+        detector_status['load_seconds'] = time.time() - start_time
+        detector_status['state'] = 'ready'
+        logger.info(f"Successfully loaded disease detector model in {detector_status['load_seconds']:.2f}s")
         print("✅ Loaded disease detector model")
-except Exception as e:
-    error_msg = f"Could not load disease detector model: {str(e)}"
-    logger.error(error_msg)
-    print(f"⚠️ {error_msg}")
-    detector = None
+    except Exception as e:
+        error_msg = f"Could not load disease detector model: {str(e)}"
+        logger.error(error_msg)
+        print(f"⚠️ {error_msg}")
+        detector_status['error'] = str(e)
+        detector_status['load_seconds'] = time.time() - start_time
+        detector_status['state'] = 'failed'
+
+if LOAD_MODEL_IN_BACKGROUND:
+    threading.Thread(target=load_detector, name='detector-loader', daemon=True).start()
+else:
+    load_detector()
+
+def file_stamp(path):
+    """path:mtime, so replacing a file changes any cache namespace built from it"""
+    try:
+        return f"{path}:{os.path.getmtime(path)}"
+    except (OSError, TypeError):
+        return str(path)
+
+# Initialize the prediction cache; the namespace changes whenever a model file or a setting that shapes
+# the returned predictions does, so a config change never serves stale results
+model_stamp = json.dumps([
+    file_stamp(MODEL_PATH), INFERENCE_BACKEND, TOP_K_DISPLAY,
+    DECODE_QUALITY, DECODE_BACKEND,
+    TTA_CONFIDENCE_THRESHOLD, TTA_AGGREGATE, TTA_MAX_VIEWS, TTA_MAX_MS,
+    file_stamp(CASCADE_MODEL_PATH), CASCADE_THRESHOLD, CASCADE_MARGIN,
+    CROP_HEADS, file_stamp(CROP_HEADS_PATH),
+    TILED_MAX_SIDE, TILED_STRIDE, TILED_DISEASE_THRESHOLD,
+    LEAF_MAX_REGIONS, LEAF_MIN_AREA_FRACTION, LEAF_DISEASE_THRESHOLD,
+])
+prediction_cache = PredictionCache(max_entries=PREDICTION_CACHE_SIZE,
+                                   max_bytes=int(PREDICTION_CACHE_MB * 1024 * 1024),
+                                   ttl_seconds=PREDICTION_CACHE_TTL,
+                                   disk_dir=PREDICTION_CACHE_DIR,
+                                   namespace=model_stamp)
+
+quality_gate = QualityGate(mode=QUALITY_GATE,
+                           min_sharpness=QUALITY_MIN_SHARPNESS,
+                           min_brightness=QUALITY_MIN_BRIGHTNESS,
+                           max_brightness=QUALITY_MAX_BRIGHTNESS,
+                           min_vegetation_fraction=QUALITY_MIN_VEGETATION)
+
+# Background writer for original uploads; pending writes are awaited before serving the file
+upload_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix='upload-writer')
+pending_uploads = {}
+pending_uploads_lock = threading.Lock()
+
+def write_upload(filepath, image_bytes):
+    """Write an upload to disk"""
+    try:
+        with open(filepath, 'wb') as f:
+            f.write(image_bytes)
+        logger.info(f"Saved uploaded file: {os.path.basename(filepath)}")
+    except OSError as e:
+        logger.error(f"Error saving upload {filepath}: {str(e)}")
+    finally:
+        with pending_uploads_lock:
+            pending_uploads.pop(os.path.basename(filepath), None)
+
+def persist_upload_async(filepath, image_bytes):
+    """Queue an upload to be written to disk without blocking the request"""
+    with pending_uploads_lock:
+        pending_uploads[os.path.basename(filepath)] = upload_writer.submit(write_upload, filepath, image_bytes)
+
+def wait_for_upload(filename, timeout=10):
+    """Block until a pending background write of filename has finished"""
+    with pending_uploads_lock:
+        future = pending_uploads.get(filename)
+    if future is not None:
+        future.result(timeout=timeout)
+
+# Visualization overlays, deferred until first requested
+visualization_locks = {}
+visualization_locks_lock = threading.Lock()
+
+def render_visualization_async(img_array, vis_filepath, result):
+    """Render a visualization on the background writer; GETs wait for it like pending uploads"""
+    def render():
+        try:
+            visualize_prediction(img_array, vis_filepath, result)
+        finally:
+            with pending_uploads_lock:
+                pending_uploads.pop(os.path.basename(vis_filepath), None)
+    with pending_uploads_lock:
+        pending_uploads[os.path.basename(vis_filepath)] = upload_writer.submit(render)
+
+def schedule_visualization(img_array, vis_filepath, result):
+    """Defer the prediction overlay off the request path
+    
+    With stored uploads only the fields visualize_prediction draws are written to a
+    small sidecar, and the overlay is rendered from the upload on its first GET;
+    API clients that never fetch it never pay for it. Otherwise the decoded array is
+    rendered in the background.
+    """
+    spec = {key: result[key] for key in ('class', 'confidence', 'tiles', 'leaves') if result.get(key) is not None}
+    if not PERSIST_UPLOADS:
+        render_visualization_async(img_array, vis_filepath, spec)
+        return
+    with open(f"{vis_filepath}.json", 'w') as f:
+        json.dump(spec, f, cls=SafeJSONEncoder)
+
+def ensure_visualization(filename):
+    """Render a deferred vis_ file from its upload and sidecar if it does not exist yet"""
+    vis_filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    spec_path = f"{vis_filepath}.json"
+    if not filename.startswith('vis_') or os.path.exists(vis_filepath) or not os.path.exists(spec_path):
+        return
+    # [lock, users]: the entry is dropped only once no thread holds or waits on the lock
+    with visualization_locks_lock:
+        entry = visualization_locks.setdefault(filename, [threading.Lock(), 0])
+        entry[1] += 1
+    try:
+        with entry[0]:
+            if not os.path.exists(vis_filepath):
+                original = filename[len('vis_'):]
+                wait_for_upload(original)
+                with open(spec_path, 'r') as f:
+                    spec = json.load(f)
+                start_time = time.time()
+                # Rendered under a temporary name so a concurrent GET never sees a partial JPEG
+                tmp_path = os.path.join(app.config['UPLOAD_FOLDER'], f".{filename}.tmp.jpg")
+                visualize_prediction(os.path.join(app.config['UPLOAD_FOLDER'], original), tmp_path, spec)
+                os.replace(tmp_path, vis_filepath)
+                logger.info(f"Rendered deferred visualization {filename} in {(time.time() - start_time) * 1000:.0f} ms")
+    finally:
+        with visualization_locks_lock:
+            entry[1] -= 1
+            if not entry[1]:
+                visualization_locks.pop(filename, None)
+
+# Resized JPEG/WebP copies of uploads and visualizations for display
+derivative_cache = DerivativeCache(DERIVATIVE_FOLDER,
+                                   max_bytes=int(DERIVATIVE_CACHE_MB * 1024 * 1024),
+                                   jpeg_quality=DERIVATIVE_JPEG_QUALITY,
+                                   webp_quality=DERIVATIVE_WEBP_QUALITY)
+
+# Grad-CAM explanations of stored uploads, computed when first viewed
+explanation_store = ExplanationStore(UPLOAD_FOLDER,
+                                     explain_fn=lambda filepath, class_name: detector.explain(filepath, class_name),
+                                     render_fn=render_explanation,
+                                     max_entries=EXPLANATION_CACHE_SIZE)
+
+def load_explanation(filename, class_name=None):
+    """Return (explanation, overlay file name, source), or a (JSON error, status) pair"""
+    if detector is None:
+        return None, (jsonify({'success': False, 'error': 'Model is not ready'}), 503)
+    if class_name and class_name not in DISEASE_CLASSES:
+        return None, (jsonify({'success': False, 'error': f"Unknown class '{class_name}'"}), 400)
+    filename = secure_filename(filename)
+    try:
+        wait_for_upload(filename)
+        return explanation_store.get(filename, class_name), None
+    except FileNotFoundError:
+        return None, (jsonify({'success': False, 'error': 'Upload not found'}), 404)
+    except NotImplementedError as e:
+        return None, (jsonify({'success': False, 'error': str(e)}), 501)
+    except Exception as e:
+        logger.error(f"Grad-CAM failed for {filename}: {str(e)}")
+        return None, (jsonify({'success': False, 'error': 'Could not compute the explanation'}), 500)
+
+# Perceptual-hash index of previous results, consulted on exact-cache misses
+near_duplicate_index = None
+if NEAR_DUPLICATE_DISTANCE >= 0:
+    near_duplicate_index = PerceptualHashIndex(capacity=NEAR_DUPLICATE_CAPACITY,
+                                               max_distance=NEAR_DUPLICATE_DISTANCE,
+                                               method=NEAR_DUPLICATE_METHOD,
+                                               top_k=TOP_K_DISPLAY)
+
+# Embeddings of confirmed diagnoses, searched for cases similar to an upload when its result page asks
+case_index = None
+if SIMILAR_CASES_INDEX:
+    try:
+        case_index = EmbeddingIndex(SIMILAR_CASES_INDEX)
+        logger.info(f"Loaded similar-case index with {len(case_index)} cases")
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not open similar-case index {SIMILAR_CASES_INDEX}: {str(e)}")
+
+def similar_cases_enabled():
+    """Whether the similar-case endpoints can embed uploads"""
+    return case_index is not None and detector is not None and detector.backend.name == 'keras'
+
+def find_similar_cases(embedding):
+    """Confirmed cases closest to an embedding, above the minimum cosine similarity"""
+    try:
+        matches = case_index.search(embedding, k=SIMILAR_CASES_K, nprobe=SIMILAR_CASES_NPROBE)
+    except Exception as e:
+        logger.warning(f"Similar-case search failed: {str(e)}")
+        return []
+    return [{'class': match.get('class'),
+             'image_file': match.get('image_file'),
+             'confirmed_at': match.get('confirmed_at'),
+             'similarity': match['score']}
+            for match in matches if match['score'] >= SIMILAR_CASES_MIN_SCORE]
+
+def predict_with_near_duplicates(img_array, tta=None, crop=None):
+    """Reuse the result of a near-identical earlier upload, or run the detector and index the result
+    
+    Requests that set tta or crop explicitly always run the detector and are not indexed.
+    """
+    image_hash = None
+    if near_duplicate_index is not None and tta is None and crop is None:
+        try:
+            image_hash = near_duplicate_index.hash(img_array)
+            match = near_duplicate_index.lookup(image_hash)
+            if match is not None:
+                distance, previous = match
+                logger.info(f"Reusing near-duplicate prediction (Hamming distance {distance})")
+                return dict(previous, near_duplicate_distance=distance)
+        except Exception as e:
+            logger.warning(f"Perceptual hash lookup failed: {str(e)}")
+    
+    result = detector.predict(img_array, top_k=TOP_K_DISPLAY, return_probabilities=False, tta=tta, crop=crop)
+    if image_hash is not None and 'error' not in result:
+        near_duplicate_index.add(image_hash, result)
+    return result
+
+def process_upload(image_bytes, filename, progress=None, tta=None, tiled=False, leaves=False, crop=None):
+    """Decode, classify and visualize one upload, returning the response payload
+    
+    progress, when given, is called with each stage name ('decoding', 'inferring',
+    'rendering') so asynchronous jobs can report where they are. tta forces (True) or
+    disables (False) test-time augmentation; None leaves it to the confidence threshold.
+    tiled=True runs sliding-window inference and renders a tile heatmap; leaves=True
+    classifies each segmented leaf and draws per-leaf boxes. crop restricts the
+    prediction (every tile or leaf in those modes) to that crop's classes.
+    """
+    report = progress or (lambda stage: None)
+    
+    # Canonical crop name, so 'tomato' and 'Tomato' share cache entries
+    if crop:
+        try:
+            crop = detector.resolve_crop(crop)
+        except ValueError:
+            return {
+                'success': False,
+                'rejected': True,
+                'error': f"Unknown crop '{crop}'. Choose one of: {', '.join(c.replace('_', ' ') for c in CROP_CHOICES)}",
+                'image_file': None,
+                'vis_image': None
+            }
+    
+    filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    vis_filename = f"vis_{filename}"
+    vis_filepath = os.path.join(app.config['UPLOAD_FOLDER'], vis_filename)
+    
+    if PERSIST_UPLOADS:
+        persist_upload_async(filepath, image_bytes)
+    image_file = filename if PERSIST_UPLOADS else None
+    
+    cache_key = prediction_cache.make_key(image_bytes)
+    if tta is not None:
+        cache_key += '-tta' if tta else '-no-tta'
+    if tiled:
+        cache_key += '-tiles'
+    elif leaves:
+        cache_key += '-leaves'
+    if crop:
+        cache_key += f"-crop-{crop}"
+    img_array = None
+    
+    # Make prediction
+    try:
+        # Decode once; the same array feeds inference and visualization
+        report('decoding')
+        min_size = (max(DISPLAY_SIZE[0], TILED_MAX_SIDE), max(DISPLAY_SIZE[1], TILED_MAX_SIDE)) if tiled else DISPLAY_SIZE
+        img_array = decode_image(image_bytes, min_size=min_size, quality=DECODE_QUALITY, backend=DECODE_BACKEND)
+        
+        # Reject blurry, badly exposed or plant-free photos before paying for inference and rendering
+        quality = quality_gate.check(img_array)
+        if quality['decision'] == 'reject':
+            logger.info(f"Quality gate rejected {filename}: {', '.join(quality['issues'])} in {quality['gate_ms']:.1f} ms")
+            return {
+                'success': False,
+                'rejected': True,
+                'error': quality['message'],
+                'quality': quality,
+                'image_file': image_file,
+                'vis_image': None
+            }
+        
+        # Get model prediction
+        report('inferring')
+        start_time = time.time()
+        if tiled:
+            compute = lambda: detector.predict_tiles(img_array, stride=TILED_STRIDE or None, max_side=TILED_MAX_SIDE,
+                                                     top_k=TOP_K_DISPLAY, disease_threshold=TILED_DISEASE_THRESHOLD,
+                                                     crop=crop)
+        elif leaves:
+            compute = lambda: detector.predict_leaves(img_array, max_regions=LEAF_MAX_REGIONS,
+                                                      min_area_fraction=LEAF_MIN_AREA_FRACTION, top_k=TOP_K_DISPLAY,
+                                                      disease_threshold=LEAF_DISEASE_THRESHOLD, crop=crop)
+        else:
+            compute = lambda: predict_with_near_duplicates(img_array, tta=tta, crop=crop)
+        
+        def compute_and_observe():
+            # Only real model runs feed the quality gate's saved-time estimate, not cache or near-duplicate hits
+            compute_start = time.time()
+            value = compute()
+            if 'error' not in value and 'near_duplicate_distance' not in value:
+                quality_gate.observe_pipeline((time.time() - compute_start) * 1000.0)
+            return value
+        
+        raw_result = prediction_cache.get_or_compute(
+            cache_key,
+            compute_and_observe,
+            should_cache=lambda value: 'error' not in value)
+        
+        # Convert result to a safe format for JSON serialization
+        safe_result = {}
+        
+        # Handle class
+        if 'class' in raw_result:
+            safe_result['class'] = str(raw_result['class']) if raw_result['class'] is not None else "Unknown"
+        else:
+            safe_result['class'] = "Unknown"
+            
+        # Handle confidence
+        if 'confidence' in raw_result:
+            try:
+                safe_result['confidence'] = float(raw_result['confidence'])
+            except (TypeError, ValueError):
+                safe_result['confidence'] = 0.0
+        else:
+            safe_result['confidence'] = 0.0
+            
+        # Handle top predictions (drives the result page chart)
+        safe_result['top_predictions'] = []
+        for pred in raw_result.get('top_k') or []:
+            try:
+                safe_result['top_predictions'].append({
+                    'class': str(pred['class']),
+                    'confidence': float(pred['confidence'])
+                })
+            except (KeyError, TypeError, ValueError):
+                continue
+        
+        # Report test-time augmentation (views used, extra latency) when it ran
+        if raw_result.get('tta'):
+            safe_result['tta'] = raw_result['tta']
+        
+        # Crop scoping (masked or crop head) when the request named a crop
+        if raw_result.get('crop'):
+            safe_result['crop'] = raw_result['crop']
+        
+        # Which cascade stage answered and the latency it saved
+        if raw_result.get('cascade'):
+            safe_result['cascade'] = raw_result['cascade']
+        
+        # Per-tile grid for tiled predictions (drives the heatmap overlay)
+        if raw_result.get('tiles'):
+            safe_result['tiles'] = raw_result['tiles']
+        
+        # Per-leaf boxes and classes for multi-leaf predictions
+        if raw_result.get('leaves'):
+            safe_result['leaves'] = ensure_serializable(raw_result['leaves'])
+        
+        # Quality warnings when the gate only flags
+        if quality['issues']:
+            safe_result['quality'] = quality
+        
+        # Use the safe result for the rest of the function
+        result = safe_result
+        
+        prediction_time = time.time() - start_time
+        
+        # Log the prediction
+        logger.info(f"Prediction for {filename}: {result['class']} with confidence {result['confidence']:.4f} in {prediction_time:.2f}s")
+        
+        # Defer the visualization overlay until it is requested
+        report('rendering')
+        schedule_visualization(img_array, vis_filepath, result)
+        
+        # Get disease information from database
+        disease_info = get_disease_info(result['class'])
+        
+        return {
+            'success': True,
+            'result': result,
+            'image_file': image_file,
+            'vis_image': vis_filename,
+            'disease_info': disease_info,
+            'processing_time': f"{prediction_time:.2f}"
+        }
+    except Exception as e:
+        # Handle errors during prediction
+        error_msg = 'SORRY, TRY AGAIN'
+        logger.error(f"Error processing {filename}: {str(e)}")
+        
+        # Create a visualization with error message
+        render_error_visualization(img_array, vis_filepath)
+        
+        return {
+            'success': False,
+            'error': error_msg,
+            'image_file': image_file,
+            'vis_image': vis_filename
+        }
+
+def render_error_visualization(img_array, vis_filepath):
+    """Write the upload (or a blank frame) with a 'try again' banner"""
+    load_cv2()
+    try:
+        if img_array is None:
+            raise ValueError("Upload could not be decoded")
+        img = load_bgr(img_array)
+        
+        # Resize for display if needed
+        display_img = cv2.resize(img, DISPLAY_SIZE) if img.shape[0] > DISPLAY_SIZE[1] or img.shape[1] > DISPLAY_SIZE[0] else img.copy()
+                        # Add a semi-transparent overlay
+        overlay = display_img.copy()
+        h, w = display_img.shape[:2]
+        cv2.rectangle(overlay, (0, h-60), (w, h), (0, 0, 0), -1)
+        
+        # Blend the overlay
+        alpha = 0.7
+        beta = 0.3
+        cv2.addWeighted(overlay, alpha, display_img, beta, 0, display_img)
+        
+        # Add error text
+        font = cv2.FONT_HERSHEY_SIMPLEX
+        cv2.putText(display_img, "SORRY, TRY AGAIN", (10, h-25), font, 0.7, (255, 255, 255), 2)
+        
+        cv2.imwrite(vis_filepath, display_img)
+    except Exception as viz_error:
+        logger.error(f"Error creating error visualization: {str(viz_error)}")
+        # If visualization fails, create a blank image with error message
+        blank_img = np.zeros((480, 640, 3), np.uint8)
+        cv2.putText(blank_img, "SORRY, TRY AGAIN", (50, 240), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
+        cv2.imwrite(vis_filepath, blank_img)
+
+def parse_flag(value):
+    """Interpret a form or query flag such as '1', 'true' or 'on'"""
+    return value is not None and value.lower() in ('1', 'true', 'yes', 'on')
+
+def parse_tta_flag(value):
+    """Map a request's tta field to True (force), False (disable) or None (automatic)"""
+    if value is None or value == '':
+        return None
+    return parse_flag(value)
+
+def upload_options():
+    """Per-request analysis options for process_upload, read from the form or query string"""
+    return {
+        'tta': parse_tta_flag(request.values.get('tta')),
+        'tiled': parse_flag(request.values.get('tiled')),
+        'leaves': parse_flag(request.values.get('leaves')),
+        'crop': request.values.get('crop') or None,
+    }
+
+def render_upload_result(response_data):
+    """Render the result page for a process_upload payload"""
+    if response_data.get('rejected'):
+        # Unusable photo: send the user back to the upload form with the advice
+        flash(response_data['error'])
+        return redirect(url_for('index'))
+    
+    if not response_data['success']:
+        # For failed predictions, show the error on the result page
+        flash(response_data['error'])
+        return render_template('result.html',
+                              app_name="YOUR CROP MATTERS",
+                              error=response_data['error'],
+                              image_file=response_data['image_file'],
+                              vis_image=response_data['vis_image'])
+    
+    return render_template('result.html', 
+                          app_name="YOUR CROP MATTERS",
+                          result=response_data['result'],
+                          image_file=response_data['image_file'],
+                          vis_image=response_data['vis_image'],
+                          disease_info=response_data['disease_info'],
+                          processing_time=response_data['processing_time'],
+                          can_confirm=case_index is not None and bool(response_data['image_file']))
+
+def run_prediction_job(payload, progress):
+    """Job body: wait for the model if it is still loading, then run the upload pipeline"""
+    image_bytes, filename, options = payload
+    while detector is None and detector_status['state'] == 'loading':
+        time.sleep(0.2)
+    if detector is None:
+        raise RuntimeError('The disease detection model is currently unavailable')
+    return process_upload(image_bytes, filename, progress, **options)
+
+job_queue = JobQueue(run_prediction_job,
+                     workers=PREDICTION_JOB_WORKERS,
+                     db_path=PREDICTION_JOBS_DB,
+                     max_pending=PREDICTION_JOB_MAX_PENDING,
+                     ttl_seconds=PREDICTION_JOB_TTL)
+
+def job_payload(job):
+    """Client-facing view of a job record"""
+    payload = {
+        'job_id': job['id'],
+        'state': job['state'],
+        'stage': job['stage'],
+        'elapsed': round(job['updated_at'] - job['created_at'], 3)
+    }
+    if job['state'] == 'done':
+        payload['result'] = job['result']
+        payload['result_url'] = url_for('prediction_job_result', job_id=job['id'])
+    elif job['state'] == 'failed':
+        payload['error'] = job['error']
+    return payload
 
 # Routes
 @app.route('/')
@@ -2286,7 +1103,8 @@ def index():
         clean_old_uploads()
         session['cleaned_uploads'] = True
     
-    return render_template('index.html', app_name="YOUR CROP MATTERS")
+    return render_template('index.html', app_name="YOUR CROP MATTERS", crops=CROP_CHOICES,
+                           job_events=PREDICTION_JOB_EVENTS)
 
 @app.route('/uploads/<filename>')
 def uploaded_file(filename):
@@ -2294,14 +1112,92 @@ def uploaded_file(filename):
     # Security check to prevent directory traversal
     if '..' in filename or filename.startswith('/'):
         return "Invalid filename", 400
-        
-    response = send_from_directory(app.config['UPLOAD_FOLDER'], filename)
-    response.headers['Cache-Control'] = 'public, max-age=31536000'  # Cache for a year
+    
+    # The original may still be being written in the background, and overlays are rendered on first request
+    wait_for_upload(filename)
+    ensure_visualization(filename)
+    
+    try:
+        etag = file_etag(os.path.join(app.config['UPLOAD_FOLDER'], filename))
+    except OSError:
+        abort(404)
+    if filename.startswith(('vis_', 'cam_')):
+        return send_media(app.config['UPLOAD_FOLDER'], filename, etag, GENERATED_MAX_AGE)
+    return send_media(app.config['UPLOAD_FOLDER'], filename, etag, UPLOAD_MAX_AGE, immutable=True)
+
+@app.route('/derived/<int:width>/<filename>')
+def derived_image(width, filename):
+    """Serve an upload or visualization resized to one of DERIVATIVE_WIDTHS as JPEG or WebP
+    
+    ?format=jpeg|webp picks the encoding; without it WebP is sent to clients that accept it.
+    """
+    if width not in DERIVATIVE_WIDTHS:
+        return "Unsupported width", 404
+    filename = secure_filename(filename)
+    fmt = request.args.get('format')
+    negotiated = fmt is None
+    if negotiated:
+        fmt = 'webp' if 'image/webp' in request.headers.get('Accept', '') else 'jpeg'
+    if fmt not in DERIVATIVE_FORMATS:
+        return "Unsupported format", 400
+    
+    wait_for_upload(filename)
+    ensure_visualization(filename)
+    try:
+        path, etag, mimetype = derivative_cache.get(os.path.join(app.config['UPLOAD_FOLDER'], filename), width, fmt)
+    except FileNotFoundError:
+        return "Not found", 404
+    except ValueError as e:
+        logger.warning(f"Could not derive {filename} at {width}px: {str(e)}")
+        return "Invalid image", 400
+    
+    response = send_media(DERIVATIVE_FOLDER, os.path.basename(path), etag, GENERATED_MAX_AGE, mimetype=mimetype)
+    if negotiated:
+        response.headers['Vary'] = 'Accept'
     return response
 
+@app.route('/explain/<filename>')
+def explanation_image(filename):
+    """Serve the Grad-CAM overlay of an upload, computing it on first request"""
+    loaded, error = load_explanation(filename, request.args.get('class'))
+    if error:
+        return error
+    return uploaded_file(loaded[1])
+
+@app.route('/api/explain/<filename>')
+def explanation_data(filename):
+    """API endpoint returning an upload's Grad-CAM heatmap grid and overlay URL"""
+    class_name = request.args.get('class')
+    loaded, error = load_explanation(filename, class_name)
+    if error:
+        return error
+    explanation, overlay_name, source = loaded
+    return jsonify({
+        'success': True,
+        'class': explanation['class'],
+        'confidence': explanation['confidence'],
+        'heatmap': np.round(explanation['heatmap'].astype(np.float32), 3).tolist(),
+        'explain_ms': explanation['explain_ms'],
+        'source': source,
+        'image': url_for('explanation_image', filename=secure_filename(filename), **({'class': class_name} if class_name else {}))
+    })
+
 @app.route('/predict', methods=['POST'])
 def predict():
     """Handle image upload and make disease prediction"""
+    # The model is still loading in the background - ask the client to retry shortly
+    if detector is None and detector_status['state'] == 'loading':
+        retry_after = '5'
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return json.dumps({
+                'success': False,
+                'error': 'The disease detection model is still starting up. Please try again in a few seconds.',
+                'retry_after': int(retry_after)
+            }, cls=SafeJSONEncoder), 503, {'Content-Type': 'application/json', 'Retry-After': retry_after}
+        
+        flash('The disease detection model is still starting up. Please try again in a few seconds.')
+        return redirect(url_for('index'))
+    
     # Check if model is available
     if detector is None:
         flash('Sorry, the disease detection model is currently unavailable. Please try again later.')
@@ -2331,143 +1227,15 @@ def predict():
     if file and allowed_file(file.filename):
         # Create a unique filename to avoid collisions
         filename = str(uuid.uuid4()) + '_' + secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
         
-        # Save the uploaded file
-        file.save(filepath)
-        logger.info(f"Saved uploaded file: {filename}")
+        # Read the upload into memory once; persisting the original happens in the background
+        response_data = process_upload(file.read(), filename, **upload_options())
         
-        # Make prediction
-        try:
-            # Get model prediction
-            start_time = time.time()
-            raw_result = detector.predict(filepath)
-            
-            # Convert result to a safe format for JSON serialization
-            safe_result = {}
-            
-            # Handle class
-            if 'class' in raw_result:
-                safe_result['class'] = str(raw_result['class']) if raw_result['class'] is not None else "Unknown"
-            else:
-                safe_result['class'] = "Unknown"
-                
-            # Handle confidence
-            if 'confidence' in raw_result:
-                try:
-                    safe_result['confidence'] = float(raw_result['confidence'])
-                except (TypeError, ValueError):
-                    safe_result['confidence'] = 0.0
-            else:
-                safe_result['confidence'] = 0.0
-                
-            # Handle all_probabilities
-            safe_result['all_probabilities'] = {}
-            if 'all_probabilities' in raw_result and isinstance(raw_result['all_probabilities'], dict):
-                for k, v in raw_result['all_probabilities'].items():
-                    try:
-                        if v is not None and str(v).lower() != 'undefined':
-                            safe_result['all_probabilities'][str(k)] = float(v)
-                        else:
-                            safe_result['all_probabilities'][str(k)] = 0.0
-                    except (TypeError, ValueError):
-                        safe_result['all_probabilities'][str(k)] = 0.0
-            
-            # Use the safe result for the rest of the function
-            result = safe_result
-            
-            prediction_time = time.time() - start_time
-            
-            # Log the prediction
-            logger.info(f"Prediction for {filename}: {result['class']} with confidence {result['confidence']:.4f} in {prediction_time:.2f}s")
-            
-            # Create visualization with prediction overlay
-            vis_filename = f"vis_{filename}"
-            vis_filepath = os.path.join(app.config['UPLOAD_FOLDER'], vis_filename)
-            
-            # Use the visualization function
-            visualize_prediction(filepath, vis_filepath, result)
-            
-            # Get disease information from database
-            disease_info = get_disease_info(result['class'])
-            
-            # Handle AJAX requests
-            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                response_data = {
-                    'success': True,
-                    'result': result,
-                    'image_file': filename,
-                    'vis_image': vis_filename,
-                    'disease_info': disease_info,
-                    'processing_time': f"{prediction_time:.2f}"
-                }
-                
-                return json.dumps(response_data, cls=SafeJSONEncoder), 200, {'Content-Type': 'application/json'}
-            
-            # Render results page for normal requests
-            return render_template('result.html', 
-                                  app_name="YOUR CROP MATTERS",
-                                  result=result,
-                                  image_file=filename,
-                                  vis_image=vis_filename,
-                                  disease_info=disease_info,
-                                  processing_time=f"{prediction_time:.2f}")
-        except Exception as e:
-            # Handle errors during prediction
-            error_msg = 'SORRY, TRY AGAIN'
-            logger.error(f"Error processing {filename}: {str(e)}")
-            flash(error_msg)
-            
-            # Create a visualization with error message
-            vis_filename = f"vis_{filename}"
-            vis_filepath = os.path.join(app.config['UPLOAD_FOLDER'], vis_filename)
-            
-            # Create a simple error visualization
-            try:
-                img = cv2.imread(filepath)
-                if img is None:
-                    pil_img = Image.open(filepath)
-                    img = cv2.cvtColor(np.array(pil_img), cv2.COLOR_RGB2BGR)
-                
-                # Resize for display if needed
-                display_img = cv2.resize(img, (640, 480)) if img.shape[0] > 480 or img.shape[1] > 640 else img.copy()
-                                # Add a semi-transparent overlay
-                overlay = display_img.copy()
-                h, w = display_img.shape[:2]
-                cv2.rectangle(overlay, (0, h-60), (w, h), (0, 0, 0), -1)
-                
-                # Blend the overlay
-                alpha = 0.7
-                beta = 0.3
-                cv2.addWeighted(overlay, alpha, display_img, beta, 0, display_img)
-                
-                # Add error text
-                font = cv2.FONT_HERSHEY_SIMPLEX
-                cv2.putText(display_img, "SORRY, TRY AGAIN", (10, h-25), font, 0.7, (255, 255, 255), 2)
-                
-                cv2.imwrite(vis_filepath, display_img)
-            except Exception as viz_error:
-                logger.error(f"Error creating error visualization: {str(viz_error)}")
-                # If visualization fails, create a blank image with error message
-                blank_img = np.zeros((480, 640, 3), np.uint8)
-                cv2.putText(blank_img, "SORRY, TRY AGAIN", (50, 240), cv2.FONT_HERSHEY_SIMPLEX, 1, (255, 255, 255), 2)
-                cv2.imwrite(vis_filepath, blank_img)
-            
-            # Handle AJAX requests
-            if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
-                return json.dumps({
-                    'success': False, 
-                    'error': error_msg,
-                    'image_file': filename,
-                    'vis_image': vis_filename
-                }, cls=SafeJSONEncoder), 200, {'Content-Type': 'application/json'}
-            
-            # For regular requests, show the error on the result page
-            return render_template('result.html',
-                                  app_name="YOUR CROP MATTERS",
-                                  error=error_msg,
-                                  image_file=filename,
-                                  vis_image=vis_filename)
+        # Handle AJAX requests
+        if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
+            return json.dumps(response_data, cls=SafeJSONEncoder), 200, {'Content-Type': 'application/json'}
+        
+        return render_upload_result(response_data)
     
     # Handle invalid file type
     flash('Invalid file type. Please upload a PNG, JPG, or JPEG image.')
@@ -2478,6 +1246,74 @@ def predict():
     
     return redirect(url_for('index'))
 
+@app.route('/api/jobs', methods=['POST'])
+def create_prediction_job():
+    """Queue an upload for prediction and return its job id immediately"""
+    file = request.files.get('file')
+    if file is None or file.filename == '' or not allowed_file(file.filename):
+        return jsonify({'success': False, 'error': 'Invalid file type'}), 400
+    if detector is None and detector_status['state'] == 'failed':
+        return jsonify({'success': False, 'error': 'SORRY, TRY AGAIN'}), 503
+    
+    filename = str(uuid.uuid4()) + '_' + secure_filename(file.filename)
+    job_id = job_queue.submit((file.read(), filename, upload_options()))
+    if job_id is None:
+        return jsonify({
+            'success': False,
+            'error': 'The server is busy. Please try again in a few seconds.',
+            'retry_after': 5
+        }), 503, {'Retry-After': '5'}
+    
+    status_url = url_for('prediction_job_status', job_id=job_id)
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status_url': status_url,
+        'events_url': url_for('prediction_job_events', job_id=job_id),
+        'result_url': url_for('prediction_job_result', job_id=job_id)
+    }), 202, {'Location': status_url}
+
+@app.route('/api/jobs/<job_id>')
+def prediction_job_status(job_id):
+    """Poll a prediction job's stage and, once finished, its result"""
+    job = job_queue.get(job_id)
+    if job is None:
+        return jsonify({'success': False, 'error': 'Unknown or expired job'}), 404
+    return json.dumps(job_payload(job), cls=SafeJSONEncoder), 200, {'Content-Type': 'application/json', 'Cache-Control': 'no-store'}
+
+@app.route('/api/jobs/<job_id>/events')
+def prediction_job_events(job_id):
+    """Server-Sent Events stream of a job's stage changes, ending with a done or failed event"""
+    if job_queue.get(job_id) is None:
+        return jsonify({'success': False, 'error': 'Unknown or expired job'}), 404
+    
+    def stream():
+        for job in job_queue.follow(job_id):
+            if job is None:
+                yield ": keep-alive\n\n"
+                continue
+            event = job['state'] if job['state'] in ('done', 'failed') else 'stage'
+            yield f"event: {event}\ndata: {json.dumps(job_payload(job), cls=SafeJSONEncoder)}\n\n"
+    
+    # Keep the request context alive while streaming so url_for works in job_payload
+    return Response(stream_with_context(stream()), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/jobs/<job_id>')
+def prediction_job_result(job_id):
+    """Render the result page for a finished prediction job"""
+    job = job_queue.get(job_id)
+    if job is None:
+        flash('This prediction has expired. Please upload the image again.')
+        return redirect(url_for('index'))
+    if job['state'] == 'failed':
+        flash('SORRY, TRY AGAIN')
+        return redirect(url_for('index'))
+    if job['state'] != 'done':
+        flash('Your image is still being analyzed. Please wait a moment.')
+        return redirect(url_for('index'))
+    return render_upload_result(job['result'])
+
 @app.route('/about')
 def about():
     """Render the about page"""
@@ -2488,13 +1324,131 @@ def contact():
     """Render the contact page"""
     return render_template('contact.html', app_name="YOUR CROP MATTERS")
 
+def thread_config():
+    """Planned thread budget plus the pool sizes the loaded runtime actually reports"""
+    config = dict(thread_plan) if thread_plan else {}
+    if hasattr(os, 'sched_getaffinity'):
+        config['effective_affinity'] = sorted(os.sched_getaffinity(0))
+    if detector is not None:
+        backend = detector.backend.describe()
+        for key in ('intra_op_threads', 'inter_op_threads', 'num_threads'):
+            if key in backend:
+                config[f"effective_{key}"] = backend[key]
+    return config
+
 @app.route('/api/health')
 def health_check():
     """API endpoint for health checks"""
     return jsonify({
         'status': 'healthy' if detector is not None else 'degraded',
         'timestamp': datetime.now().isoformat(),
-        'model_loaded': detector is not None
+        'model_loaded': detector is not None,
+        'model_state': detector_status['state'],
+        'threads': thread_config()
+    })
+
+@app.route('/api/health/live')
+def liveness_check():
+    """Liveness probe - the process is up and serving requests"""
+    return jsonify({
+        'status': 'alive',
+        'timestamp': datetime.now().isoformat()
+    })
+
+@app.route('/api/health/ready')
+def readiness_check():
+    """Readiness probe - the model is loaded and ready for predictions"""
+    ready = detector is not None and detector_status['state'] == 'ready'
+    return jsonify({
+        'status': 'ready' if ready else detector_status['state'],
+        'timestamp': datetime.now().isoformat(),
+        'uptime_seconds': round(time.time() - detector_status['started_at'], 3),
+        'load_seconds': detector_status['load_seconds'],
+        'warmup': detector_status['warmup'],
+        'error': detector_status['error']
+    }), 200 if ready else 503
+
+@app.route('/api/crops')
+def list_crops():
+    """API endpoint listing the crops a prediction can be scoped to with crop=..."""
+    if detector is None:
+        return jsonify({'crops': [{'crop': crop, 'name': crop.replace('_', ' ')} for crop in CROP_CHOICES]})
+    return jsonify({'crops': detector.crops()})
+
+def embed_upload(filename):
+    """Return (embedding, None) for a stored upload, or (None, (JSON error, status))"""
+    if case_index is None:
+        return None, (jsonify({'success': False, 'error': 'Similar-case index is disabled'}), 404)
+    if not similar_cases_enabled():
+        return None, (jsonify({'success': False, 'error': 'Model is not ready'}), 503)
+    try:
+        wait_for_upload(filename)
+    except Exception as e:
+        logger.warning(f"Pending upload {filename} did not finish: {str(e)}")
+    filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+    if not filename or not os.path.exists(filepath):
+        return None, (jsonify({'success': False, 'error': 'Upload not found'}), 404)
+    try:
+        return detector.embed(filepath), None
+    except Exception as e:
+        logger.error(f"Could not embed {filename}: {str(e)}")
+        return None, (jsonify({'success': False, 'error': 'Could not embed upload'}), 500)
+
+@app.route('/api/cases/<filename>/similar')
+def similar_cases(filename):
+    """API endpoint listing the confirmed cases most similar to an upload"""
+    embedding, error = embed_upload(secure_filename(filename))
+    if error:
+        return error
+    return jsonify({'success': True, 'cases': find_similar_cases(embedding)})
+
+@app.route('/api/cases/<filename>/confirm', methods=['POST'])
+def confirm_case(filename):
+    """API endpoint adding an upload's embedding and confirmed class to the similar-case index"""
+    filename = secure_filename(filename)
+    if case_index is not None and filename in case_index:
+        return jsonify({'success': True, 'cases': len(case_index), 'duplicate': True})
+    data = request.get_json(silent=True) or request.form
+    confirmed_class = data.get('class')
+    if confirmed_class is not None and confirmed_class not in DISEASE_CLASSES:
+        return jsonify({'success': False, 'error': f"Unknown class '{confirmed_class}'"}), 400
+    
+    # Embeddings come from the detector's embedding cache, usually warm from the similar-case lookup
+    embedding, error = embed_upload(filename)
+    if error:
+        return error
+    if confirmed_class is None:
+        confirmed_class = detector.predict(os.path.join(app.config['UPLOAD_FOLDER'], filename),
+                                           return_probabilities=False)['class']
+        if confirmed_class not in DISEASE_CLASSES:
+            return jsonify({'success': False, 'error': 'Could not classify upload'}), 500
+    
+    case_index.add([filename], [embedding], [{
+        'class': confirmed_class,
+        'image_file': filename,
+        'confirmed_at': datetime.now().isoformat()
+    }])
+    logger.info(f"Confirmed case {filename} as {confirmed_class} ({len(case_index)} cases indexed)")
+    return jsonify({'success': True, 'cases': len(case_index), 'class': confirmed_class}), 201
+
+@app.route('/api/metrics')
+def metrics():
+    """API endpoint exposing inference tuning metrics"""
+    return jsonify({
+        'timestamp': datetime.now().isoformat(),
+        'batching': detector.batching_stats() if detector is not None else None,
+        'profile': INFERENCE_PROFILE,
+        'backend': detector.backend.describe() if detector is not None else None,
+        'prediction_cache': prediction_cache.stats(),
+        'jobs': job_queue.stats(),
+        'quality_gate': quality_gate.stats(),
+        'tta': detector.tta_stats() if detector is not None else None,
+        'cascade': detector.cascade_stats() if detector is not None else None,
+        'crop_scope': detector.crop_stats() if detector is not None else None,
+        'similar_cases': dict(case_index.stats(), lookup='on_demand') if case_index is not None else None,
+        'explanations': explanation_store.stats(),
+        'derivatives': derivative_cache.stats(),
+        'near_duplicates': near_duplicate_index.stats() if near_duplicate_index is not None else None
     })
 
 @app.errorhandler(413)
@@ -0,0 +1,273 @@
+# autotune.py
+"""Sweep inference runtime knobs on this machine and persist the best profile.
+
+Each runtime configuration (backend, inference mode, thread counts, oneDNN on/off)
+runs in its own subprocess, because oneDNN and TensorFlow thread pools can only
+be set before TensorFlow initializes. Inside a trial, every micro-batching setting
+(max batch size, max wait) is load-tested with concurrent clients on a fixed mix
+of synthetic and sample images, recording throughput and p99 latency. Outputs on
+the same images are compared with the reference configuration (per-call Keras,
+oneDNN off, the historical default), and configurations that change predictions
+are rejected before the fastest remaining one is written to the profile.
+
+Usage:
+    python autotune.py --images samples/ [--tflite models/plant_disease_model_float16.tflite]
+                       [--workers 2] [--max-p99-ms 250] [--output models/inference_profile.json]
+"""
+import os
+import sys
+import json
+import time
+import argparse
+import tempfile
+import platform
+import itertools
+import threading
+import subprocess
+from datetime import datetime
+import numpy as np
+from PIL import Image
+
+from inference_profile import DEFAULT_PROFILE_PATH, save_inference_profile
+from thread_budget import available_cpus
+
+RESULT_MARKER = 'AUTOTUNE_RESULT '
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.webp')
+
+
+def load_images(image_dir, synthetic, size=256, seed=0):
+    """Sample images from a folder plus photo-like synthetic images, as RGB uint8 arrays"""
+    from benchmark_decode import synthetic_jpeg
+    from image_decoding import decode_image
+
+    images = []
+    if image_dir:
+        for name in sorted(os.listdir(image_dir)):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                img = decode_image(os.path.join(image_dir, name), min_size=(size, size), quality='fast')
+                images.append(np.asarray(Image.fromarray(img).resize((size, size), Image.BILINEAR)))
+    for i in range(synthetic):
+        images.append(decode_image(synthetic_jpeg(size, size, seed=seed + i)))
+    return images
+
+
+def measure_load(detector, inputs, max_batch_size, max_wait_ms, concurrency, requests):
+    """Serve requests from concurrent clients, returning throughput and latency percentiles
+
+    max_batch_size=1 calls the backend directly from every client, as the app does
+    with micro-batching disabled.
+    """
+    from crop_detection import MicroBatcher
+
+    batcher = None
+    if max_batch_size > 1:
+        batcher = MicroBatcher(detector._forward, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    latencies = []
+    lock = threading.Lock()
+
+    def client(offset):
+        timings = []
+        for i in range(offset, requests, concurrency):
+            img = inputs[i % len(inputs)][np.newaxis]
+            start_time = time.perf_counter()
+            if batcher is not None:
+                batcher.submit(img).result()
+            else:
+                detector._forward(img)
+            timings.append((time.perf_counter() - start_time) * 1000.0)
+        with lock:
+            latencies.extend(timings)
+
+    threads = [threading.Thread(target=client, args=(offset,)) for offset in range(concurrency)]
+    start_time = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start_time
+    mean_batch = batcher.stats()['mean_batch_size'] if batcher is not None else 1.0
+    if batcher is not None:
+        batcher.stop()
+
+    latencies = np.array(latencies)
+    p50, p99 = np.percentile(latencies, [50, 99])
+    return {
+        'images_per_s': len(latencies) / elapsed,
+        'p50_ms': float(p50),
+        'p99_ms': float(p99),
+        'mean_batch_size': mean_batch,
+    }
+
+
+def run_trial(spec):
+    """Subprocess body: load one runtime configuration and load-test every batching setting"""
+    from crop_detection import CropDiseaseDetector
+
+    detector = CropDiseaseDetector(spec['model_path'], spec['class_indices'], backend=spec['backend'],
+                                   inference_mode=spec['inference_mode'], jit_compile=spec['jit_compile'],
+                                   num_threads=spec['num_threads'], inter_op_threads=spec['inter_op_threads'])
+    with np.load(spec['images_path']) as data:
+        images = [data[f"arr_{i}"] for i in range(len(data.files))]
+    inputs = np.concatenate([detector.preprocess_image(img) for img in images])
+
+    # Parity outputs one image at a time, matching how requests are served
+    detector.warmup(extra_batch_sizes=spec['batch_sizes'])
+    np.save(spec['outputs_path'], np.concatenate([detector._forward(inputs[i:i + 1]) for i in range(len(inputs))]))
+
+    results = []
+    for max_batch_size in spec['batch_sizes']:
+        for max_wait_ms in (spec['max_waits'] if max_batch_size > 1 else [0.0]):
+            stats = measure_load(detector, inputs, max_batch_size, max_wait_ms, spec['concurrency'], spec['requests'])
+            stats.update({'max_batch_size': max_batch_size, 'max_wait_ms': max_wait_ms})
+            results.append(stats)
+    detector.close()
+    return results
+
+
+def launch_trial(spec, timeout):
+    """Run one trial in a fresh interpreter so oneDNN and thread settings take effect"""
+    env = dict(os.environ, TF_CPP_MIN_LOG_LEVEL='2', TF_ENABLE_ONEDNN_OPTS='1' if spec['onednn'] else '0',
+               OMP_NUM_THREADS=str(spec['num_threads']))
+    try:
+        completed = subprocess.run([sys.executable, os.path.abspath(__file__), '--trial', json.dumps(spec)],
+                                   env=env, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None, f"timed out after {timeout}s"
+    for line in reversed(completed.stdout.splitlines()):
+        if line.startswith(RESULT_MARKER):
+            return json.loads(line[len(RESULT_MARKER):]), None
+    error = (completed.stderr.strip().splitlines() or ['no output'])[-1]
+    return None, error
+
+
+def runtime_configs(args, threads):
+    """Every runtime configuration to try; the first is the parity reference"""
+    runtimes = [('keras', args.model, 'keras', False), ('keras', args.model, 'compiled', False)]
+    if args.jit:
+        runtimes.append(('keras', args.model, 'compiled', True))
+    for tflite_path in args.tflite:
+        runtimes.append(('tflite', tflite_path, 'keras', False))
+
+    configs = []
+    for onednn, (backend, model_path, mode, jit), num_threads in itertools.product([False, True], runtimes, threads):
+        configs.append({
+            'backend': backend,
+            'model_path': model_path,
+            'inference_mode': mode,
+            'jit_compile': jit,
+            'onednn': onednn,
+            'num_threads': num_threads,
+            'inter_op_threads': 2 if num_threads >= 8 else 1,
+        })
+    return configs
+
+
+def describe_config(config):
+    runtime = config['backend'] if config['backend'] == 'tflite' else config['inference_mode']
+    if config['jit_compile']:
+        runtime += '+xla'
+    return f"{runtime} onednn={'on' if config['onednn'] else 'off'} threads={config['num_threads']}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Autotune inference runtime settings and write a profile")
+    parser.add_argument('--model', default=os.path.join('models', 'plant_disease_model_best.keras'))
+    parser.add_argument('--class-indices', default=os.path.join('models', 'class_indices.json'))
+    parser.add_argument('--tflite', nargs='*', default=[], help="TFLite exports to include in the sweep")
+    parser.add_argument('--jit', action='store_true', help="Also try the XLA-compiled path")
+    parser.add_argument('--images', help="Folder of sample images to mix with synthetic ones")
+    parser.add_argument('--synthetic', type=int, default=16)
+    parser.add_argument('--workers', type=int, default=int(os.environ.get('WEB_CONCURRENCY', 1)),
+                        help="Worker processes that will share this machine")
+    parser.add_argument('--threads', type=int, nargs='+', help="Intra-op thread counts (default: share and half)")
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 4, 8, 16])
+    parser.add_argument('--max-waits', type=float, nargs='+', default=[2.0, 5.0, 10.0])
+    parser.add_argument('--concurrency', type=int, default=8, help="Concurrent clients during load tests")
+    parser.add_argument('--requests', type=int, default=200, help="Requests per load test")
+    parser.add_argument('--min-agreement', type=float, default=0.99, help="Required top-1 agreement with reference")
+    parser.add_argument('--max-p99-ms', type=float, help="Latency budget; fastest config within it wins")
+    parser.add_argument('--timeout', type=int, default=1800, help="Seconds allowed per runtime configuration")
+    parser.add_argument('--output', default=DEFAULT_PROFILE_PATH)
+    parser.add_argument('--trial', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.trial:
+        print(RESULT_MARKER + json.dumps(run_trial(json.loads(args.trial))))
+        return
+
+    share = max(1, len(available_cpus()) // max(1, args.workers))
+    threads = sorted(set(args.threads or [share, max(1, share // 2)]), reverse=True)
+    images = load_images(args.images, args.synthetic)
+    if not images:
+        parser.error("No images to benchmark with")
+
+    candidates = []
+    reference = None
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        images_path = os.path.join(tmp_dir, 'images.npz')
+        np.savez(images_path, *images)
+
+        print(f"Autotuning on {len(images)} images, {len(available_cpus())} CPUs, {args.workers} worker(s)")
+        print(f"{'configuration':<36}{'batch':>6}{'wait':>6}{'img/s':>9}{'p50 ms':>9}{'p99 ms':>9}{'top-1':>8}{'max |diff|':>12}")
+        for index, config in enumerate(runtime_configs(args, threads)):
+            outputs_path = os.path.join(tmp_dir, f"outputs_{index}.npy")
+            spec = dict(config, class_indices=args.class_indices, images_path=images_path, outputs_path=outputs_path,
+                        batch_sizes=args.batch_sizes, max_waits=args.max_waits, concurrency=args.concurrency,
+                        requests=args.requests)
+            results, error = launch_trial(spec, args.timeout)
+            if results is None:
+                print(f"{describe_config(config):<36}  failed: {error}")
+                if reference is None:
+                    sys.exit("Reference configuration failed; cannot check parity")
+                continue
+
+            # Output parity against the reference configuration
+            outputs = np.load(outputs_path)
+            if reference is None:
+                reference = outputs
+            agreement = float(np.mean(outputs.argmax(axis=1) == reference.argmax(axis=1)))
+            diff = float(np.abs(outputs - reference).max())
+
+            for result in results:
+                result.update(config, top1_agreement=agreement, max_abs_diff=diff)
+                candidates.append(result)
+                print(f"{describe_config(config):<36}{result['max_batch_size']:>6}{result['max_wait_ms']:>6.0f}"
+                      f"{result['images_per_s']:>9.1f}{result['p50_ms']:>9.1f}{result['p99_ms']:>9.1f}"
+                      f"{agreement:>8.3f}{diff:>12.2e}")
+
+    eligible = [c for c in candidates if c['top1_agreement'] >= args.min_agreement]
+    if not eligible:
+        sys.exit("No configuration matched the reference outputs")
+    if args.max_p99_ms is not None:
+        fastest_p99 = min(c['p99_ms'] for c in eligible)
+        eligible = [c for c in eligible if c['p99_ms'] <= args.max_p99_ms]
+        if not eligible:
+            sys.exit(f"No configuration met the {args.max_p99_ms:g} ms p99 budget (best p99 {fastest_p99:.1f} ms)")
+    best = max(eligible, key=lambda c: (c['images_per_s'], -c['p99_ms']))
+
+    # Update only the runtime keys of an existing profile, keeping e.g. the cascade calibration
+    profile = {}
+    if os.path.exists(args.output):
+        with open(args.output, 'r') as f:
+            profile = json.load(f)
+    profile.update({key: best[key] for key in ('backend', 'model_path', 'inference_mode', 'jit_compile',
+                                               'num_threads', 'inter_op_threads', 'onednn', 'max_batch_size',
+                                               'max_wait_ms')})
+    profile['batching'] = best['max_batch_size'] > 1
+    profile['measured'] = {key: best[key] for key in ('images_per_s', 'p50_ms', 'p99_ms', 'mean_batch_size',
+                                                      'top1_agreement', 'max_abs_diff')}
+    profile['machine'] = {
+        'hostname': platform.node(),
+        'cpus': len(available_cpus()),
+        'workers': args.workers,
+        'concurrency': args.concurrency,
+        'created_at': datetime.now().isoformat(),
+    }
+    save_inference_profile(profile, args.output)
+    print(f"✅ Best: {describe_config(best)} batch {best['max_batch_size']} wait {best['max_wait_ms']:.0f} ms - "
+          f"{best['images_per_s']:.1f} img/s, p99 {best['p99_ms']:.1f} ms")
+    print(f"Profile written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
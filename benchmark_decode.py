@@ -0,0 +1,84 @@
+# benchmark_decode.py
+"""Benchmark full vs DCT-reduced JPEG decoding across image sizes.
+
+For each synthetic photo size, reports decode time, decoded buffer size and the
+time to reach the 224x224 model input, for every decode backend and quality preset.
+
+Usage:
+    python benchmark_decode.py --sizes 1280x960 4000x3000 --iterations 10
+"""
+import io
+import time
+import argparse
+import tracemalloc
+import numpy as np
+from PIL import Image
+
+from image_decoding import decode_image, DECODE_QUALITIES, DECODE_BACKENDS
+
+DISPLAY_SIZE = (640, 480)
+MODEL_SIZE = (224, 224)
+
+
+def synthetic_jpeg(width, height, quality=90, seed=0):
+    """Encode a photo-like test image (smooth gradients plus sensor noise) as JPEG bytes"""
+    rng = np.random.default_rng(seed)
+    y, x = np.mgrid[0:height, 0:width].astype(np.float32)
+    img = np.stack([
+        127 + 100 * np.sin(x / 97.0) * np.cos(y / 131.0),
+        150 + 80 * np.cos(x / 53.0 + y / 71.0),
+        90 + 60 * np.sin((x + y) / 211.0),
+    ], axis=-1)
+    img += rng.normal(0, 12, img.shape)
+    buffer = io.BytesIO()
+    Image.fromarray(np.clip(img, 0, 255).astype(np.uint8)).save(buffer, format='JPEG', quality=quality)
+    return buffer.getvalue()
+
+
+def measure(data, backend, quality, iterations):
+    """Return (decode ms, decode + model-resize ms, decoded MB, peak traced MB, decoded shape)"""
+    decode_times, total_times = [], []
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        img = decode_image(data, min_size=DISPLAY_SIZE, quality=quality, backend=backend)
+        decoded = time.perf_counter()
+        Image.fromarray(img).resize(MODEL_SIZE, Image.NEAREST)
+        decode_times.append((decoded - start_time) * 1000.0)
+        total_times.append((time.perf_counter() - start_time) * 1000.0)
+
+    # Peak Python-visible allocation of one decode (the decoded array dominates)
+    tracemalloc.start()
+    decode_image(data, min_size=DISPLAY_SIZE, quality=quality, backend=backend)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return (float(np.median(decode_times)), float(np.median(total_times)),
+            img.nbytes / (1024 * 1024), peak / (1024 * 1024), img.shape)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark reduced-resolution JPEG decoding")
+    parser.add_argument('--sizes', nargs='+', default=['640x480', '1920x1080', '4000x3000', '6000x4000'])
+    parser.add_argument('--iterations', type=int, default=5)
+    parser.add_argument('--backends', nargs='+', choices=DECODE_BACKENDS, default=list(DECODE_BACKENDS))
+    args = parser.parse_args()
+
+    print(f"{'image':<11}{'backend':<8}{'quality':<10}{'decoded':>12}{'decode ms':>11}{'to 224 ms':>11}"
+          f"{'buffer MB':>11}{'peak MB':>9}")
+    for size in args.sizes:
+        width, height = (int(v) for v in size.lower().split('x'))
+        data = synthetic_jpeg(width, height)
+        for backend in args.backends:
+            for quality in DECODE_QUALITIES:
+                try:
+                    decode_ms, total_ms, buffer_mb, peak_mb, shape = measure(data, backend, quality, args.iterations)
+                except ImportError as e:
+                    print(f"{size:<11}{backend:<8}{quality:<10}  skipped ({str(e)})")
+                    break
+                decoded = f"{shape[1]}x{shape[0]}"
+                print(f"{size:<11}{backend:<8}{quality:<10}{decoded:>12}{decode_ms:>11.1f}{total_ms:>11.1f}"
+                      f"{buffer_mb:>11.1f}{peak_mb:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# benchmark_inference.py
+"""Compare per-call Keras model.predict with the compiled tf.function inference path.
+
+Usage:
+    python benchmark_inference.py --batch-sizes 1 4 16 --iterations 50 [--jit]
+"""
+import os
+import time
+import argparse
+import numpy as np
+
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+
+from crop_detection import CropDiseaseDetector
+
+
+def time_forward(detector, batch, iterations, warmup=3):
+    """Time detector._forward on a fixed batch, returning per-call latencies in ms"""
+    for _ in range(warmup):
+        detector._forward(batch)
+
+    timings = []
+    for _ in range(iterations):
+        start_time = time.perf_counter()
+        detector._forward(batch)
+        timings.append((time.perf_counter() - start_time) * 1000.0)
+    return np.array(timings)
+
+
+def summarize(timings, batch_size):
+    """Return latency percentiles and throughput for a set of timings"""
+    p50, p99 = np.percentile(timings, [50, 99])
+    return {
+        'mean_ms': float(timings.mean()),
+        'p50_ms': float(p50),
+        'p99_ms': float(p99),
+        'max_ms': float(timings.max()),
+        'images_per_s': batch_size * 1000.0 / float(timings.mean()),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Keras predict against compiled inference")
+    parser.add_argument('--model', default=os.path.join('models', 'plant_disease_model_best.keras'))
+    parser.add_argument('--class-indices', default=os.path.join('models', 'class_indices.json'))
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[1, 8, 32])
+    parser.add_argument('--iterations', type=int, default=30)
+    parser.add_argument('--jit', action='store_true', help="Also benchmark the XLA-compiled path")
+    args = parser.parse_args()
+
+    configs = [('keras', {'inference_mode': 'keras'}),
+               ('compiled', {'inference_mode': 'compiled'})]
+    if args.jit:
+        configs.append(('compiled+xla', {'inference_mode': 'compiled', 'jit_compile': True}))
+
+    rng = np.random.default_rng(0)
+    reference = {}
+    print(f"{'mode':<14}{'batch':>6}{'mean ms':>10}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'img/s':>10}{'max |diff|':>12}")
+    for name, kwargs in configs:
+        detector = CropDiseaseDetector(args.model, args.class_indices, serving_batch_sizes=args.batch_sizes, **kwargs)
+        for batch_size in args.batch_sizes:
+            batch = rng.uniform(-1.0, 1.0, (batch_size, detector.img_size, detector.img_size, 3)).astype(np.float32)
+
+            # Output parity against the Keras path on the same synthetic batch
+            outputs = np.asarray(detector._forward(batch))
+            if name == 'keras':
+                reference[batch_size] = (batch, outputs)
+                diff = 0.0
+            else:
+                ref_batch, ref_outputs = reference[batch_size]
+                diff = float(np.abs(np.asarray(detector._forward(ref_batch)) - ref_outputs).max())
+
+            stats = summarize(time_forward(detector, batch, args.iterations), batch_size)
+            print(f"{name:<14}{batch_size:>6}{stats['mean_ms']:>10.2f}{stats['p50_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+                  f"{stats['max_ms']:>10.2f}{stats['images_per_s']:>10.1f}{diff:>12.2e}")
+        detector.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# build_case_index.py
+"""Seed or extend the similar-case index from a labeled image folder.
+
+The folder holds one subfolder per class, named like the entries of
+class_indices.json (see calibrate_cascade.py). Images are embedded in
+batches with the same forward pass that classifies them, and appended to
+the index with their folder's class; ids already in the index are skipped,
+so the tool can be re-run as the folder grows. --ivf (re)trains the
+inverted-file layer afterwards, which keeps queries in the millisecond
+range once the index holds hundreds of thousands of cases.
+
+Usage:
+    python build_case_index.py --images labeled/ --index user_data/cases/index
+                               [--model models/plant_disease_model_best.keras] [--ivf] [--nlist 1024]
+"""
+import os
+import time
+import argparse
+from datetime import datetime
+
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+
+from crop_detection import CropDiseaseDetector
+from embedding_index import EmbeddingIndex
+from calibrate_cascade import list_labeled_images
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the similar-case embedding index")
+    parser.add_argument('--images', required=True, help="Labeled folder with one subfolder per class")
+    parser.add_argument('--index', default=os.path.join('user_data', 'cases', 'index'), help="Index path prefix")
+    parser.add_argument('--model', default=os.path.join('models', 'plant_disease_model_best.keras'))
+    parser.add_argument('--class-indices', default=os.path.join('models', 'class_indices.json'))
+    parser.add_argument('--limit-per-class', type=int, default=1000)
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--ivf', action='store_true', help="Train the IVF layer after adding")
+    parser.add_argument('--nlist', type=int, default=None, help="IVF lists (default ~sqrt of the index size)")
+    args = parser.parse_args()
+
+    detector = CropDiseaseDetector(args.model, args.class_indices, backend='keras')
+    index = EmbeddingIndex(args.index)
+    samples = [(path, label) for path, label in list_labeled_images(args.images, detector.class_names,
+                                                                    args.limit_per_class)
+               if os.path.relpath(path, args.images) not in index]
+    print(f"Embedding {len(samples)} new images into {args.index} ({len(index)} already indexed)")
+
+    start_time = time.time()
+    for start in range(0, len(samples), args.batch_size):
+        chunk = samples[start:start + args.batch_size]
+        results = detector.predict_batch([path for path, _ in chunk], top_k=1, batch_size=args.batch_size,
+                                         return_embeddings=True)
+        rows = [(path, label, result) for (path, label), result in zip(chunk, results) if 'embedding' in result]
+        if not rows:
+            continue
+        now = datetime.now().isoformat()
+        index.add([os.path.relpath(path, args.images) for path, _, _ in rows],
+                  [result['embedding'] for _, _, result in rows],
+                  [{'class': detector.class_names[label], 'predicted_class': result['class'],
+                    'image_file': None, 'confirmed_at': now} for _, label, result in rows])
+    print(f"✅ Index holds {len(index)} cases ({time.time() - start_time:.1f}s)")
+
+    if args.ivf and len(index):
+        nlist = index.train_ivf(nlist=args.nlist)
+        print(f"Trained IVF layer with {nlist} lists")
+
+
+if __name__ == "__main__":
+    main()
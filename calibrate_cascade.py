@@ -0,0 +1,165 @@
+# calibrate_cascade.py
+"""Calibrate the confidence cascade threshold on a labeled image folder.
+
+The folder holds one subfolder per class, named like the entries of
+class_indices.json (matching ignores case and punctuation). Every image is
+scored once by the student and once by the full model, then each candidate
+(confidence threshold, margin) pair is simulated offline: rows the student
+accepts keep its prediction, the rest take the full model's. The loosest
+setting whose accuracy stays within --max-accuracy-drop of the full model alone
+is written to the inference profile, together with the measured escalation
+rate and expected per-image latency.
+
+Usage:
+    python calibrate_cascade.py --images labeled/ --student models/student_float16.tflite
+                                [--model models/plant_disease_model_best.keras] [--max-accuracy-drop 0.005]
+"""
+import os
+import re
+import json
+import time
+import argparse
+from datetime import datetime
+import numpy as np
+
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+
+from crop_detection import CropDiseaseDetector, preprocess_input, _to_probabilities
+from inference_profile import DEFAULT_PROFILE_PATH, save_inference_profile
+
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+
+
+def _normalize(name):
+    return re.sub(r'[^a-z0-9]', '', str(name).lower())
+
+
+def list_labeled_images(image_dir, class_names, limit_per_class):
+    """Return (path, class index) pairs for every class subfolder that matches a model class"""
+    lookup = {_normalize(name): index for index, name in enumerate(class_names)}
+    samples = []
+    for folder in sorted(os.listdir(image_dir)):
+        folder_path = os.path.join(image_dir, folder)
+        if not os.path.isdir(folder_path):
+            continue
+        label = lookup.get(_normalize(folder))
+        if label is None:
+            print(f"⚠️ Skipping {folder}: no matching model class")
+            continue
+        names = [n for n in sorted(os.listdir(folder_path)) if n.lower().endswith(IMAGE_EXTENSIONS)]
+        samples.extend((os.path.join(folder_path, n), label) for n in names[:limit_per_class])
+    return samples
+
+
+def score_images(detector, paths, batch_size):
+    """Run the student and the full model over the images, returning both probability matrices"""
+    student_probs, full_probs = [], []
+    for start in range(0, len(paths), batch_size):
+        images = [detector.load_rgb(path) for path in paths[start:start + batch_size]]
+        batch = preprocess_input(np.stack(images).astype(np.float32))
+        student_batch = detector._student_input(images, batch)
+        student_probs.append(_to_probabilities(detector.student.forward(student_batch)))
+        full_probs.append(_to_probabilities(detector._forward(batch)))
+    return np.concatenate(student_probs), np.concatenate(full_probs)
+
+
+def single_image_ms(forward, batch, iterations):
+    """Mean latency in ms of one-image forward calls, the shape served per request"""
+    forward(batch)
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        forward(batch)
+    return (time.perf_counter() - start_time) * 1000.0 / iterations
+
+
+def sweep(detector, student_probs, full_probs, labels, thresholds, margins, student_ms, full_ms):
+    """Simulate the cascade for every (threshold, margin) pair"""
+    full_correct = full_probs.argmax(axis=1) == labels
+    student_correct = student_probs.argmax(axis=1) == labels
+    rows = []
+    for margin in margins:
+        for threshold in thresholds:
+            detector.cascade_threshold, detector.cascade_margin = threshold, margin
+            accepted = detector.cascade_accepts(student_probs)[0]
+            escalation_rate = 1.0 - float(accepted.mean())
+            rows.append({
+                'threshold': round(float(threshold), 4),
+                'margin': round(float(margin), 4),
+                'accuracy': float(np.where(accepted, student_correct, full_correct).mean()),
+                'escalation_rate': escalation_rate,
+                'expected_ms': student_ms + escalation_rate * full_ms,
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate the student/full-model cascade threshold")
+    parser.add_argument('--images', required=True, help="Labeled folder with one subfolder per class")
+    parser.add_argument('--student', required=True, help="Small student model (.keras or .tflite)")
+    parser.add_argument('--model', default=os.path.join('models', 'plant_disease_model_best.keras'))
+    parser.add_argument('--class-indices', default=os.path.join('models', 'class_indices.json'))
+    parser.add_argument('--limit-per-class', type=int, default=200)
+    parser.add_argument('--batch-size', type=int, default=32)
+    parser.add_argument('--max-accuracy-drop', type=float, default=0.005,
+                        help="Accuracy the cascade may lose relative to the full model alone")
+    parser.add_argument('--margins', type=float, nargs='+', default=[0.0, 0.1, 0.2, 0.3])
+    parser.add_argument('--iterations', type=int, default=30, help="Latency benchmark iterations")
+    parser.add_argument('--output', default=DEFAULT_PROFILE_PATH, help="Inference profile to update")
+    parser.add_argument('--dry-run', action='store_true', help="Report without writing the profile")
+    args = parser.parse_args()
+
+    detector = CropDiseaseDetector(args.model, args.class_indices, cascade_model_path=args.student)
+    samples = list_labeled_images(args.images, detector.class_names, args.limit_per_class)
+    if not samples:
+        parser.error(f"No labeled images found under {args.images}")
+    paths, labels = [p for p, _ in samples], np.array([label for _, label in samples])
+
+    print(f"Scoring {len(paths)} images in {len(set(labels.tolist()))} classes")
+    student_probs, full_probs = score_images(detector, paths, args.batch_size)
+
+    image = detector.load_rgb(paths[0])
+    batch = preprocess_input(image[np.newaxis].astype(np.float32))
+    student_ms = single_image_ms(detector.student.forward, detector._student_input([image], batch), args.iterations)
+    full_ms = single_image_ms(detector._forward, batch, args.iterations)
+
+    full_accuracy = float((full_probs.argmax(axis=1) == labels).mean())
+    student_accuracy = float((student_probs.argmax(axis=1) == labels).mean())
+    print(f"Full model: {full_accuracy * 100:.2f}% top-1, {full_ms:.1f} ms/image")
+    print(f"Student:    {student_accuracy * 100:.2f}% top-1, {student_ms:.1f} ms/image")
+
+    rows = sweep(detector, student_probs, full_probs, labels, np.arange(0.30, 1.0, 0.01), args.margins,
+                 student_ms, full_ms)
+    eligible = [r for r in rows if r['accuracy'] >= full_accuracy - args.max_accuracy_drop]
+    if not eligible:
+        raise SystemExit("No cascade setting keeps accuracy within the allowed drop; keep the full model only")
+    best = min(eligible, key=lambda r: (r['expected_ms'], -r['accuracy'], -r['threshold']))
+
+    print(f"\n{'threshold':>10}{'margin':>8}{'accuracy':>10}{'escalated':>11}{'ms/image':>10}")
+    for row in sorted(eligible, key=lambda r: r['expected_ms'])[:10]:
+        print(f"{row['threshold']:>10.2f}{row['margin']:>8.2f}{row['accuracy'] * 100:>9.2f}%"
+              f"{row['escalation_rate'] * 100:>10.1f}%{row['expected_ms']:>10.1f}")
+    print(f"\n✅ Threshold {best['threshold']:.2f}, margin {best['margin']:.2f}: "
+          f"{best['escalation_rate'] * 100:.1f}% escalated, {best['expected_ms']:.1f} ms/image "
+          f"vs {full_ms:.1f} ms full model, accuracy {best['accuracy'] * 100:.2f}%")
+
+    if args.dry_run:
+        return
+    # Update only the cascade keys of an existing profile
+    profile = {}
+    if os.path.exists(args.output):
+        with open(args.output, 'r') as f:
+            profile = json.load(f)
+    profile.update({
+        'cascade_model_path': args.student,
+        'cascade_threshold': best['threshold'],
+        'cascade_margin': best['margin'],
+        'cascade_calibration': dict(best, images=len(paths), full_accuracy=full_accuracy,
+                                    student_accuracy=student_accuracy, student_ms=student_ms, full_ms=full_ms,
+                                    created_at=datetime.now().isoformat()),
+    })
+    save_inference_profile(profile, args.output)
+    print(f"Profile written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
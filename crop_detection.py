@@ -1,49 +1,316 @@
 # crop_detection.py
 import os
+import re
 import json
+import time
+import hashlib
+import queue
+import threading
+import collections
+from concurrent.futures import Future
 import numpy as np
-import tensorflow as tf
-from tensorflow.keras.models import load_model
-from tensorflow.keras.preprocessing import image
-from tensorflow.keras.applications.mobilenet_v2 import preprocess_input
+from PIL import Image
 import logging
 
+from inference_backends import load_backend
+from image_decoding import decode_image
+from leaf_segmentation import find_leaf_regions
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('crop_disease_detector')
 
+def preprocess_input(img_array):
+    """Scale pixels to [-1, 1] in place, identical to keras mobilenet_v2.preprocess_input"""
+    img_array /= 127.5
+    img_array -= 1.0
+    return img_array
+
+def _softmax(logits):
+    """Numerically stable softmax over the last axis"""
+    shifted = logits - logits.max(axis=-1, keepdims=True)
+    exp = np.exp(shifted)
+    return exp / exp.sum(axis=-1, keepdims=True)
+
+def _to_probabilities(outputs):
+    """Return row-wise probabilities, applying softmax only when the model emits logits"""
+    outputs = np.asarray(outputs, dtype=np.float32)
+    if outputs.min() >= 0.0 and np.allclose(outputs.sum(axis=-1), 1.0, atol=1e-3):
+        return outputs
+    return _softmax(outputs)
+
+def _top_k(probs, k):
+    """Return (indices, values) of the k largest entries per row, sorted descending"""
+    k = max(1, min(int(k), probs.shape[-1]))
+    idx = np.argpartition(-probs, k - 1, axis=-1)[..., :k]
+    values = np.take_along_axis(probs, idx, axis=-1)
+    order = np.argsort(-values, axis=-1, kind='stable')
+    idx = np.take_along_axis(idx, order, axis=-1)
+    return idx, np.take_along_axis(values, order, axis=-1)
+
+def _as_rgb_uint8(img_array):
+    """Normalize grayscale, RGBA or float arrays to RGB uint8"""
+    if img_array.ndim == 2:
+        img_array = np.stack([img_array] * 3, axis=-1)
+    elif img_array.shape[-1] == 4:
+        img_array = img_array[..., :3]
+    if img_array.dtype != np.uint8:
+        img_array = np.clip(img_array, 0, 255).astype(np.uint8)
+    return img_array
+
+def _crop_key(name):
+    """Case- and punctuation-insensitive lookup key for a crop name"""
+    return re.sub(r'[^a-z0-9]', '', str(name).lower())
+
+# Test-time augmentations in priority order; a latency cap keeps only the first N
+TTA_AUGMENTATIONS = ('identity', 'hflip', 'vflip', 'rot+10', 'rot-10', 'crop_center', 'crop_tl', 'crop_br')
+TTA_AGGREGATES = ('mean', 'geometric')
+
+def _tta_views(img_array, size, augmentations):
+    """Build augmented copies of an RGB uint8 image, each resized to the model input size"""
+    img = Image.fromarray(img_array)
+    w, h = img.size
+    views = []
+    for name in augmentations:
+        if name == 'identity':
+            view = img
+        elif name == 'hflip':
+            view = img.transpose(Image.FLIP_LEFT_RIGHT)
+        elif name == 'vflip':
+            view = img.transpose(Image.FLIP_TOP_BOTTOM)
+        elif name.startswith('rot'):
+            # Crop away the empty corners a small rotation leaves behind
+            mx, my = int(w * 0.1), int(h * 0.1)
+            view = img.rotate(float(name[3:]), resample=Image.BILINEAR).crop((mx, my, w - mx, h - my))
+        elif name.startswith('crop_'):
+            cw, ch = int(w * 0.9), int(h * 0.9)
+            x, y = {'center': ((w - cw) // 2, (h - ch) // 2), 'tl': (0, 0), 'br': (w - cw, h - ch)}[name[5:]]
+            view = img.crop((x, y, x + cw, y + ch))
+        else:
+            raise ValueError(f"Unknown test-time augmentation: {name}")
+        views.append(np.asarray(view.resize(size, Image.NEAREST), dtype=np.uint8))
+    return np.stack(views)
+
+def _tile_starts(length, tile, stride):
+    """Window start offsets along one axis, with a final window flush against the far edge"""
+    starts = list(range(0, length - tile + 1, stride))
+    if starts[-1] != length - tile:
+        starts.append(length - tile)
+    return np.array(starts)
+
+def _aggregate(probs, method):
+    """Combine (N, num_classes) probabilities into one row by arithmetic or geometric mean"""
+    if method == 'geometric':
+        combined = np.exp(np.log(np.clip(probs, 1e-7, 1.0)).mean(axis=0))
+        return combined / combined.sum()
+    return probs.mean(axis=0)
+
+class MicroBatcher:
+    """Gather concurrent single-image requests into one batched forward pass"""
+    def __init__(self, infer_fn, max_batch_size=16, max_wait_ms=5.0, stats_window=1024):
+        self.infer_fn = infer_fn
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait_ms = max(0.0, float(max_wait_ms))
+        
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._stopped = False
+        
+        # Tuning statistics
+        self._batch_histogram = collections.Counter()
+        self._wait_times = collections.deque(maxlen=stats_window)
+        self._batch_times = collections.deque(maxlen=stats_window)
+        self._requests = 0
+        self._max_queue_depth = 0
+        
+        self._worker = threading.Thread(target=self._run, name='crop-micro-batcher', daemon=True)
+        self._worker.start()
+    
+    def submit(self, img_array):
+        """Queue one preprocessed image and return a Future for its probability vector"""
+        if self._stopped:
+            raise RuntimeError("Micro-batcher has been stopped")
+        
+        # Accept both (H, W, 3) and the (1, H, W, 3) output of preprocess_image
+        if img_array.ndim == 4:
+            img_array = img_array[0]
+        
+        future = Future()
+        self._queue.put((img_array, future, time.perf_counter()))
+        
+        depth = self._queue.qsize()
+        with self._lock:
+            self._requests += 1
+            self._max_queue_depth = max(self._max_queue_depth, depth)
+        return future
+    
+    def _collect(self):
+        """Block for the first request, then gather more until the batch is full or max-wait expires"""
+        item = self._queue.get()
+        if item is None:
+            return None
+        
+        batch = [item]
+        deadline = time.perf_counter() + self.max_wait_ms / 1000.0
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if item is None:
+                # Put the stop marker back so the run loop exits after this batch
+                self._queue.put(None)
+                break
+            batch.append(item)
+        return batch
+    
+    def _run(self):
+        """Worker loop: one forward pass per collected batch, results fanned back out"""
+        while True:
+            batch = self._collect()
+            if batch is None:
+                break
+            
+            dispatch_time = time.perf_counter()
+            images, futures, enqueued = zip(*batch)
+            try:
+                predictions = self.infer_fn(np.stack(images).astype(np.float32, copy=False))
+                for i, future in enumerate(futures):
+                    future.set_result(predictions[i])
+            except Exception as e:
+                logger.error(f"Batched inference failed for {len(batch)} request(s): {str(e)}")
+                for future in futures:
+                    future.set_exception(e)
+            
+            with self._lock:
+                self._batch_histogram[len(batch)] += 1
+                self._batch_times.append(time.perf_counter() - dispatch_time)
+                self._wait_times.extend(dispatch_time - t for t in enqueued)
+    
+    def stats(self):
+        """Return queue depth, batch-size histogram and wait-time statistics"""
+        with self._lock:
+            histogram = dict(sorted(self._batch_histogram.items()))
+            waits_ms = np.array(self._wait_times) * 1000.0
+            batch_ms = np.array(self._batch_times) * 1000.0
+            requests = self._requests
+            max_depth = self._max_queue_depth
+        
+        batches = sum(histogram.values())
+        stats = {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait_ms,
+            'queue_depth': self._queue.qsize(),
+            'max_queue_depth': max_depth,
+            'requests': requests,
+            'batches': batches,
+            'mean_batch_size': (sum(k * v for k, v in histogram.items()) / batches) if batches else 0.0,
+            'batch_size_histogram': histogram,
+        }
+        for name, values in (('wait_ms', waits_ms), ('batch_ms', batch_ms)):
+            if values.size:
+                p50, p95, p99 = np.percentile(values, [50, 95, 99])
+                stats[name] = {'p50': float(p50), 'p95': float(p95), 'p99': float(p99), 'max': float(values.max())}
+            else:
+                stats[name] = {'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+        return stats
+    
+    def stop(self, timeout=5.0):
+        """Stop the worker thread after draining already-queued requests"""
+        if self._stopped:
+            return
+        self._stopped = True
+        self._queue.put(None)
+        self._worker.join(timeout)
+
 class CropDiseaseDetector:
-    def __init__(self, model_path=None, class_indices_path=None):
-        """Initialize the crop disease detector with a trained model"""
+    def __init__(self, model_path=None, class_indices_path=None, batching=False, max_batch_size=16, max_wait_ms=5.0,
+                 inference_mode='keras', jit_compile=False, serving_batch_sizes=None, backend=None, num_threads=None,
+                 decode_quality='balanced', warmup=False, num_servers=1, inter_op_threads=None,
+                 tta_threshold=None, tta_aggregate='mean', tta_max_views=len(TTA_AUGMENTATIONS), tta_max_ms=None,
+                 cascade_model_path=None, cascade_backend=None, cascade_threshold=0.9, cascade_margin=0.0,
+                 crop_heads=False, crop_heads_path=None, embedding_cache_size=256):
+        """Initialize the crop disease detector with a trained model
+        
+        backend selects the runtime ('keras' or 'tflite', inferred from the model file extension
+        when None, or 'remote' to forward batches to inference_server.py processes, in which case
+        model_path is the server socket path and num_servers the number of processes). For the
+        Keras backend, inference_mode='compiled' replaces per-call model.predict with a traced
+        tf.function holding one fixed input signature per serving batch size (optionally
+        XLA-compiled). num_threads sizes the TFLite interpreter or the TensorFlow intra-op pool,
+        and inter_op_threads the TensorFlow inter-op pool. decode_quality ('fast', 'balanced' or
+        'full') controls how far JPEGs are downscaled in the DCT domain while decoding.
+        warmup=True runs synthetic inputs through every serving batch shape before the
+        constructor returns.
+        
+        Test-time augmentation runs flipped, rotated and cropped views of the image in one
+        extra batched forward pass and aggregates them ('mean' or 'geometric'). It is used when
+        predict(tta=True) asks for it, or automatically when the plain prediction's confidence
+        is below tta_threshold. tta_max_ms caps the extra latency by limiting the number of views
+        to the largest batch whose warmup or measured time fits; when not even one extra view
+        fits, the report says TTA was skipped.
+        
+        cascade_model_path loads a small student model (same classes, any backend) that
+        answers predict() first; the full model only runs when the student's top-1
+        confidence is below cascade_threshold or its margin over the runner-up is below
+        cascade_margin. Tiled, multi-leaf and batch predictions always use the full model.
+        
+        predict(crop=...) restricts the label space to one crop's classes by masking and
+        renormalizing the probabilities. With crop_heads=True (Keras backend) it instead runs a
+        per-crop head over the backbone embedding, which is cached per image so asking about
+        another crop skips the backbone. Heads default to the final Dense layer's columns for
+        the crop; crop_heads_path (.npz with '<crop>/kernel' and '<crop>/bias' arrays, columns
+        in class-index order) supplies separately fitted ones.
+        """
         # Default paths
         if model_path is None:
-            model_path = os.path.join('models', 'plant_disease_model_best.keras')
+            if backend == 'tflite':
+                model_path = os.path.join('models', 'plant_disease_model_float16.tflite')
+            else:
+                model_path = os.path.join('models', 'plant_disease_model_best.keras')
         if class_indices_path is None:
             class_indices_path = os.path.join('models', 'class_indices.json')
         
+        self.decode_quality = decode_quality
+        
+        # Test-time augmentation settings and running cost estimate
+        if tta_aggregate not in TTA_AGGREGATES:
+            raise ValueError(f"Unknown TTA aggregate: {tta_aggregate}")
+        self.tta_threshold = tta_threshold
+        self.tta_aggregate = tta_aggregate
+        self.tta_max_views = max(2, min(int(tta_max_views), len(TTA_AUGMENTATIONS)))
+        self.tta_max_ms = tta_max_ms
+        self._tta_forward_ms = {}  # batch size -> EMA of measured TTA forward passes
+        self._tta_view_cost = {}  # augmentation -> ms per source megapixel, timed during warmup
+        self._tta_view_scale = 1.0  # EMA of measured / estimated view-building time
+        self._tta_lock = threading.Lock()
+        self._tta_counts = collections.Counter()
+        self._tta_extra_ms = collections.deque(maxlen=1024)
+        
+        # Cascade settings and statistics
+        self.cascade_threshold = float(cascade_threshold)
+        self.cascade_margin = float(cascade_margin)
+        self._full_ms = None  # EMA of single-image full-model latency
+        self._cascade_lock = threading.Lock()
+        self._cascade_counts = collections.Counter()
+        self._cascade_saved_ms = 0.0
+        
         # Load the model
         try:
-            # Set memory growth to prevent TensorFlow from allocating all GPU memory
-            gpus = tf.config.experimental.list_physical_devices('GPU')
-            if gpus:
-                for gpu in gpus:
-                    tf.config.experimental.set_memory_growth(gpu, True)
-                logger.info(f"Found {len(gpus)} GPU(s), set memory growth")
-            
-            # Load model with error handling
-            if not os.path.exists(model_path):
-                raise FileNotFoundError(f"Model file not found: {model_path}")
-                
-            self.model = load_model(model_path)
-            logger.info(f"Loaded model from {model_path}")
-            
-            # Get image size from model input shape
-            if self.model.input_shape is None:
-                # Default to 224x224 if input shape is not available
-                self.img_size = 224
-                logger.warning("Could not determine input size from model, using default 224x224")
-            else:
-                self.img_size = self.model.input_shape[1]  # Assuming square input
+            self.backend = load_backend(model_path, backend=backend,
+                                        inference_mode=inference_mode,
+                                        jit_compile=jit_compile,
+                                        serving_batch_sizes=serving_batch_sizes,
+                                        num_threads=num_threads,
+                                        inter_op_threads=inter_op_threads,
+                                        num_servers=num_servers)
+            
+            # Keras model handle, None for backends that do not expose one
+            self.model = getattr(self.backend, 'model', None)
+            self.img_size = self.backend.input_size
             
             logger.info(f"Model expects input size: {self.img_size}x{self.img_size}")
             
@@ -67,103 +334,817 @@ class CropDiseaseDetector:
                 
             logger.info(f"Loaded {len(self.classes)} disease classes")
             
+            # Class names as an array indexed by model output, for vectorized lookups
+            num_outputs = self.backend.num_outputs or len(self.classes)
+            self.class_names = np.array([self.classes.get(i, f"Unknown_{i}") for i in range(num_outputs)], dtype=object)
+            self.healthy_mask = np.array(['healthy' in str(name).lower() for name in self.class_names])
+            
+            # Class index arrays per crop ("Tomato___Late_blight" belongs to "Tomato"), with lookup
+            # aliases for the full crop name and its first word ("Corn_(maize)" -> "corn")
+            crop_indices = collections.defaultdict(list)
+            for index, name in enumerate(self.class_names):
+                crop_indices[str(name).split('___')[0]].append(index)
+            self.crop_indices = {crop: np.array(indices) for crop, indices in crop_indices.items()}
+            self._crop_aliases = {}
+            for crop in self.crop_indices:
+                self._crop_aliases[_crop_key(crop)] = crop
+                self._crop_aliases.setdefault(_crop_key(re.split(r'[^A-Za-z]', crop)[0]), crop)
+            
+            # Optional crop-specific heads over a cached backbone embedding
+            self.crop_heads = self._build_crop_heads(crop_heads_path) if crop_heads else {}
+            self.embedding_cache_size = int(embedding_cache_size)
+            self._embedding_cache = collections.OrderedDict()
+            self._crop_lock = threading.Lock()
+            self._crop_counts = collections.Counter()
+            
+            # Optional fast student model for the confidence cascade
+            self.student = None
+            if cascade_model_path:
+                self.student = load_backend(cascade_model_path, backend=cascade_backend,
+                                            inference_mode=inference_mode,
+                                            num_threads=num_threads,
+                                            inter_op_threads=inter_op_threads)
+                if self.student.num_outputs not in (None, num_outputs):
+                    raise ValueError(f"Cascade model has {self.student.num_outputs} outputs, expected {num_outputs}")
+                logger.info(f"Cascade enabled with {cascade_model_path} (threshold {self.cascade_threshold}, "
+                            f"margin {self.cascade_margin})")
+            
+            # Optional micro-batching of concurrent predict() calls
+            self.batcher = None
+            if batching:
+                self.batcher = MicroBatcher(self._forward, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+                logger.info(f"Micro-batching enabled (max batch {max_batch_size}, max wait {max_wait_ms} ms)")
+            
+            # Pay graph tracing and allocator warmup now rather than on the first user request
+            self.warmup_stats = None
+            if warmup:
+                self.warmup()
+            
         except Exception as e:
             logger.error(f"Error initializing model: {str(e)}")
             raise RuntimeError(f"Failed to initialize disease detector: {str(e)}")
     
     def preprocess_image(self, img_path):
-        """Preprocess an image for prediction"""
+        """Preprocess an image (path, bytes or RGB array) for prediction"""
         try:
             # Load and resize image
-            img = image.load_img(img_path, target_size=(self.img_size, self.img_size))
-            img_array = image.img_to_array(img)
+            img_array = self.load_rgb(img_path).astype(np.float32)
             img_array = np.expand_dims(img_array, axis=0)
             
             # Preprocess input (same as during training)
             processed_img = preprocess_input(img_array)
             return processed_img
         except Exception as e:
-            logger.error(f"Error preprocessing image {img_path}: {str(e)}")
+            logger.error(f"Error preprocessing image {img_path if isinstance(img_path, str) else 'from memory'}: {str(e)}")
             raise ValueError(f"Failed to preprocess image: {str(e)}")
     
-    def predict(self, img_path):
-        """Predict the disease class for an image"""
+    def load_rgb(self, source):
+        """Decode a path, raw bytes or array into an RGB uint8 array at model resolution"""
+        size = (self.img_size, self.img_size)
+        if isinstance(source, np.ndarray):
+            img_array = source
+        else:
+            # JPEGs are decoded at the smallest DCT scale that still covers the model input
+            img_array = decode_image(source, min_size=size, quality=self.decode_quality)
+        
+        img_array = _as_rgb_uint8(img_array)
+        if img_array.shape[:2] == size:
+            return img_array
+        
+        # Same nearest-neighbour resize as keras load_img used during training
+        img = Image.fromarray(img_array).resize(size, Image.NEAREST)
+        return np.asarray(img, dtype=np.uint8)
+    
+    def _forward(self, batch):
+        """Run one forward pass over a preprocessed batch"""
+        return self.backend.forward(batch)
+    
+    def _infer(self, processed_img):
+        """Run inference for a single preprocessed image, through the micro-batcher if enabled"""
+        if self.batcher is not None:
+            return self.batcher.submit(processed_img).result()[np.newaxis]
+        return self._forward(processed_img)
+    
+    def warmup(self, extra_batch_sizes=()):
+        """Run synthetic inputs through every batch shape and code path used in serving"""
+        start_time = time.perf_counter()
+        max_batch = self.batcher.max_batch_size if self.batcher is not None else 1
+        batch_sizes = set(self.backend.batch_shapes(max_batch)) | set(extra_batch_sizes)
+        
+        # Test-time augmentation runs up to tta_max_views - 1 extra views in one batch, or all
+        # tta_max_views (the plain view included) when forced
+        batch_sizes = sorted(batch_sizes | set(self.backend.batch_shapes(self.tta_max_views - 1))
+                             | set(self.backend.batch_shapes(self.tta_max_views)))
+        timings = self.backend.warmup(batch_sizes)
+        if self.student is not None:
+            self.student.warmup([1])
+            self._full_ms = timings.get(1)
+        
+        # Exercise the full single-image path once (resize, batcher, result formatting)
+        self.predict(np.zeros((self.img_size, self.img_size, 3), dtype=np.uint8), top_k=5, return_probabilities=False,
+                     tta=False)
+        
+        # Time each augmentation (flips are far cheaper than rotations) so TTA respects tta_max_ms from the start
+        sample = np.zeros((2 * self.img_size, 2 * self.img_size, 3), dtype=np.uint8)
+        _tta_views(sample, (self.img_size, self.img_size), TTA_AUGMENTATIONS[1:])
+        for name in TTA_AUGMENTATIONS[1:]:
+            view_start = time.perf_counter()
+            preprocess_input(_tta_views(sample, (self.img_size, self.img_size), (name,)).astype(np.float32))
+            self._tta_view_cost[name] = (time.perf_counter() - view_start) * 1000.0 / (sample.shape[0] * sample.shape[1] / 1e6)
+        
+        # Warmup traffic does not count towards cascade statistics
+        with self._cascade_lock:
+            self._cascade_counts.clear()
+            self._cascade_saved_ms = 0.0
+        
+        self.warmup_stats = {
+            'seconds': time.perf_counter() - start_time,
+            'batch_sizes': batch_sizes,
+            'batch_ms': {str(size): round(ms, 2) for size, ms in timings.items()}
+        }
+        logger.info(f"Warmup completed in {self.warmup_stats['seconds']:.2f}s for batch sizes {batch_sizes}")
+        return self.warmup_stats
+    
+    def _warmup_batch_ms(self, rows):
+        """Warmup time of the smallest warmed-up batch holding rows images, extrapolated past the largest"""
+        batch_ms = {int(size): ms for size, ms in ((self.warmup_stats or {}).get('batch_ms') or {}).items()}
+        if not batch_ms:
+            return None
+        larger = [size for size in batch_ms if size >= rows]
+        if larger:
+            return batch_ms[min(larger)]
+        size = max(batch_ms)
+        return batch_ms[size] * rows / size
+    
+    def _tta_build_ms(self, augmentations, mpx):
+        """Warmup-based estimate of building the augmented views of an mpx-megapixel image, before calibration"""
+        return mpx * sum(self._tta_view_cost.get(name, 0.0) for name in augmentations)
+    
+    def _tta_batch_ms(self, rows, augmentations, mpx):
+        """Estimated time of a TTA pass: a forward pass over rows images plus building the augmented views"""
+        forward_ms = self._tta_forward_ms.get(rows)
+        if forward_ms is None:
+            forward_ms = self._warmup_batch_ms(rows)
+        if forward_ms is None:
+            return None
+        return forward_ms + self._tta_view_scale * self._tta_build_ms(augmentations, mpx)
+    
+    def _tta_view_budget(self, forced=False, mpx=0.0):
+        """Largest number of views whose estimated extra latency fits in tta_max_ms
+        
+        Forced TTA runs every view in one batch, so its extra latency is that batch minus
+        a plain single-image pass; the low-confidence trigger adds a batch of views - 1.
+        Forward costs come from warmup timings per batch size, refined by measured passes;
+        each view costs its warmup time scaled by the source image's megapixels (mpx). Without
+        warmup timings the cap cannot be estimated and is not applied.
+        """
+        if self.tta_max_ms is None:
+            return self.tta_max_views
+        base_ms = (self._warmup_batch_ms(1) or 0.0) if forced else 0.0
+        for views in range(self.tta_max_views, 1, -1):
+            batch_ms = self._tta_batch_ms(views if forced else views - 1, TTA_AUGMENTATIONS[1:views], mpx)
+            if batch_ms is None:
+                return self.tta_max_views
+            if batch_ms - base_ms <= self.tta_max_ms:
+                return views
+        return 1
+    
+    def _predict_tta(self, rgb, processed_img, trigger, base_probs=None):
+        """Run augmented views in one batch and aggregate them with the plain prediction
+        
+        Without base_probs (forced TTA) the plain view processed_img joins the batch, so
+        the whole prediction is one forward pass. Returns (probabilities, report);
+        probabilities is None when base_probs is given and the latency budget leaves no
+        room for an extra view.
+        """
+        forced = base_probs is None
+        mpx = rgb.shape[0] * rgb.shape[1] / 1e6
+        views = self._tta_view_budget(forced, mpx)
+        augmentations = TTA_AUGMENTATIONS[1:views]
+        report = {
+            'trigger': trigger,
+            'skipped': not augmentations,
+            'aggregate': self.tta_aggregate,
+            'views': 1 + len(augmentations),
+            'augmentations': list(TTA_AUGMENTATIONS[:views]),
+            'capped': views < self.tta_max_views,
+            'max_ms': self.tta_max_ms,
+        }
+        if not augmentations:
+            # Not even one extra view fits the latency cap; the result is the plain prediction
+            report.update({'views': 1, 'augmentations': ['identity'], 'extra_ms': 0.0, 'reason': 'latency_budget'})
+            with self._tta_lock:
+                self._tta_counts['skipped'] += 1
+            if forced:
+                base_probs = _to_probabilities(self._infer(processed_img))
+            report['base_confidence'] = float(base_probs.max())
+            return (base_probs if forced else None), report
+        
+        start_time = time.perf_counter()
+        batch = preprocess_input(_tta_views(rgb, (self.img_size, self.img_size), augmentations).astype(np.float32))
+        if forced:
+            batch = np.concatenate([processed_img, batch])
+        forward_start = time.perf_counter()
+        probs = _to_probabilities(self._forward(batch))
+        forward_ms = (time.perf_counter() - forward_start) * 1000.0
+        if forced:
+            base_probs, probs = probs[:1], probs[1:]
+        combined = _aggregate(np.concatenate([base_probs, probs]), self.tta_aggregate)[np.newaxis]
+        pass_ms = (time.perf_counter() - start_time) * 1000.0
+        # Extra latency over a plain prediction; a forced pass already includes the plain view
+        extra_ms = max(0.0, pass_ms - (self._warmup_batch_ms(1) or 0.0)) if forced else pass_ms
+        report.update({'base_confidence': float(base_probs.max()), 'extra_ms': round(extra_ms, 2)})
+        
+        with self._tta_lock:
+            previous = self._tta_forward_ms.get(len(batch))
+            self._tta_forward_ms[len(batch)] = forward_ms if previous is None else 0.8 * previous + 0.2 * forward_ms
+            estimated_ms = self._tta_build_ms(augmentations, mpx)
+            if estimated_ms > 0:
+                self._tta_view_scale = 0.8 * self._tta_view_scale + 0.2 * (pass_ms - forward_ms) / estimated_ms
+            self._tta_counts[trigger] += 1
+            if combined.argmax() != base_probs.argmax():
+                self._tta_counts['changed_prediction'] += 1
+            self._tta_extra_ms.append(extra_ms)
+        return combined, report
+    
+    def tta_stats(self):
+        """Return test-time augmentation usage and extra-latency statistics"""
+        with self._tta_lock:
+            extra_ms = np.array(self._tta_extra_ms)
+            return {
+                'threshold': self.tta_threshold,
+                'aggregate': self.tta_aggregate,
+                'max_views': self.tta_max_views,
+                'max_ms': self.tta_max_ms,
+                'view_budget': self._tta_view_budget(mpx=self.img_size * self.img_size / 1e6),
+                'forward_ms': {str(size): round(ms, 2) for size, ms in sorted(self._tta_forward_ms.items())},
+                'view_ms_per_mpx': {name: round(ms * self._tta_view_scale, 2) for name, ms in self._tta_view_cost.items()},
+                'runs': dict(self._tta_counts),
+                'extra_ms_p50': float(np.percentile(extra_ms, 50)) if extra_ms.size else 0.0,
+                'extra_ms_p99': float(np.percentile(extra_ms, 99)) if extra_ms.size else 0.0,
+            }
+    
+    def resolve_crop(self, crop):
+        """Return the canonical crop name for a user-supplied one, raising ValueError if unknown"""
+        resolved = self._crop_aliases.get(_crop_key(crop))
+        if resolved is None:
+            raise ValueError(f"Unknown crop: {crop}")
+        return resolved
+    
+    def crops(self):
+        """List the crops predictions can be scoped to, with their classes"""
+        return [{'crop': crop,
+                 'name': crop.replace('_', ' ').replace(' ,', ','),
+                 'classes': self.class_names[indices].tolist(),
+                 'head': crop in self.crop_heads}
+                for crop, indices in sorted(self.crop_indices.items())]
+    
+    def _build_crop_heads(self, heads_path=None):
+        """Per-crop (kernel, bias) heads over the backbone embedding, keyed by crop
+        
+        Heads need the backend's embeddings; a backend without classifier weights
+        (TFLite, remote) gets none, even from heads_path, and crop scoping masks.
+        """
+        weights = self.backend.classifier_weights()
+        if weights is None:
+            logger.warning(f"The {self.backend.name} backend exposes no embeddings; crop scoping will mask"
+                           + (f" and {heads_path} is ignored" if heads_path else ""))
+            return {}
+        kernel, bias = weights
+        heads = {crop: (kernel[:, indices], bias[indices]) for crop, indices in self.crop_indices.items()}
+        if heads_path:
+            with np.load(heads_path) as data:
+                for crop, indices in self.crop_indices.items():
+                    if f"{crop}/kernel" in data.files:
+                        kernel, bias = data[f"{crop}/kernel"], data[f"{crop}/bias"]
+                        if kernel.shape[-1] != len(indices):
+                            raise ValueError(f"Head for {crop} has {kernel.shape[-1]} outputs, expected {len(indices)}")
+                        heads[crop] = (kernel.astype(np.float32), bias.astype(np.float32))
+        logger.info(f"Loaded crop heads for {len(heads)} crops")
+        return heads
+    
+    def restrict_to_crop(self, probs, crop):
+        """Keep only the crop's classes and renormalize; returns (probs, class names, report)"""
+        indices = self.crop_indices[crop]
+        scoped = probs[:, indices]
+        mass = scoped.sum(axis=-1, keepdims=True)
+        with self._crop_lock:
+            self._crop_counts['mask'] += 1
+        # mass is how much probability the full model put on this crop at all
+        return scoped / np.maximum(mass, 1e-12), self.class_names[indices], {
+            'crop': crop, 'mode': 'mask', 'classes': len(indices), 'mass': round(float(mass[0, 0]), 4)}
+    
+    def _scope_regions(self, probs, crop):
+        """Restrict per-region probabilities to the crop, keeping the full class axis
+        
+        Returns (probs with other crops' classes zeroed, class columns of the crop, report);
+        the report's mass is averaged over regions.
+        """
+        indices = self.crop_indices[crop]
+        scoped, _, report = self.restrict_to_crop(probs, crop)
+        full = np.zeros_like(probs)
+        full[:, indices] = scoped
+        report['mass'] = round(float(probs[:, indices].sum(axis=1).mean()), 4)
+        return full, indices, report
+    
+    def _cached_embedding(self, processed_img):
+        """Backbone embedding for a preprocessed image, from the LRU cache when seen before"""
+        key = hashlib.blake2b(processed_img.tobytes(), digest_size=16).digest()
+        with self._crop_lock:
+            embedding = self._embedding_cache.get(key)
+            if embedding is not None:
+                self._embedding_cache.move_to_end(key)
+                self._crop_counts['embedding_hits'] += 1
+                return embedding, True
+        embedding = self.backend.embed(processed_img)
+        with self._crop_lock:
+            self._crop_counts['embedding_misses'] += 1
+            self._embedding_cache[key] = embedding
+            while len(self._embedding_cache) > self.embedding_cache_size:
+                self._embedding_cache.popitem(last=False)
+        return embedding, False
+    
+    def embed(self, img_path):
+        """Backbone embedding (float32 vector) of a path, bytes or RGB array, from the same LRU cache"""
+        return self._cached_embedding(self.preprocess_image(img_path))[0][0]
+    
+    def _predict_crop_head(self, processed_img, crop):
+        """Score only the crop's classes with its head; returns (probs, class names, report)"""
+        kernel, bias = self.crop_heads[crop]
+        embedding, cached = self._cached_embedding(processed_img)
+        probs = _softmax(embedding @ kernel + bias)
+        with self._crop_lock:
+            self._crop_counts['head'] += 1
+        return probs, self.class_names[self.crop_indices[crop]], {
+            'crop': crop, 'mode': 'head', 'classes': len(bias), 'embedding_cached': cached}
+    
+    def crop_stats(self):
+        """Return crop-scoped prediction counts and embedding cache usage"""
+        with self._crop_lock:
+            return {
+                'heads': len(self.crop_heads),
+                'predictions': {mode: self._crop_counts[mode] for mode in ('mask', 'head')},
+                'embedding_cache': {
+                    'entries': len(self._embedding_cache),
+                    'capacity': self.embedding_cache_size,
+                    'hits': self._crop_counts['embedding_hits'],
+                    'misses': self._crop_counts['embedding_misses'],
+                },
+            }
+    
+    def _student_input(self, images, processed):
+        """Student batch for decoded images, reusing the full model's tensor when input sizes match"""
+        size = self.student.input_size
+        if size == self.img_size:
+            return processed
+        batch = np.stack([np.asarray(Image.fromarray(img).resize((size, size), Image.NEAREST), dtype=np.float32)
+                          for img in images])
+        return preprocess_input(batch)
+    
+    def cascade_accepts(self, probs):
+        """Return (accepted, confidence, margin) per row of student probabilities"""
+        top = np.sort(probs, axis=-1)[:, -2:]
+        confidence = top[:, -1]
+        margin = top[:, -1] - top[:, 0]
+        return (confidence >= self.cascade_threshold) & (margin >= self.cascade_margin), confidence, margin
+    
+    def _predict_cascade(self, rgb, processed_img):
+        """Answer with the student when it is confident, otherwise escalate to the full model
+        
+        Returns (probabilities, report); saved_ms compares the student's latency with the
+        running estimate of a full-model call, and is negative when escalation added the
+        student's cost on top.
+        """
+        start_time = time.perf_counter()
+        student_probs = _to_probabilities(self.student.forward(self._student_input([rgb], processed_img)))
+        student_ms = (time.perf_counter() - start_time) * 1000.0
+        accepted, confidence, margin = self.cascade_accepts(student_probs)
+        
+        full_ms = None
+        if accepted[0]:
+            stage, probs = 'student', student_probs
+            saved_ms = self._full_ms - student_ms if self._full_ms is not None else None
+        else:
+            start_time = time.perf_counter()
+            probs = _to_probabilities(self._infer(processed_img))
+            full_ms = (time.perf_counter() - start_time) * 1000.0
+            stage, saved_ms = 'full', -student_ms
+        
+        with self._cascade_lock:
+            if full_ms is not None:
+                self._full_ms = full_ms if self._full_ms is None else 0.9 * self._full_ms + 0.1 * full_ms
+            self._cascade_counts[stage] += 1
+            if saved_ms is not None:
+                self._cascade_saved_ms += saved_ms
+        
+        return probs, {
+            'stage': stage,
+            'student_confidence': round(float(confidence[0]), 4),
+            'student_margin': round(float(margin[0]), 4),
+            'student_ms': round(student_ms, 2),
+            'full_ms': round(full_ms, 2) if full_ms is not None else None,
+            'saved_ms': round(saved_ms, 2) if saved_ms is not None else None,
+        }
+    
+    def cascade_stats(self):
+        """Return how often each cascade stage answered and the latency saved, or None without a student"""
+        if self.student is None:
+            return None
+        with self._cascade_lock:
+            total = sum(self._cascade_counts.values())
+            return {
+                'model_path': self.student.model_path,
+                'threshold': self.cascade_threshold,
+                'margin': self.cascade_margin,
+                'answered': dict(self._cascade_counts),
+                'student_rate': self._cascade_counts['student'] / total if total else 0.0,
+                'full_ms_estimate': self._full_ms,
+                'saved_ms': round(self._cascade_saved_ms, 1),
+            }
+    
+    def batching_stats(self):
+        """Return micro-batching statistics, or None when batching is disabled"""
+        return self.batcher.stats() if self.batcher is not None else None
+    
+    def close(self):
+        """Release background resources held by the detector"""
+        if self.batcher is not None:
+            self.batcher.stop()
+    
+    def format_results(self, probs, top_k=0, all_probabilities=False, probabilities=False, class_names=None):
+        """Build result dicts from an (N, num_classes) probability matrix
+        
+        Class and confidence are always included; 'top_k' (via argpartition), the
+        'all_probabilities' name->probability dict and the raw 'probabilities' vector
+        are only computed when asked for. class_names labels the columns when probs
+        covers a subset of classes.
+        """
+        class_names = self.class_names if class_names is None else class_names
+        top_idx, top_conf = _top_k(probs, max(1, top_k))
+        top_names = class_names[top_idx]
+        
+        results = []
+        for row in range(len(probs)):
+            result = {
+                'class': top_names[row, 0],
+                'confidence': float(top_conf[row, 0])
+            }
+            if top_k:
+                result['top_k'] = [{'class': name, 'confidence': float(conf)}
+                                   for name, conf in zip(top_names[row], top_conf[row])]
+            if all_probabilities:
+                result['all_probabilities'] = dict(zip(class_names.tolist(), probs[row].tolist()))
+            if probabilities:
+                result['probabilities'] = probs[row]
+            results.append(result)
+        return results
+    
+    def predict_batch(self, images, top_k=3, batch_size=32, return_probabilities=False, return_embeddings=False):
+        """Predict disease classes for a list of paths, raw bytes or decoded arrays
+        
+        Images are decoded into one contiguous float32 tensor per chunk of batch_size and
+        scored with a single forward pass; argmax and top-k run vectorized over the chunk.
+        Returns one compact result dict per input, in input order, each with its backbone
+        'embedding' from the same pass when return_embeddings is True.
+        """
+        results = [None] * len(images)
+        batch_size = max(1, int(batch_size))
+        
+        for start in range(0, len(images), batch_size):
+            chunk = images[start:start + batch_size]
+            
+            # Decode straight into a preallocated tensor; undecodable images get an error result
+            batch = np.empty((len(chunk), self.img_size, self.img_size, 3), dtype=np.float32)
+            valid = []
+            for i, source in enumerate(chunk):
+                try:
+                    batch[len(valid)] = self.load_rgb(source)
+                    valid.append(i)
+                except Exception as e:
+                    logger.error(f"Error decoding batch image {start + i}: {str(e)}")
+                    results[start + i] = {'class': 'Error', 'confidence': 0.0, 'error': str(e)}
+            if not valid:
+                continue
+            
+            batch = preprocess_input(batch[:len(valid)])
+            try:
+                if return_embeddings:
+                    outputs, embeddings = self.backend.forward_with_embeddings(batch)
+                    probs = _to_probabilities(outputs)
+                else:
+                    probs = _to_probabilities(self._forward(batch))
+            except Exception as e:
+                logger.error(f"Error during batch prediction: {str(e)}")
+                for i in valid:
+                    results[start + i] = {'class': 'Error', 'confidence': 0.0, 'error': str(e)}
+                continue
+            
+            for row, (i, result) in enumerate(zip(valid, self.format_results(probs, top_k=top_k,
+                                                                            probabilities=return_probabilities))):
+                if return_embeddings:
+                    result['embedding'] = embeddings[row]
+                results[start + i] = result
+        
+        logger.info(f"Batch prediction completed for {len(images)} image(s)")
+        return results
+    
+    def predict(self, img_path, top_k=0, return_probabilities=True, tta=None, crop=None, return_embedding=False):
+        """Predict the disease class for an image
+        
+        img_path may also be raw image bytes or an already decoded RGB array, so callers
+        holding the upload in memory skip the disk round-trip. A single forward pass yields
+        the class and confidence, the top_k ranking when top_k > 0 and the full
+        'all_probabilities' dict when return_probabilities is True.
+        
+        tta=True forces test-time augmentation, tta=False disables it and None applies it
+        only below tta_threshold; when it runs, the result carries a 'tta' report. With a
+        cascade model the result carries a 'cascade' report naming the stage that answered;
+        forcing TTA bypasses the student and scores the plain view in the augmented batch.
+        
+        crop limits the prediction to that crop's classes (see __init__) and adds a 'crop' report.
+        
+        return_embedding=True adds the backbone 'embedding' (float32 vector, the final Dense
+        layer's input) taken from the same forward pass as the prediction; that pass runs the
+        full model directly, without the micro-batcher or the cascade student.
+        """
         try:
             # Check if file exists
-            if not os.path.exists(img_path):
+            if isinstance(img_path, str) and not os.path.exists(img_path):
                 raise FileNotFoundError(f"Image file not found: {img_path}")
+            
+            crop = self.resolve_crop(crop) if crop else None
+            
+            # Decode once at no less than model resolution; TTA crops reuse the same pixels
+            rgb = img_path
+            if not isinstance(img_path, np.ndarray):
+                rgb = decode_image(img_path, min_size=(self.img_size, self.img_size), quality=self.decode_quality)
+            rgb = _as_rgb_uint8(rgb)
                 
             # Preprocess the image
-            processed_img = self.preprocess_image(img_path)
+            processed_img = self.preprocess_image(rgb)
             
             # Make prediction
-            logger.info(f"Making prediction for {img_path}")
+            source = img_path if isinstance(img_path, str) else f"in-memory image {getattr(img_path, 'shape', '')}"
+            logger.info(f"Making prediction for {source}")
             
-            # Use a timeout to prevent hanging on large images
-            predictions = self.model.predict(processed_img, verbose=0)
+            # Crop-specific head: only the crop's classes are scored, from the cached embedding
+            if crop is not None and crop in self.crop_heads:
+                probs, class_names, crop_report = self._predict_crop_head(processed_img, crop)
+                result = self.format_results(probs, top_k=top_k, all_probabilities=return_probabilities,
+                                             class_names=class_names)[0]
+                result['crop'] = crop_report
+                if return_embedding:
+                    result['embedding'] = self._cached_embedding(processed_img)[0][0]
+                logger.info(f"Prediction result: {result['class']} with confidence {result['confidence']:.4f} ({crop} head)")
+                return result
             
-            # Get the predicted class index and probability
-            pred_class_idx = np.argmax(predictions[0])
-            confidence = float(predictions[0][pred_class_idx])
+            cascade_report = None
+            tta_report = None
+            embedding = None
+            if tta and not return_embedding:
+                # Forced TTA: the plain view rides in the augmented batch, one forward pass
+                probs, tta_report = self._predict_tta(rgb, processed_img, 'request')
+            elif return_embedding:
+                outputs, embedding = self.backend.forward_with_embeddings(processed_img)
+                probs = _to_probabilities(outputs)
+            elif self.student is not None and not tta:
+                probs, cascade_report = self._predict_cascade(rgb, processed_img)
+            else:
+                probs = _to_probabilities(self._infer(processed_img))
             
-            # Get the class name
-            if isinstance(pred_class_idx, (np.int64, np.int32)):
-                pred_class_idx = int(pred_class_idx)
-                
-            pred_class = self.classes.get(pred_class_idx, f"Unknown_{pred_class_idx}")
+            # Test-time augmentation on low confidence of the full model, or forced alongside an embedding
+            answered_by_student = cascade_report is not None and cascade_report['stage'] == 'student'
+            low_confidence = self.tta_threshold is not None and probs.max() < self.tta_threshold
+            if tta_report is None and (tta or (tta is None and low_confidence and not answered_by_student)):
+                tta_probs, tta_report = self._predict_tta(rgb, processed_img, 'request' if tta else 'low_confidence',
+                                                          base_probs=probs)
+                if tta_probs is not None:
+                    probs = tta_probs
             
-            # Create a dictionary of all probabilities
-            all_probabilities = {}
-            for i, prob in enumerate(predictions[0]):
-                class_name = self.classes.get(i, f"Unknown_{i}")
-                all_probabilities[class_name] = float(prob)
+            # Restrict the label space to the requested crop
+            class_names, crop_report = None, None
+            if crop is not None:
+                probs, class_names, crop_report = self.restrict_to_crop(probs, crop)
             
-            # Return prediction results
-            result = {
-                'class': pred_class,
-                'confidence': confidence,
-                'all_probabilities': all_probabilities
-            }
+            result = self.format_results(probs, top_k=top_k, all_probabilities=return_probabilities,
+                                         class_names=class_names)[0]
+            if crop_report is not None:
+                result['crop'] = crop_report
+            if tta_report is not None:
+                result['tta'] = tta_report
+            if cascade_report is not None:
+                result['cascade'] = cascade_report
+            if embedding is not None:
+                result['embedding'] = embedding[0]
             
-            logger.info(f"Prediction result: {pred_class} with confidence {confidence:.4f}")
+            logger.info(f"Prediction result: {result['class']} with confidence {result['confidence']:.4f}")
             return result
             
         except Exception as e:
             logger.error(f"Error during prediction: {str(e)}")
             # Return a structured error response that won't break the app
-            return {
+            result = {
                 'class': 'Error',
                 'confidence': 0.0,
-                'all_probabilities': {'Error': 1.0},
                 'error': str(e)
             }
+            if top_k:
+                result['top_k'] = [{'class': 'Error', 'confidence': 0.0}]
+            if return_probabilities:
+                result['all_probabilities'] = {'Error': 1.0}
+            return result
     
-    def get_top_predictions(self, img_path, top_k=3):
-        """Get the top k predictions for an image"""
+    def _disease_verdict(self, probs, disease_threshold, weights=None):
+        """Combine per-region probabilities so one healthy region cannot mask a diseased one
+        
+        Returns (verdict, disease_scores, aggregate): when any region's disease score
+        (1 - healthy probability) reaches disease_threshold the verdict is the per-class max
+        over regions with healthy classes zeroed ('max_disease'), otherwise the (weighted) mean.
+        """
+        disease_scores = 1.0 - probs[:, self.healthy_mask].sum(axis=1)
+        if self.healthy_mask.any() and disease_scores.max() >= disease_threshold:
+            return np.where(self.healthy_mask, 0.0, probs.max(axis=0)), disease_scores, 'max_disease'
+        return np.average(probs, axis=0, weights=weights), disease_scores, 'mean'
+    
+    def predict_leaves(self, img_path, max_regions=8, min_area_fraction=0.02, top_k=3, disease_threshold=0.5, crop=None):
+        """Locate individual leaves and classify each one in a single batched forward pass
+        
+        Leaves are found by color segmentation (leaf_segmentation.find_leaf_regions), capped at
+        the max_regions largest so latency stays bounded. Each crop is resized to model
+        resolution like a whole upload. When no leaf is found the whole frame is the only
+        region. The overall verdict follows _disease_verdict, weighting healthy leaves by area;
+        the 'leaves' entry lists every region with its box in original-image pixels. crop
+        restricts every leaf to that crop's classes and adds a 'crop' report.
+        """
         try:
-            # Preprocess the image
-            processed_img = self.preprocess_image(img_path)
+            crop = self.resolve_crop(crop) if crop else None
+            rgb = img_path
+            if not isinstance(img_path, np.ndarray):
+                min_side = self.img_size * 3
+                rgb = decode_image(img_path, min_size=(min_side, min_side), quality=self.decode_quality)
+            rgb = _as_rgb_uint8(rgb)
+            h, w = rgb.shape[:2]
+            
+            start_time = time.perf_counter()
+            regions = find_leaf_regions(rgb, max_regions=max(1, int(max_regions)), min_area_fraction=min_area_fraction)
+            segmentation_ms = (time.perf_counter() - start_time) * 1000.0
+            fallback = not regions
+            if fallback:
+                regions = [{'box': [0, 0, w, h], 'area_fraction': 1.0}]
+            
+            # All crops in one tensor and one forward pass
+            batch = np.empty((len(regions), self.img_size, self.img_size, 3), dtype=np.float32)
+            for i, region in enumerate(regions):
+                x, y, bw, bh = region['box']
+                batch[i] = self.load_rgb(np.ascontiguousarray(rgb[y:y + bh, x:x + bw]))
+            start_time = time.perf_counter()
+            probs = _to_probabilities(self._forward(preprocess_input(batch)))
+            inference_ms = (time.perf_counter() - start_time) * 1000.0
+            columns, class_names, crop_report = slice(None), None, None
+            if crop is not None:
+                probs, columns, crop_report = self._scope_regions(probs, crop)
+                class_names = self.class_names[columns]
+            
+            areas = np.array([region['area_fraction'] for region in regions])
+            verdict, disease_scores, aggregate = self._disease_verdict(probs, disease_threshold, weights=areas)
+            result = self.format_results(verdict[np.newaxis, columns], top_k=top_k, class_names=class_names)[0]
+            if crop_report is not None:
+                result['crop'] = crop_report
+            
+            leaf_results = self.format_results(probs[:, columns], top_k=top_k, class_names=class_names)
+            for region, leaf_result, score in zip(regions, leaf_results, disease_scores):
+                region.update(leaf_result, disease_score=round(float(score), 4))
+            result['leaves'] = {
+                'count': len(regions),
+                'fallback': fallback,
+                'aggregate': aggregate,
+                'max_regions': int(max_regions),
+                'image_size': [w, h],
+                'regions': regions,
+                'segmentation_ms': round(segmentation_ms, 2),
+                'inference_ms': round(inference_ms, 2),
+            }
+            logger.info(f"Leaf prediction over {len(regions)} region(s): {result['class']} ({aggregate}) "
+                        f"in {segmentation_ms + inference_ms:.0f} ms")
+            return result
             
-            # Make prediction
-            predictions = self.model.predict(processed_img, verbose=0)
-            
-            # Get top k indices
-            top_indices = np.argsort(predictions[0])[-top_k:][::-1]
-            
-            # Create result
-            top_predictions = []
-            for idx in top_indices:
-                class_name = self.classes.get(int(idx), f"Unknown_{idx}")
-                confidence = float(predictions[0][idx])
-                top_predictions.append({
-                    'class': class_name,
-                    'confidence': confidence
-                })
-            
-            return top_predictions
         except Exception as e:
-            logger.error(f"Error getting top predictions: {str(e)}")
-            return [{'class': 'Error', 'confidence': 0.0}]
+            logger.error(f"Error during leaf prediction: {str(e)}")
+            return {'class': 'Error', 'confidence': 0.0, 'error': str(e), 'top_k': [{'class': 'Error', 'confidence': 0.0}]}
+    
+    def predict_tiles(self, img_path, stride=None, max_side=None, batch_size=32, top_k=3, disease_threshold=0.5,
+                      crop=None):
+        """Sliding-window inference for high-resolution field and drone images
+        
+        The image is scaled so its long side is at most max_side (default 4x the model input)
+        and cut into overlapping model-resolution windows every stride pixels (default half
+        a tile). Windows are strided views of the image and only batch_size tiles are
+        materialized at a time. The verdict is the most confident disease class over all
+        tiles when any tile's disease score (1 - healthy probability) reaches
+        disease_threshold, otherwise the mean over tiles. The 'tiles' entry holds the
+        per-tile grid for heatmap rendering. crop restricts every tile to that crop's classes
+        and adds a 'crop' report.
+        """
+        try:
+            crop = self.resolve_crop(crop) if crop else None
+            tile = self.img_size
+            stride = int(stride or tile // 2)
+            max_side = int(max_side or tile * 4)
+            
+            # Decode and scale to the analysis resolution
+            rgb = img_path
+            if not isinstance(img_path, np.ndarray):
+                rgb = decode_image(img_path, min_size=(max_side, max_side), quality='fast')
+            rgb = _as_rgb_uint8(rgb)
+            h, w = rgb.shape[:2]
+            scale = max(min(1.0, max_side / max(h, w)), tile / min(h, w))
+            if scale != 1.0:
+                size = (max(tile, int(round(w * scale))), max(tile, int(round(h * scale))))
+                rgb = np.asarray(Image.fromarray(rgb).resize(size, Image.BILINEAR), dtype=np.uint8)
+                h, w = rgb.shape[:2]
+            
+            # (H - tile + 1, W - tile + 1, tile, tile, 3) view; nothing is copied here
+            windows = np.lib.stride_tricks.sliding_window_view(rgb, (tile, tile), axis=(0, 1)).transpose(0, 1, 3, 4, 2)
+            ys, xs = _tile_starts(h, tile, stride), _tile_starts(w, tile, stride)
+            grid_y, grid_x = [a.ravel() for a in np.meshgrid(ys, xs, indexing='ij')]
+            
+            start_time = time.perf_counter()
+            outputs = []
+            for start in range(0, len(grid_y), batch_size):
+                chunk = windows[grid_y[start:start + batch_size], grid_x[start:start + batch_size]]
+                outputs.append(_to_probabilities(self._forward(preprocess_input(chunk.astype(np.float32)))))
+            tile_probs = np.concatenate(outputs)
+            inference_ms = (time.perf_counter() - start_time) * 1000.0
+            columns, class_names, crop_report = slice(None), None, None
+            if crop is not None:
+                tile_probs, columns, crop_report = self._scope_regions(tile_probs, crop)
+                class_names = self.class_names[columns]
+            
+            # Verdict: strongest disease evidence in any tile, or the mean when every tile looks healthy
+            verdict, disease_scores, aggregate = self._disease_verdict(tile_probs, disease_threshold)
+            result = self.format_results(verdict[np.newaxis, columns], top_k=top_k, class_names=class_names)[0]
+            if crop_report is not None:
+                result['crop'] = crop_report
+            
+            tile_classes = self.class_names[tile_probs.argmax(axis=1)]
+            votes = collections.Counter(str(name) for name in tile_classes)
+            rows, cols = len(ys), len(xs)
+            result['tiles'] = {
+                'aggregate': aggregate,
+                'rows': rows,
+                'cols': cols,
+                'tile_size': tile,
+                'stride': stride,
+                'analysis_size': [w, h],
+                'scale': scale,
+                'ys': ys.tolist(),
+                'xs': xs.tolist(),
+                'disease_scores': np.round(disease_scores.reshape(rows, cols), 4).tolist(),
+                'classes': tile_classes.reshape(rows, cols).tolist(),
+                'confidences': np.round(tile_probs.max(axis=1).reshape(rows, cols), 4).tolist(),
+                'votes': dict(votes.most_common()),
+                'disease_fraction': float((~self.healthy_mask[tile_probs.argmax(axis=1)]).mean()),
+                'inference_ms': round(inference_ms, 2),
+            }
+            logger.info(f"Tiled prediction over {rows}x{cols} tiles: {result['class']} ({aggregate}) in {inference_ms:.0f} ms")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Error during tiled prediction: {str(e)}")
+            return {'class': 'Error', 'confidence': 0.0, 'error': str(e), 'top_k': [{'class': 'Error', 'confidence': 0.0}]}
+    
+    def explain(self, img_path, class_name=None):
+        """Grad-CAM heatmap of the regions that drove the prediction
+        
+        Explains class_name when given, otherwise the predicted class. Returns a dict with
+        the 'heatmap' (float32, 0-1, at the last feature map's resolution), the explained
+        'class' and its 'confidence', and 'explain_ms'; the Keras backend is required.
+        """
+        start_time = time.perf_counter()
+        class_index = None
+        if class_name is not None:
+            matches = np.flatnonzero(self.class_names == class_name)
+            if not len(matches):
+                raise ValueError(f"Unknown class: {class_name}")
+            class_index = int(matches[0])
+        
+        maps, outputs = self.backend.gradcam(self.preprocess_image(img_path), class_index)
+        probs = _to_probabilities(outputs)[0]
+        if class_index is None:
+            class_index = int(probs.argmax())
+        explain_ms = (time.perf_counter() - start_time) * 1000.0
+        logger.info(f"Grad-CAM for {self.class_names[class_index]} in {explain_ms:.0f} ms")
+        return {
+            'heatmap': maps[0],
+            'class': self.class_names[class_index],
+            'confidence': float(probs[class_index]),
+            'explain_ms': round(explain_ms, 2),
+        }
+    
+    def get_top_predictions(self, img_path, top_k=3):
+        """Get the top k predictions for an image"""
+        result = self.predict(img_path, top_k=top_k, return_probabilities=False)
+        return result.get('top_k', [])
 
 # For testing the module directly
 if __name__ == "__main__":
@@ -174,14 +1155,13 @@ if __name__ == "__main__":
         # Test with a sample image if provided
         test_image = "test_image.jpg"  # Replace with an actual test image path
         if os.path.exists(test_image):
-            result = detector.predict(test_image)
+            result = detector.predict(test_image, top_k=3, return_probabilities=False)
             print(f"Prediction: {result['class']}")
             print(f"Confidence: {result['confidence']:.4f}")
             
-            # Get top 3 predictions
-            top_preds = detector.get_top_predictions(test_image, top_k=3)
+            # Top 3 predictions from the same forward pass
             print("\nTop 3 predictions:")
-            for i, pred in enumerate(top_preds, 1):
+            for i, pred in enumerate(result['top_k'], 1):
                 print(f"{i}. {pred['class']} ({pred['confidence']:.4f})")
         else:
             print(f"Test image not found: {test_image}")
@@ -0,0 +1,168 @@
+# derivatives.py
+"""Size-bounded cache of resized and re-encoded image derivatives.
+
+Result pages show uploads and visualizations at a few fixed widths, and
+serving the full-size JPEG for a 160px thumbnail wastes bandwidth on every
+view. A derivative (source image, width, format) is rendered on first
+request with OpenCV, encoded as JPEG or WebP at a tuned quality, written to
+the cache directory and indexed with a strong ETag (a digest of its bytes).
+The total size of the directory is capped; the least recently served
+derivatives are evicted first. A derivative older than its source (e.g. a
+regenerated visualization) is rendered again.
+"""
+import os
+import time
+import hashlib
+import threading
+import collections
+
+# Format name -> (file extension, MIME type)
+FORMATS = {
+    'jpeg': ('.jpg', 'image/jpeg'),
+    'webp': ('.webp', 'image/webp'),
+}
+
+
+def content_etag(data):
+    """Strong ETag value for a byte string"""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class DerivativeCache:
+    """Render, store and index resized JPEG/WebP copies of source images"""
+
+    def __init__(self, directory, max_bytes=64 * 1024 * 1024, jpeg_quality=82, webp_quality=78):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.jpeg_quality = jpeg_quality
+        self.webp_quality = webp_quality
+        os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._inflight = {}
+        # name -> {'size', 'etag' (None until first served after a restart)}, least recently used first
+        self._index = collections.OrderedDict()
+        self._bytes = 0
+        entries = []
+        for name in os.listdir(directory):
+            path = os.path.join(directory, name)
+            if os.path.isfile(path) and not name.startswith('.'):
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, name, stat.st_size))
+        for _, name, size in sorted(entries):
+            self._index[name] = {'size': size, 'etag': None}
+            self._bytes += size
+
+        # Metrics
+        self._hits = 0
+        self._renders = 0
+        self._evictions = 0
+        self._render_ms = collections.deque(maxlen=1024)
+
+    def name(self, source_name, width, fmt):
+        """File name of a derivative in the cache directory"""
+        return f"{os.path.splitext(source_name)[0]}.w{width}{FORMATS[fmt][0]}"
+
+    def get(self, source_path, width, fmt='jpeg'):
+        """Return (path, etag, mimetype) of the derivative, rendering it if needed
+
+        Raises FileNotFoundError when the source is missing and ValueError for an
+        unknown format or an image that cannot be decoded.
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Unknown image format: {fmt}")
+        if not os.path.exists(source_path):
+            raise FileNotFoundError(f"Source image not found: {os.path.basename(source_path)}")
+        name = self.name(os.path.basename(source_path), width, fmt)
+        path = os.path.join(self.directory, name)
+
+        with self._lock:
+            entry = self._index.get(name)
+            fresh = entry is not None and os.path.exists(path) and \
+                os.path.getmtime(path) >= os.path.getmtime(source_path)
+            if fresh and entry['etag'] is not None:
+                self._index.move_to_end(name)
+                self._hits += 1
+                return path, entry['etag'], FORMATS[fmt][1]
+            flight = self._inflight.setdefault(name, threading.Lock())
+
+        with flight:
+            try:
+                if fresh:
+                    with open(path, 'rb') as f:
+                        data, rendered = f.read(), False
+                else:
+                    data, rendered = self._render(source_path, width, fmt), True
+                    tmp_path = os.path.join(self.directory, f".{name}.tmp")
+                    with open(tmp_path, 'wb') as f:
+                        f.write(data)
+                    os.replace(tmp_path, path)
+            finally:
+                with self._lock:
+                    self._inflight.pop(name, None)
+
+        etag = content_etag(data)
+        with self._lock:
+            previous = self._index.pop(name, None)
+            if previous is not None:
+                self._bytes -= previous['size']
+            self._index[name] = {'size': len(data), 'etag': etag}
+            self._bytes += len(data)
+            if rendered:
+                self._renders += 1
+            else:
+                self._hits += 1
+            self._evict(keep=name)
+        return path, etag, FORMATS[fmt][1]
+
+    def _render(self, source_path, width, fmt):
+        """Resize the source to width (never upscaling) and encode it"""
+        import cv2
+
+        start_time = time.perf_counter()
+        img = cv2.imread(source_path, cv2.IMREAD_COLOR)
+        if img is None:
+            raise ValueError(f"Cannot decode {os.path.basename(source_path)}")
+        h, w = img.shape[:2]
+        if w > width:
+            img = cv2.resize(img, (width, max(1, round(h * width / w))), interpolation=cv2.INTER_AREA)
+
+        if fmt == 'webp':
+            ok, encoded = cv2.imencode('.webp', img, [cv2.IMWRITE_WEBP_QUALITY, self.webp_quality])
+        else:
+            ok, encoded = cv2.imencode('.jpg', img, [cv2.IMWRITE_JPEG_QUALITY, self.jpeg_quality,
+                                                     cv2.IMWRITE_JPEG_OPTIMIZE, 1])
+        if not ok:
+            raise ValueError(f"Cannot encode {os.path.basename(source_path)} as {fmt}")
+        with self._lock:
+            self._render_ms.append((time.perf_counter() - start_time) * 1000.0)
+        return encoded.tobytes()
+
+    def _evict(self, keep):
+        """Drop least recently served derivatives until the cache fits its byte budget"""
+        while self._bytes > self.max_bytes and len(self._index) > 1:
+            name, entry = next(iter(self._index.items()))
+            if name == keep:
+                self._index.move_to_end(name)
+                continue
+            del self._index[name]
+            self._bytes -= entry['size']
+            self._evictions += 1
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def stats(self):
+        """Return cache size, hit/render/eviction counts and mean render time"""
+        with self._lock:
+            render_ms = list(self._render_ms)
+            return {
+                'entries': len(self._index),
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'renders': self._renders,
+                'evictions': self._evictions,
+                'mean_render_ms': sum(render_ms) / len(render_ms) if render_ms else 0.0,
+            }
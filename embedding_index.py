@@ -0,0 +1,282 @@
+# embedding_index.py
+"""Append-only, memory-mapped embedding index with top-k cosine search.
+
+Vectors are L2-normalized and stored as rows of a float16 matrix in
+<path>.f16, with one JSON line per row in the <path>.ids.jsonl sidecar
+(the row id plus optional metadata). Appends write only the new rows at the
+end of both files, so growing the index never rewrites it; the matrix is
+re-mapped read-only afterwards. Appends from several processes (gunicorn
+workers, build_case_index.py next to the app) are serialized with an
+exclusive lock on <path>.lock, and each instance picks up rows other
+processes appended before it writes or searches. If a crash leaves the two
+files with different lengths, only the rows with a complete sidecar line
+count and the rest is trimmed by the next append.
+
+Queries are exact by default: the matrix is scanned in chunks with one
+matrix-vector product each. An optional IVF layer (train_ivf) clusters
+the vectors with spherical k-means, stores each row's list number in
+<path>.ivf.i32 and keeps the inverted lists in memory, so a query only
+scores the rows of its nprobe nearest lists. Rows appended after training
+are assigned to their nearest list as they arrive.
+"""
+import os
+import json
+import threading
+import contextlib
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are only serialized within the process
+    fcntl = None
+
+CHUNK_ROWS = 65536
+
+
+def _normalize(vectors):
+    vectors = np.atleast_2d(np.asarray(vectors, dtype=np.float32))
+    return vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+
+
+def _top_k(scores, k):
+    """Indices of the k largest scores, sorted descending"""
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+    idx = np.argpartition(-scores, k - 1)[:k]
+    return idx[np.argsort(-scores[idx], kind='stable')]
+
+
+class EmbeddingIndex:
+    """Memory-mapped float16 embedding matrix with an id sidecar and optional IVF lists"""
+
+    def __init__(self, path, dim=None):
+        self.path = path
+        self.matrix_path = f"{path}.f16"
+        self.ids_path = f"{path}.ids.jsonl"
+        self.meta_path = f"{path}.meta.json"
+        self.centroids_path = f"{path}.ivf.npz"
+        self.assign_path = f"{path}.ivf.i32"
+        self.lock_path = f"{path}.lock"
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self._lock = threading.Lock()
+        self.dim = dim
+        self._records = []
+        self._ids = set()
+        self._ids_offset = 0  # Sidecar bytes already read, always at a line boundary
+        self._matrix = None
+        self._count = 0
+
+        # Inverted lists, when an IVF layer has been trained
+        self.centroids = None
+        self._centroids_version = None
+        self._lists = None
+        self._listed = 0  # Rows already placed in the inverted lists
+        with self._lock:
+            self._sync()
+        if dim is not None and self.dim != dim:
+            raise ValueError(f"Index {path} holds {self.dim}-d vectors, not {dim}-d")
+
+    @contextlib.contextmanager
+    def _file_lock(self):
+        """Exclusive lock shared by every process writing this index"""
+        with open(self.lock_path, 'a') as f:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _sync(self):
+        """Pick up rows, metadata and IVF lists written since the last sync (callers hold _lock)"""
+        if self.dim is None and os.path.exists(self.meta_path):
+            with open(self.meta_path, 'r') as f:
+                self.dim = json.load(f)['dim']
+
+        # New complete sidecar lines; a torn final line is left for the next sync
+        if os.path.exists(self.ids_path) and os.path.getsize(self.ids_path) > self._ids_offset:
+            with open(self.ids_path, 'rb') as f:
+                f.seek(self._ids_offset)
+                data = f.read()
+            complete = data[:data.rfind(b'\n') + 1]
+            records = [json.loads(line) for line in complete.decode('utf-8').splitlines()]
+            self._records.extend(records)
+            self._ids.update(record['id'] for record in records)
+            self._ids_offset += len(complete)
+
+        # Rows count once they are present in both files
+        rows = 0
+        if self.dim and os.path.exists(self.matrix_path):
+            rows = os.path.getsize(self.matrix_path) // (self.dim * 2)
+        count = min(rows, len(self._records))
+        if count != self._count or (count and self._matrix is None):
+            self._count = count
+            self._matrix = np.memmap(self.matrix_path, dtype=np.float16, mode='r',
+                                     shape=(count, self.dim)) if count else None
+
+        # IVF layer: reload when (re)trained anywhere, otherwise extend the lists with new rows
+        version = os.stat(self.centroids_path).st_mtime_ns if os.path.exists(self.centroids_path) else None
+        if version != self._centroids_version:
+            self._centroids_version = version
+            self.centroids, self._lists, self._listed = None, None, 0
+            if version is not None:
+                with np.load(self.centroids_path) as data:
+                    self.centroids = data['centroids']
+                self._lists = [np.empty(0, dtype=np.int64) for _ in range(len(self.centroids))]
+        if self.centroids is not None and self._count > self._listed:
+            assign = np.fromfile(self.assign_path, dtype=np.int32)[self._listed:self._count] \
+                if os.path.exists(self.assign_path) else np.empty(0, dtype=np.int32)
+            self._extend_lists(self._listed, assign)
+
+    def _extend_lists(self, first, assign):
+        """Add rows first, first + 1, ... with the given list numbers to the inverted lists"""
+        order = np.argsort(assign, kind='stable')
+        bounds = np.searchsorted(assign[order], np.arange(len(self.centroids) + 1))
+        for list_id in range(len(self.centroids)):
+            if bounds[list_id + 1] > bounds[list_id]:
+                rows = first + order[bounds[list_id]:bounds[list_id + 1]]
+                self._lists[list_id] = np.concatenate([self._lists[list_id], rows])
+        self._listed = first + len(assign)
+
+    def __len__(self):
+        with self._lock:
+            self._sync()
+            return self._count
+
+    def __contains__(self, row_id):
+        with self._lock:
+            self._sync()
+            return str(row_id) in self._ids
+
+    def add(self, ids, vectors, metadata=None):
+        """Append vectors with their ids (and optional per-row metadata dicts)"""
+        vectors = _normalize(vectors)
+        if len(ids) != len(vectors):
+            raise ValueError("ids and vectors differ in length")
+        metadata = metadata or [{}] * len(ids)
+        with self._lock, self._file_lock():
+            self._sync()
+            if self.dim is None:
+                self.dim = vectors.shape[1]
+                with open(self.meta_path, 'w') as f:
+                    json.dump({'dim': self.dim, 'dtype': 'float16'}, f)
+            if vectors.shape[1] != self.dim:
+                raise ValueError(f"Expected {self.dim}-d vectors, got {vectors.shape[1]}-d")
+
+            # The new rows go after the last row with a complete sidecar line, as seen by every process;
+            # bytes past it in any file are left over from an interrupted append
+            first = self._count
+            self._truncate(self.matrix_path, first * self.dim * 2)
+            self._truncate(self.ids_path, self._ids_offset)
+            with open(self.matrix_path, 'ab') as f:
+                f.write(vectors.astype(np.float16).tobytes())
+            records = [dict(meta, id=str(row_id)) for row_id, meta in zip(ids, metadata)]
+            with open(self.ids_path, 'a') as f:
+                f.write(''.join(json.dumps(record) + '\n' for record in records))
+
+            if self.centroids is not None:
+                # List numbers stay aligned with the rows: trim leftovers, fill in any missing ones
+                self._truncate(self.assign_path, first * 4)
+                assigned = os.path.getsize(self.assign_path) // 4 if os.path.exists(self.assign_path) else 0
+                with open(self.assign_path, 'r+b' if assigned else 'wb') as f:
+                    f.seek(assigned * 4)
+                    if assigned < first:
+                        f.write(self._assign(self._matrix[assigned:first].astype(np.float32)).astype(np.int32).tobytes())
+                    f.write(self._assign(vectors).astype(np.int32).tobytes())
+            self._sync()
+        return first
+
+    @staticmethod
+    def _truncate(path, size):
+        """Cut a file back to size bytes if it is longer"""
+        if os.path.exists(path) and os.path.getsize(path) > size:
+            with open(path, 'r+b') as f:
+                f.truncate(size)
+
+    def _assign(self, vectors):
+        """Nearest centroid of each normalized vector"""
+        return np.concatenate([(vectors[i:i + CHUNK_ROWS] @ self.centroids.T).argmax(axis=1)
+                               for i in range(0, len(vectors), CHUNK_ROWS)])
+
+    def train_ivf(self, nlist=None, iterations=10, sample_size=None, seed=0):
+        """Cluster the stored vectors into nlist lists (default ~sqrt(rows)) and assign every row"""
+        with self._lock, self._file_lock():
+            self._sync()
+            if not self._count:
+                raise ValueError("Cannot train an IVF layer on an empty index")
+            nlist = int(nlist or max(1, int(np.sqrt(self._count))))
+            nlist = min(nlist, self._count)
+            rng = np.random.default_rng(seed)
+            sample_size = min(self._count, sample_size or 32 * nlist)
+            sample = np.sort(rng.choice(self._count, sample_size, replace=False))
+            data = self._matrix[sample].astype(np.float32)
+
+            # Spherical k-means: centroids stay on the unit sphere so dot products are cosines
+            centroids = data[rng.choice(len(data), nlist, replace=False)]
+            for _ in range(iterations):
+                assign = (data @ centroids.T).argmax(axis=1)
+                sums = np.zeros_like(centroids)
+                np.add.at(sums, assign, data)
+                empty = np.flatnonzero(np.bincount(assign, minlength=nlist) == 0)
+                sums[empty] = data[rng.choice(len(data), len(empty))]
+                centroids = _normalize(sums)
+
+            self.centroids = centroids.astype(np.float32)
+            assign = np.concatenate([self._assign(self._matrix[i:i + CHUNK_ROWS].astype(np.float32))
+                                     for i in range(0, self._count, CHUNK_ROWS)])
+            assign.astype(np.int32).tofile(self.assign_path)
+            np.savez(self.centroids_path, centroids=self.centroids)
+            self._centroids_version = None  # Reload the lists from the files just written
+            self._sync()
+        return nlist
+
+    def search(self, query, k=5, nprobe=8, exact=False):
+        """Top-k rows by cosine similarity as a list of metadata dicts with a 'score' key
+
+        With an IVF layer only the nprobe nearest lists are scored unless exact=True.
+        """
+        query = _normalize(query)[0]
+        with self._lock:
+            self._sync()
+            matrix, count, lists, centroids = self._matrix, self._count, self._lists, self.centroids
+        if not count:
+            return []
+
+        if centroids is not None and not exact:
+            probes = _top_k(centroids @ query, nprobe)
+            rows = np.sort(np.concatenate([lists[p] for p in probes]))
+            scores = matrix[rows].astype(np.float32) @ query
+            best = rows[_top_k(scores, k)]
+            best_scores = scores[np.searchsorted(rows, best)]
+        else:
+            # Exact scan in chunks so a large float16 matrix is never widened at once
+            candidates, candidate_scores = [], []
+            for start in range(0, count, CHUNK_ROWS):
+                scores = matrix[start:start + CHUNK_ROWS].astype(np.float32) @ query
+                top = _top_k(scores, k)
+                candidates.append(start + top)
+                candidate_scores.append(scores[top])
+            candidates, candidate_scores = np.concatenate(candidates), np.concatenate(candidate_scores)
+            order = _top_k(candidate_scores, k)
+            best, best_scores = candidates[order], candidate_scores[order]
+
+        # float16 rounding can push a self-match slightly past 1
+        best_scores = np.clip(best_scores, -1.0, 1.0)
+        return [dict(self._records[row], score=round(float(score), 4)) for row, score in zip(best, best_scores)]
+
+    def stats(self):
+        """Return size and IVF layout"""
+        with self._lock:
+            self._sync()
+            return {
+                'path': self.path,
+                'vectors': self._count,
+                'dim': self.dim,
+                'bytes': self._count * (self.dim or 0) * 2,
+                'ivf_lists': len(self.centroids) if self.centroids is not None else 0,
+            }
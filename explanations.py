@@ -0,0 +1,123 @@
+# explanations.py
+"""Lazily computed, cached Grad-CAM explanations of stored uploads.
+
+Nothing is computed at prediction time. The first request for an upload's
+explanation runs Grad-CAM on the stored file, keeps the heatmap array in a
+small in-memory LRU and writes it next to the upload as cam_<name>.npz
+together with the rendered cam_<name>.jpg overlay. Later requests are
+served from memory or disk, so repeated views cost no model time, and
+concurrent first requests for the same upload share one computation. The
+files live in the upload folder and expire with the upload.
+"""
+import os
+import time
+import hashlib
+import threading
+import collections
+import numpy as np
+
+
+class ExplanationStore:
+    """Grad-CAM heatmaps and overlays keyed by upload filename and explained class
+
+    explain_fn(filepath, class_name) returns a dict with a 'heatmap' array plus
+    JSON-serializable fields; render_fn(filepath, explanation, output_path)
+    writes the overlay JPEG.
+    """
+
+    def __init__(self, directory, explain_fn, render_fn, max_entries=64):
+        self.directory = directory
+        self.explain_fn = explain_fn
+        self.render_fn = render_fn
+        self.max_entries = max_entries
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._inflight = {}
+
+        # Metrics
+        self._hits = collections.Counter()
+        self._compute_ms = collections.deque(maxlen=1024)
+
+    def names(self, filename, class_name=None):
+        """Return the (heatmap, overlay) file names for an upload and explained class"""
+        stem = os.path.splitext(filename)[0]
+        if class_name:
+            # Class names hold commas and parentheses; a short digest keeps file names plain
+            stem = f"{hashlib.blake2b(class_name.encode('utf-8'), digest_size=4).hexdigest()}_{stem}"
+        return f"cam_{stem}.npz", f"cam_{stem}.jpg"
+
+    def get(self, filename, class_name=None):
+        """Return (explanation, overlay file name, source) computing it on first use
+
+        source is 'memory', 'disk' or 'computed'. Raises FileNotFoundError when the
+        upload is gone.
+        """
+        key = (filename, class_name or '')
+        npz_name, jpg_name = self.names(filename, class_name)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits['memory'] += 1
+                return entry, jpg_name, 'memory'
+            flight = self._inflight.setdefault(key, threading.Lock())
+
+        # One computation per key; later arrivals wait and then read its files
+        with flight:
+            try:
+                entry, source = self._load(npz_name, jpg_name), 'disk'
+                if entry is None:
+                    entry, source = self._compute(filename, class_name, npz_name, jpg_name), 'computed'
+            finally:
+                with self._lock:
+                    self._inflight.pop(key, None)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._hits[source] += 1
+        return entry, jpg_name, source
+
+    def _load(self, npz_name, jpg_name):
+        """Read a stored explanation when both of its files exist"""
+        npz_path = os.path.join(self.directory, npz_name)
+        if not (os.path.exists(npz_path) and os.path.exists(os.path.join(self.directory, jpg_name))):
+            return None
+        try:
+            with np.load(npz_path) as data:
+                return {'heatmap': data['heatmap'], 'class': str(data['class']),
+                        'confidence': float(data['confidence']), 'explain_ms': float(data['explain_ms'])}
+        except (OSError, KeyError, ValueError):
+            return None
+
+    def _compute(self, filename, class_name, npz_name, jpg_name):
+        filepath = os.path.join(self.directory, filename)
+        if not os.path.exists(filepath):
+            raise FileNotFoundError(f"Upload not found: {filename}")
+
+        start_time = time.perf_counter()
+        entry = self.explain_fn(filepath, class_name)
+        entry['heatmap'] = np.asarray(entry['heatmap'], dtype=np.float16)
+        self.render_fn(filepath, entry, os.path.join(self.directory, jpg_name))
+
+        # Written under a temporary name so a reader never sees a partial file
+        tmp_path = os.path.join(self.directory, f".{npz_name}.tmp.npz")
+        np.savez(tmp_path, heatmap=entry['heatmap'], confidence=entry['confidence'],
+                 explain_ms=entry['explain_ms'], **{'class': entry['class']})
+        os.replace(tmp_path, os.path.join(self.directory, npz_name))
+        with self._lock:
+            self._compute_ms.append((time.perf_counter() - start_time) * 1000.0)
+        return entry
+
+    def stats(self):
+        """Return hit counts by source and the mean cost of a computation"""
+        with self._lock:
+            compute_ms = list(self._compute_ms)
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': dict(self._hits),
+                'mean_compute_ms': sum(compute_ms) / len(compute_ms) if compute_ms else 0.0,
+            }
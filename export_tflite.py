@@ -0,0 +1,125 @@
+# export_tflite.py
+"""Export the Keras model to TFLite with optional post-training quantization.
+
+Usage:
+    python export_tflite.py --quantization float16
+    python export_tflite.py --quantization int8 --sample-dir path/to/leaf/photos
+
+After converting, the export is compared with the Keras model on the sample set
+(or synthetic images when no samples are given): file size, per-image latency and
+top-1 agreement are reported.
+"""
+import os
+import time
+import argparse
+import numpy as np
+
+os.environ.setdefault('TF_CPP_MIN_LOG_LEVEL', '2')
+
+from crop_detection import CropDiseaseDetector, preprocess_input
+
+QUANTIZATIONS = ('none', 'dynamic', 'float16', 'int8')
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.webp')
+
+
+def list_samples(sample_dir, limit):
+    """Return up to limit image paths found under sample_dir"""
+    paths = []
+    for root, _, files in os.walk(sample_dir):
+        for name in sorted(files):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return paths[:limit]
+
+
+def load_samples(detector, sample_dir, limit, seed=0):
+    """Load sample images as RGB arrays at model resolution, falling back to synthetic images"""
+    if sample_dir:
+        paths = list_samples(sample_dir, limit)
+        if paths:
+            return [detector.load_rgb(path) for path in paths], 'samples'
+        print(f"⚠️ No images found in {sample_dir}, using synthetic images")
+
+    rng = np.random.default_rng(seed)
+    size = detector.img_size
+    return [rng.integers(0, 256, (size, size, 3), dtype=np.uint8) for _ in range(limit)], 'synthetic'
+
+
+def convert(model, quantization, samples):
+    """Convert a Keras model to a TFLite flatbuffer with the requested quantization"""
+    import tensorflow as tf
+
+    converter = tf.lite.TFLiteConverter.from_keras_model(model)
+    if quantization == 'dynamic':
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+    elif quantization == 'float16':
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.target_spec.supported_types = [tf.float16]
+    elif quantization == 'int8':
+        def representative_dataset():
+            for sample in samples:
+                yield [preprocess_input(sample[np.newaxis].astype(np.float32))]
+
+        # Full-integer kernels; float input/output stays so the backend contract is unchanged
+        converter.optimizations = [tf.lite.Optimize.DEFAULT]
+        converter.representative_dataset = representative_dataset
+        converter.target_spec.supported_ops = [tf.lite.OpsSet.TFLITE_BUILTINS_INT8]
+    return converter.convert()
+
+
+def mean_latency_ms(detector, samples, iterations):
+    """Mean single-image forward latency in ms"""
+    batch = preprocess_input(samples[0][np.newaxis].astype(np.float32))
+    detector._forward(batch)
+    start_time = time.perf_counter()
+    for _ in range(iterations):
+        detector._forward(batch)
+    return (time.perf_counter() - start_time) * 1000.0 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the crop disease model to TFLite")
+    parser.add_argument('--model', default=os.path.join('models', 'plant_disease_model_best.keras'))
+    parser.add_argument('--class-indices', default=os.path.join('models', 'class_indices.json'))
+    parser.add_argument('--quantization', choices=QUANTIZATIONS, default='float16')
+    parser.add_argument('--output', help="Output path (default models/plant_disease_model_<quantization>.tflite)")
+    parser.add_argument('--sample-dir', help="Folder of sample images for calibration and comparison")
+    parser.add_argument('--samples', type=int, default=200, help="Maximum number of sample images")
+    parser.add_argument('--iterations', type=int, default=50, help="Latency benchmark iterations")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join('models', f'plant_disease_model_{args.quantization}.tflite')
+
+    keras_detector = CropDiseaseDetector(args.model, args.class_indices, backend='keras')
+    samples, source = load_samples(keras_detector, args.sample_dir, args.samples)
+    if args.quantization == 'int8' and source == 'synthetic':
+        print("⚠️ Calibrating int8 quantization on synthetic images; pass --sample-dir for usable accuracy")
+
+    start_time = time.perf_counter()
+    flatbuffer = convert(keras_detector.model, args.quantization, samples)
+    with open(output, 'wb') as f:
+        f.write(flatbuffer)
+    print(f"✅ Exported {args.quantization} model to {output} in {time.perf_counter() - start_time:.1f}s")
+
+    tflite_detector = CropDiseaseDetector(output, args.class_indices, backend='tflite')
+
+    # Top-1 agreement on the sample set
+    keras_results = keras_detector.predict_batch(samples, top_k=1)
+    tflite_results = tflite_detector.predict_batch(samples, top_k=1)
+    agreement = np.mean([k['class'] == t['class'] for k, t in zip(keras_results, tflite_results)])
+    confidence_diff = np.mean([abs(k['confidence'] - t['confidence']) for k, t in zip(keras_results, tflite_results)])
+
+    keras_size = os.path.getsize(args.model) / (1024 * 1024)
+    tflite_size = os.path.getsize(output) / (1024 * 1024)
+    keras_ms = mean_latency_ms(keras_detector, samples, args.iterations)
+    tflite_ms = mean_latency_ms(tflite_detector, samples, args.iterations)
+
+    print(f"\n{'':<14}{'keras':>12}{args.quantization:>12}")
+    print(f"{'size (MB)':<14}{keras_size:>12.2f}{tflite_size:>12.2f}")
+    print(f"{'latency (ms)':<14}{keras_ms:>12.2f}{tflite_ms:>12.2f}")
+    print(f"\nTop-1 agreement on {len(samples)} {source} images: {agreement * 100:.1f}%")
+    print(f"Mean |confidence difference|: {confidence_diff:.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# image_decoding.py
+"""Reduced-resolution image decoding.
+
+JPEG can be decoded directly at 1/2, 1/4 or 1/8 scale by dropping DCT
+coefficients, which is far cheaper than a full decode followed by a resize.
+Callers pass the smallest size they need (model input, display size) and get
+the smallest DCT scale that is still at least that large.
+
+Quality presets trade speed for resampling headroom:
+    'fast'      decode at the smallest scale >= min_size
+    'balanced'  keep 2x headroom over min_size for a cleaner downscale
+    'full'      always decode at full resolution
+"""
+import io
+import numpy as np
+from PIL import Image
+
+DECODE_QUALITIES = {'fast': 1, 'balanced': 2, 'full': None}
+DECODE_BACKENDS = ('pil', 'cv2')
+REDUCTION_FACTORS = (8, 4, 2)
+
+
+def _open(source):
+    """Open a path, raw bytes or file-like object lazily with PIL"""
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return Image.open(io.BytesIO(source))
+    return Image.open(source)
+
+
+def _target_size(min_size, quality):
+    """Requested decode size after applying the quality headroom, or None for a full decode"""
+    if quality not in DECODE_QUALITIES:
+        raise ValueError(f"Unknown decode quality: {quality}")
+    headroom = DECODE_QUALITIES[quality]
+    if min_size is None or headroom is None:
+        return None
+    return (int(min_size[0] * headroom), int(min_size[1] * headroom))
+
+
+def reduction_factor(image_size, target_size):
+    """Largest JPEG DCT reduction (1, 2, 4 or 8) that keeps the image at least target_size"""
+    if target_size is None:
+        return 1
+    for factor in REDUCTION_FACTORS:
+        if image_size[0] // factor >= target_size[0] and image_size[1] // factor >= target_size[1]:
+            return factor
+    return 1
+
+
+def decode_image(source, min_size=None, quality='balanced', backend='pil'):
+    """Decode an image to an RGB uint8 array, using DCT-domain downscaling for JPEGs
+
+    min_size is the (width, height) the caller needs; the result is never smaller than
+    that unless the original is.
+    """
+    target = _target_size(min_size, quality)
+
+    if backend == 'cv2':
+        return _decode_cv2(source, target)
+    if backend != 'pil':
+        raise ValueError(f"Unknown decode backend: {backend}")
+
+    with _open(source) as img:
+        if target is not None and img.format == 'JPEG':
+            img.draft('RGB', target)
+        return np.asarray(img if img.mode == 'RGB' else img.convert('RGB'))
+
+
+def _decode_cv2(source, target):
+    """Decode with OpenCV's IMREAD_REDUCED_COLOR_* flags, returning RGB"""
+    import cv2
+
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        data = bytes(source)
+    else:
+        with open(source, 'rb') as f:
+            data = f.read()
+
+    # Read the header lazily to pick the reduction before decoding any pixels
+    with _open(data) as img:
+        image_size, is_jpeg = img.size, img.format == 'JPEG'
+    factor = reduction_factor(image_size, target) if is_jpeg else 1
+    flags = {1: cv2.IMREAD_COLOR, 2: cv2.IMREAD_REDUCED_COLOR_2,
+             4: cv2.IMREAD_REDUCED_COLOR_4, 8: cv2.IMREAD_REDUCED_COLOR_8}
+
+    bgr = cv2.imdecode(np.frombuffer(data, dtype=np.uint8), flags[factor])
+    if bgr is None:
+        # Formats OpenCV cannot read (e.g. GIF) fall back to PIL
+        with _open(data) as img:
+            return np.asarray(img.convert('RGB'))
+    return cv2.cvtColor(bgr, cv2.COLOR_BGR2RGB)
@@ -0,0 +1,401 @@
+# inference_backends.py
+"""Inference backends used by CropDiseaseDetector.
+
+A backend owns the loaded model and turns a preprocessed float32 batch of shape
+(N, size, size, 3) into an (N, num_classes) output array. TensorFlow is imported
+only by the backend that needs it, so a TFLite worker running on tflite_runtime
+never loads the full TF runtime.
+"""
+import os
+import time
+import threading
+import logging
+import numpy as np
+
+logger = logging.getLogger('crop_disease_detector')
+
+DEFAULT_INPUT_SIZE = 224
+
+
+def _output_rank(layer):
+    """Rank of a layer's single output tensor, or None when it has no single output"""
+    try:
+        return len(layer.output.shape)
+    except (AttributeError, ValueError, TypeError):
+        return None
+
+
+class InferenceBackend:
+    """Base class for model runtimes"""
+    name = 'base'
+
+    def __init__(self, model_path):
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(f"Model file not found: {model_path}")
+        self.model_path = model_path
+        self.input_size = DEFAULT_INPUT_SIZE
+        self.num_outputs = None
+
+    def forward(self, batch):
+        """Run one forward pass over a preprocessed float32 batch"""
+        raise NotImplementedError
+
+    def batch_shapes(self, max_batch_size):
+        """Batch sizes forward() may see when serving batches of up to max_batch_size"""
+        sizes = {1, max(1, int(max_batch_size))}
+        size = 2
+        while size < max_batch_size:
+            sizes.add(size)
+            size *= 2
+        return sorted(sizes)
+
+    def classifier_weights(self):
+        """(kernel, bias) of the final Dense layer, or None when the runtime does not expose it"""
+        return None
+    
+    def embed(self, batch):
+        """Penultimate-layer embeddings (the final Dense layer's input) for a preprocessed batch"""
+        raise NotImplementedError(f"The {self.name} backend does not expose embeddings")
+    
+    def forward_with_embeddings(self, batch):
+        """Return (outputs, embeddings) from a single forward pass"""
+        raise NotImplementedError(f"The {self.name} backend does not expose embeddings")
+    
+    def gradcam(self, batch, class_index=None):
+        """Return (class activation maps, outputs) for a preprocessed batch"""
+        raise NotImplementedError(f"The {self.name} backend does not support Grad-CAM")
+    
+    def warmup(self, batch_sizes, seed=0):
+        """Run synthetic batches through every given shape, returning per-shape latency in ms
+        
+        The first call per shape traces and allocates; the timing is taken from a second, warm call.
+        """
+        rng = np.random.default_rng(seed)
+        timings = {}
+        for batch_size in batch_sizes:
+            batch = rng.uniform(-1.0, 1.0, (batch_size, self.input_size, self.input_size, 3)).astype(np.float32)
+            self.forward(batch)
+            start_time = time.perf_counter()
+            self.forward(batch)
+            timings[batch_size] = (time.perf_counter() - start_time) * 1000.0
+        return timings
+
+    def describe(self):
+        """Return a JSON-serializable description of the backend"""
+        return {
+            'backend': self.name,
+            'model_path': self.model_path,
+            'input_size': self.input_size,
+            'num_outputs': self.num_outputs,
+        }
+
+
+class KerasBackend(InferenceBackend):
+    """Full TensorFlow/Keras runtime, via model.predict or a compiled tf.function"""
+    name = 'keras'
+    SERVING_BATCH_SIZES = (1, 2, 4, 8, 16, 32)
+
+    def __init__(self, model_path, inference_mode='keras', jit_compile=False, serving_batch_sizes=None,
+                 num_threads=None, inter_op_threads=None):
+        super().__init__(model_path)
+        if inference_mode not in ('keras', 'compiled'):
+            raise ValueError(f"Unknown inference mode: {inference_mode}")
+
+        import tensorflow as tf
+        self.tf = tf
+
+        # Thread pools can only be sized before the TensorFlow runtime initializes
+        try:
+            if num_threads:
+                tf.config.threading.set_intra_op_parallelism_threads(int(num_threads))
+            if inter_op_threads:
+                tf.config.threading.set_inter_op_parallelism_threads(int(inter_op_threads))
+        except RuntimeError as e:
+            logger.warning(f"Could not configure TensorFlow thread pools: {str(e)}")
+
+        # Set memory growth to prevent TensorFlow from allocating all GPU memory
+        gpus = tf.config.experimental.list_physical_devices('GPU')
+        if gpus:
+            for gpu in gpus:
+                tf.config.experimental.set_memory_growth(gpu, True)
+            logger.info(f"Found {len(gpus)} GPU(s), set memory growth")
+
+        self.model = tf.keras.models.load_model(model_path)
+        logger.info(f"Loaded model from {model_path}")
+
+        # Get image size from model input shape
+        if self.model.input_shape is None or self.model.input_shape[1] is None:
+            # Default to 224x224 if input shape is not available
+            logger.warning("Could not determine input size from model, using default 224x224")
+        else:
+            self.input_size = self.model.input_shape[1]  # Assuming square input
+        self.num_outputs = self.model.output_shape[-1]
+
+        # Compiled path: one fixed input signature per serving batch size
+        self.inference_mode = inference_mode
+        self.jit_compile = bool(jit_compile)
+        self.serving_batch_sizes = tuple(sorted(set(serving_batch_sizes or self.SERVING_BATCH_SIZES)))
+        self._concrete_fns = {}
+        self._trace_lock = threading.Lock()
+        self._dual_model = None  # Outputs plus embeddings, built on first use
+        self._cam_fn = None  # Last feature map plus logits, built on first Grad-CAM request
+        if inference_mode == 'compiled':
+            self._serving_fn = tf.function(self._call_model, jit_compile=self.jit_compile)
+            logger.info(f"Compiled inference enabled (batch sizes {self.serving_batch_sizes}, XLA {self.jit_compile})")
+
+    def _call_model(self, batch):
+        """Direct model call traced by the compiled inference path"""
+        return self.model(batch, training=False)
+
+    def _concrete_fn(self, batch_size):
+        """Return the traced function for a fixed batch size, tracing it on first use"""
+        fn = self._concrete_fns.get(batch_size)
+        if fn is None:
+            with self._trace_lock:
+                fn = self._concrete_fns.get(batch_size)
+                if fn is None:
+                    start_time = time.perf_counter()
+                    spec = self.tf.TensorSpec((batch_size, self.input_size, self.input_size, 3), self.tf.float32)
+                    fn = self._serving_fn.get_concrete_function(spec)
+                    self._concrete_fns[batch_size] = fn
+                    logger.info(f"Traced serving function for batch size {batch_size} in {time.perf_counter() - start_time:.2f}s")
+        return fn
+
+    def _forward_compiled(self, batch):
+        """Run a batch through the traced functions, padding up to the nearest serving batch size"""
+        largest = self.serving_batch_sizes[-1]
+        outputs = []
+        for start in range(0, len(batch), largest):
+            chunk = batch[start:start + largest]
+            n = len(chunk)
+            bucket = next(size for size in self.serving_batch_sizes if size >= n)
+            if bucket != n:
+                chunk = np.concatenate([chunk, np.zeros((bucket - n,) + chunk.shape[1:], dtype=np.float32)])
+            result = self._concrete_fn(bucket)(self.tf.constant(chunk, dtype=self.tf.float32))
+            outputs.append(result.numpy()[:n])
+        return np.concatenate(outputs)
+
+    def batch_shapes(self, max_batch_size):
+        """Compiled mode only ever runs the traced bucket sizes, so warm exactly those"""
+        if self.inference_mode != 'compiled':
+            return super().batch_shapes(max_batch_size)
+        largest = self.serving_batch_sizes[-1]
+        cover = next((size for size in self.serving_batch_sizes if size >= max_batch_size), largest)
+        return [size for size in self.serving_batch_sizes if size <= cover]
+
+    def forward(self, batch):
+        """Run one forward pass over a preprocessed batch"""
+        if self.inference_mode == 'compiled':
+            return self._forward_compiled(np.asarray(batch, dtype=np.float32))
+        return self.model.predict(batch, batch_size=len(batch), verbose=0)
+
+    def _classifier_layer(self):
+        """Last Dense layer of the model, or None"""
+        dense = [layer for layer in self.model.layers if isinstance(layer, self.tf.keras.layers.Dense)]
+        return dense[-1] if dense else None
+    
+    def classifier_weights(self):
+        layer = self._classifier_layer()
+        if layer is None:
+            return None
+        kernel, bias = layer.get_weights()[:2] if layer.use_bias else (layer.get_weights()[0], None)
+        if bias is None:
+            bias = np.zeros(kernel.shape[1], dtype=np.float32)
+        return np.asarray(kernel, dtype=np.float32), np.asarray(bias, dtype=np.float32)
+    
+    def forward_with_embeddings(self, batch):
+        """Run the model once, returning its outputs and the final Dense layer's input"""
+        if self._dual_model is None:
+            with self._trace_lock:
+                if self._dual_model is None:
+                    layer = self._classifier_layer()
+                    if layer is None:
+                        raise NotImplementedError("Model has no Dense classifier layer to embed before")
+                    self._dual_model = self.tf.keras.Model(self.model.input, [self.model.output, layer.input])
+        outputs, embeddings = self._dual_model(np.asarray(batch, dtype=np.float32), training=False)
+        return outputs.numpy(), embeddings.numpy()
+    
+    def embed(self, batch):
+        """Run the backbone up to the final Dense layer's input"""
+        return self.forward_with_embeddings(batch)[1]
+    
+    def _build_cam_fn(self):
+        """Return fn(batch) -> (outputs, last 4-D feature map, classifier input, logits) for Grad-CAM"""
+        tf = self.tf
+        dense = self._classifier_layer()
+        layers = [layer for layer in self.model.layers if not isinstance(layer, tf.keras.layers.InputLayer)]
+        spatial = [i for i, layer in enumerate(layers) if _output_rank(layer) == 4]
+        if dense is None or not spatial:
+            raise NotImplementedError("Model has no convolutional feature map and Dense classifier for Grad-CAM")
+        feature_layer = layers[spatial[-1]]
+        dense_index = layers.index(dense)
+        
+        if not isinstance(feature_layer, tf.keras.Model):
+            # Flat graph: both tensors are reachable from the model input
+            graph = tf.keras.Model(self.model.input, [feature_layer.output, dense.input])
+            features_and_hidden = lambda batch: graph(batch, training=False)
+        else:
+            # A nested backbone (e.g. a MobileNetV2 base) has its output in its own graph, so the
+            # top-level layers around it are called in order; transfer models chain them linearly
+            def features_and_hidden(batch):
+                x = batch
+                for layer in layers[:spatial[-1]]:
+                    x = layer(x, training=False)
+                features = x = feature_layer(x, training=False)
+                for layer in layers[spatial[-1] + 1:dense_index]:
+                    x = layer(x, training=False)
+                return features, x
+        
+        def cam_fn(batch):
+            features, hidden = features_and_hidden(batch)
+            logits = tf.matmul(hidden, dense.kernel)
+            if dense.use_bias:
+                logits = logits + dense.bias
+            outputs = dense.activation(logits)
+            for layer in layers[dense_index + 1:]:
+                outputs = layer(outputs, training=False)
+            return outputs, features, logits
+        return cam_fn
+    
+    def gradcam(self, batch, class_index=None):
+        """Grad-CAM over the last 4-D feature map, for class_index or each row's top class
+        
+        The gradient is taken of the pre-softmax logit, which unlike the softmax probability
+        does not saturate. Returns (maps, outputs): maps is (batch, h, w) float32 scaled to
+        0-1 per row at the feature map's resolution, outputs the model outputs of the same pass.
+        """
+        tf = self.tf
+        if self._cam_fn is None:
+            with self._trace_lock:
+                if self._cam_fn is None:
+                    self._cam_fn = self._build_cam_fn()
+        
+        batch = tf.convert_to_tensor(np.asarray(batch, dtype=np.float32))
+        with tf.GradientTape() as tape:
+            outputs, features, logits = self._cam_fn(batch)
+            tape.watch(features)
+            indices = tf.argmax(logits, axis=1) if class_index is None else tf.fill([tf.shape(logits)[0]], class_index)
+            scores = tf.gather(logits, tf.cast(indices, tf.int32), axis=1, batch_dims=1)
+        grads = tape.gradient(scores, features)
+        
+        # Channel weights are the spatially averaged gradients; negative evidence is dropped
+        weights = tf.reduce_mean(grads, axis=(1, 2), keepdims=True)
+        maps = tf.nn.relu(tf.reduce_sum(features * weights, axis=-1)).numpy()
+        maps /= np.maximum(maps.reshape(len(maps), -1).max(axis=1), 1e-12)[:, np.newaxis, np.newaxis]
+        return maps.astype(np.float32), outputs.numpy()
+    
+    def describe(self):
+        info = super().describe()
+        info.update({
+            'inference_mode': self.inference_mode,
+            'jit_compile': self.jit_compile,
+            'serving_batch_sizes': list(self.serving_batch_sizes),
+            # 0 means TensorFlow's default of one thread per core
+            'intra_op_threads': self.tf.config.threading.get_intra_op_parallelism_threads(),
+            'inter_op_threads': self.tf.config.threading.get_inter_op_parallelism_threads(),
+        })
+        return info
+
+
+def _load_tflite_interpreter():
+    """Return the lightest available TFLite Interpreter class"""
+    try:
+        from tflite_runtime.interpreter import Interpreter
+        return Interpreter, 'tflite_runtime'
+    except ImportError:
+        pass
+    try:
+        from ai_edge_litert.interpreter import Interpreter
+        return Interpreter, 'ai_edge_litert'
+    except ImportError:
+        pass
+    import tensorflow as tf
+    return tf.lite.Interpreter, 'tensorflow'
+
+
+class TFLiteBackend(InferenceBackend):
+    """TFLite interpreter backend for float32, float16 and int8-quantized exports"""
+    name = 'tflite'
+
+    def __init__(self, model_path, num_threads=None):
+        super().__init__(model_path)
+        Interpreter, self.runtime = _load_tflite_interpreter()
+        self.num_threads = num_threads
+        self.interpreter = Interpreter(model_path=model_path, num_threads=num_threads)
+        self.interpreter.allocate_tensors()
+
+        self._input = self.interpreter.get_input_details()[0]
+        self._output = self.interpreter.get_output_details()[0]
+        self.input_size = int(self._input['shape'][1])
+        self.num_outputs = int(self._output['shape'][-1])
+        self._batch_size = int(self._input['shape'][0])
+        self.input_dtype = np.dtype(self._input['dtype'])
+
+        # The interpreter holds mutable tensor buffers, so calls must be serialized
+        self._lock = threading.Lock()
+        logger.info(f"Loaded TFLite model from {model_path} via {self.runtime} (input {self.input_dtype.name})")
+
+    def _resize(self, batch_size):
+        """Resize the input tensor to the given batch size if it changed"""
+        if batch_size != self._batch_size:
+            self.interpreter.resize_tensor_input(self._input['index'],
+                                                 [batch_size, self.input_size, self.input_size, 3])
+            self.interpreter.allocate_tensors()
+            self._input = self.interpreter.get_input_details()[0]
+            self._output = self.interpreter.get_output_details()[0]
+            self._batch_size = batch_size
+
+    def forward(self, batch):
+        """Run one forward pass, quantizing inputs and dequantizing outputs when needed"""
+        batch = np.asarray(batch, dtype=np.float32)
+        with self._lock:
+            self._resize(len(batch))
+
+            scale, zero_point = self._input['quantization']
+            if np.issubdtype(self.input_dtype, np.integer) and scale:
+                info = np.iinfo(self.input_dtype)
+                batch = np.clip(np.round(batch / scale + zero_point), info.min, info.max).astype(self.input_dtype)
+            self.interpreter.set_tensor(self._input['index'], batch)
+            self.interpreter.invoke()
+            outputs = self.interpreter.get_tensor(self._output['index'])
+
+            scale, zero_point = self._output['quantization']
+            if np.issubdtype(outputs.dtype, np.integer) and scale:
+                outputs = (outputs.astype(np.float32) - zero_point) * scale
+            return np.array(outputs, dtype=np.float32)
+
+    def describe(self):
+        info = super().describe()
+        info.update({
+            'runtime': self.runtime,
+            'input_dtype': self.input_dtype.name,
+            'num_threads': self.num_threads,
+        })
+        return info
+
+
+BACKENDS = {
+    'keras': KerasBackend,
+    'tflite': TFLiteBackend,
+}
+
+
+def load_backend(model_path, backend=None, **kwargs):
+    """Instantiate a backend by name, inferring it from the file extension when not given"""
+    if backend is None:
+        backend = 'tflite' if model_path.endswith('.tflite') else 'keras'
+    if backend == 'remote':
+        # Thin client for inference_server.py; model_path is the server socket path
+        from inference_server import RemoteBackend
+        kwargs = {k: v for k, v in kwargs.items() if k in ('num_servers', 'connect_timeout')}
+        return RemoteBackend(model_path, **kwargs)
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown inference backend: {backend}")
+
+    # Drop options that do not apply to the chosen backend
+    if backend == 'tflite':
+        kwargs = {k: v for k, v in kwargs.items() if k in ('num_threads',)}
+    else:
+        kwargs = {k: v for k, v in kwargs.items()
+                  if k in ('inference_mode', 'jit_compile', 'serving_batch_sizes', 'num_threads', 'inter_op_threads')}
+    return BACKENDS[backend](model_path, **kwargs)
@@ -0,0 +1,59 @@
+# inference_profile.py
+"""Persisted inference runtime profile written by autotune.py and calibrate_cascade.py.
+
+The profile records the winning runtime knobs for this machine (backend, inference
+mode, thread counts, oneDNN, micro-batching) together with the measurements that
+selected them. app.py reads it at startup before TensorFlow is imported and uses
+its values as defaults that explicit environment variables still override.
+"""
+import os
+import json
+import logging
+
+logger = logging.getLogger('crop_disease_detector')
+
+DEFAULT_PROFILE_PATH = os.path.join('models', 'inference_profile.json')
+
+# Keys a profile may set, with the values used when no profile exists
+PROFILE_DEFAULTS = {
+    'backend': None,
+    'model_path': None,
+    'inference_mode': 'keras',
+    'jit_compile': False,
+    'num_threads': None,
+    'inter_op_threads': None,
+    'onednn': False,
+    'batching': False,
+    'max_batch_size': 16,
+    'max_wait_ms': 5.0,
+    # Written by calibrate_cascade.py
+    'cascade_model_path': None,
+    'cascade_threshold': 0.9,
+    'cascade_margin': 0.0,
+}
+
+
+def load_inference_profile(path=DEFAULT_PROFILE_PATH):
+    """Return the profile merged over PROFILE_DEFAULTS, or just the defaults if it is missing or invalid"""
+    profile = dict(PROFILE_DEFAULTS)
+    if not path or not os.path.exists(path):
+        return profile
+    try:
+        with open(path, 'r') as f:
+            stored = json.load(f)
+        profile.update({k: v for k, v in stored.items() if k in PROFILE_DEFAULTS})
+        profile['loaded_from'] = path
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable inference profile {path}: {str(e)}")
+    return profile
+
+
+def save_inference_profile(profile, path=DEFAULT_PROFILE_PATH):
+    """Atomically write a profile as JSON"""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(profile, f, indent=2)
+    os.replace(tmp_path, path)
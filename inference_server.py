@@ -0,0 +1,522 @@
+# inference_server.py
+"""Dedicated inference server processes with shared-memory tensor transport.
+
+One or more server processes own a CropDiseaseDetector. Web workers become thin
+clients through the 'remote' inference backend: each client thread is given a
+slot in the server's shared-memory buffer, writes decoded 224x224 pixels into
+it and sends a 5-byte request over a Unix socket. The server gathers requests
+from all connected workers for up to max_wait_ms (or max_batch_size images),
+runs one forward pass, writes the probabilities back into each slot and
+replies. Only slot indices and status codes cross the socket; tensors never do.
+
+Usage:
+    python inference_server.py --socket /tmp/crop_inference.sock [--processes 2]
+    python inference_server.py --socket /tmp/crop_inference.sock --selftest --clients 4
+
+Then start the web app with INFERENCE_SERVER=/tmp/crop_inference.sock (and
+INFERENCE_SERVER_PROCESSES=2 when running several server processes).
+"""
+import os
+import sys
+import json
+import time
+import signal
+import socket
+import struct
+import argparse
+import itertools
+import selectors
+import threading
+import collections
+import logging
+import multiprocessing
+from multiprocessing import shared_memory
+import numpy as np
+
+from inference_backends import InferenceBackend
+from thread_budget import plan_thread_budget, apply_thread_budget
+
+logger = logging.getLogger('crop_disease_detector')
+
+# Wire format: client -> server (op, image count); server -> client status (images or -1)
+REQUEST = struct.Struct('!BI')
+STATUS = struct.Struct('!i')
+LENGTH = struct.Struct('!I')
+OP_INFER = 0
+OP_STATS = 1
+
+
+def _recv_exact(sock, size):
+    """Read exactly size bytes, returning b'' if the peer closed the connection"""
+    data = b''
+    while len(data) < size:
+        chunk = sock.recv(size - len(data))
+        if not chunk:
+            return b''
+        data += chunk
+    return data
+
+
+def _recv_json(sock):
+    """Read one length-prefixed JSON message"""
+    header = _recv_exact(sock, LENGTH.size)
+    if not header:
+        raise ConnectionError("Inference server closed the connection")
+    return json.loads(_recv_exact(sock, LENGTH.unpack(header)[0]).decode('utf-8'))
+
+
+def _send_json(sock, payload):
+    """Send one length-prefixed JSON message"""
+    data = json.dumps(payload).encode('utf-8')
+    sock.sendall(LENGTH.pack(len(data)) + data)
+
+
+def _untracked_shared_memory(**kwargs):
+    """Open a segment without the resource tracker; the server unlinks it explicitly on exit
+
+    Otherwise a client's tracker would unlink the server's segment when the client exits.
+    """
+    try:
+        return shared_memory.SharedMemory(track=False, **kwargs)  # Python 3.13+
+    except TypeError:
+        shm = shared_memory.SharedMemory(**kwargs)
+        try:
+            from multiprocessing import resource_tracker
+            resource_tracker.unregister(shm._name, 'shared_memory')
+        except Exception:
+            pass
+        return shm
+
+
+class SharedTensorSlots:
+    """Shared-memory layout: per-slot uint8 input images followed by float32 output rows"""
+
+    def __init__(self, shm, slots, slot_images, img_size, num_outputs):
+        self.shm = shm
+        self.slots = slots
+        self.slot_images = slot_images
+        input_shape = (slots, slot_images, img_size, img_size, 3)
+        output_shape = (slots, slot_images, num_outputs)
+        input_bytes = int(np.prod(input_shape))
+        self.inputs = np.ndarray(input_shape, dtype=np.uint8, buffer=shm.buf)
+        self.outputs = np.ndarray(output_shape, dtype=np.float32, buffer=shm.buf, offset=input_bytes)
+
+    @staticmethod
+    def nbytes(slots, slot_images, img_size, num_outputs):
+        return slots * slot_images * (img_size * img_size * 3 + num_outputs * 4)
+
+    def release(self):
+        """Drop the numpy views so the segment can be closed"""
+        self.inputs = None
+        self.outputs = None
+
+
+class InferenceServer:
+    """Single-process server: owns a detector and batches requests from all connected clients"""
+
+    def __init__(self, socket_path, detector, slots=64, slot_images=8, max_batch_size=32, max_wait_ms=5.0):
+        self.socket_path = socket_path
+        self.detector = detector
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait_ms = float(max_wait_ms)
+        self.img_size = detector.img_size
+        self.num_outputs = len(detector.class_names)
+
+        size = SharedTensorSlots.nbytes(slots, slot_images, self.img_size, self.num_outputs)
+        self.shm = _untracked_shared_memory(create=True, size=size)
+        self.buffers = SharedTensorSlots(self.shm, slots, slot_images, self.img_size, self.num_outputs)
+        self.free_slots = collections.deque(range(slots))
+
+        # Statistics
+        self.started_at = time.time()
+        self.batch_histogram = collections.Counter()
+        self.wait_times = collections.deque(maxlen=1024)
+        self.requests = 0
+        self.errors = 0
+        self.clients = 0
+
+    def stats(self):
+        """Return batching statistics for this server process"""
+        waits_ms = np.array(self.wait_times) * 1000.0
+        batches = sum(self.batch_histogram.values())
+        return {
+            'pid': os.getpid(),
+            'socket': self.socket_path,
+            'uptime_seconds': round(time.time() - self.started_at, 1),
+            'clients': self.clients,
+            'free_slots': len(self.free_slots),
+            'requests': self.requests,
+            'errors': self.errors,
+            'batches': batches,
+            'batch_size_histogram': dict(sorted(self.batch_histogram.items())),
+            'wait_ms_p50': float(np.percentile(waits_ms, 50)) if waits_ms.size else 0.0,
+            'wait_ms_p99': float(np.percentile(waits_ms, 99)) if waits_ms.size else 0.0,
+            'backend': self.detector.backend.describe(),
+        }
+
+    def _accept(self, listener, selector):
+        conn, _ = listener.accept()
+        if not self.free_slots:
+            logger.warning("Inference server has no free slots, rejecting client")
+            _send_json(conn, {'error': 'no free slots'})
+            conn.close()
+            return
+        slot = self.free_slots.popleft()
+        _send_json(conn, {
+            'shm_name': self.shm.name,
+            'slot': slot,
+            'slots': self.buffers.slots,
+            'slot_images': self.buffers.slot_images,
+            'img_size': self.img_size,
+            'num_outputs': self.num_outputs,
+        })
+        selector.register(conn, selectors.EVENT_READ, slot)
+        self.clients += 1
+
+    def _disconnect(self, conn, slot, selector, pending):
+        selector.unregister(conn)
+        conn.close()
+        pending[:] = [request for request in pending if request[0] is not conn]
+        self.free_slots.append(slot)
+        self.clients -= 1
+
+    def _dispatch(self, pending, selector):
+        """Run one forward pass over as many pending requests as fit in max_batch_size"""
+        taken, total = [], 0
+        while pending and (not taken or total + pending[0][2] <= self.max_batch_size):
+            request = pending.pop(0)
+            taken.append(request)
+            total += request[2]
+
+        dispatch_time = time.perf_counter()
+        batch = np.empty((total, self.img_size, self.img_size, 3), dtype=np.float32)
+        offset = 0
+        for _, slot, n, _ in taken:
+            batch[offset:offset + n] = self.buffers.inputs[slot, :n]
+            offset += n
+
+        try:
+            # Imported here so the module can be loaded without the detector's dependencies
+            from crop_detection import preprocess_input
+            probs = np.asarray(self.detector._forward(preprocess_input(batch)), dtype=np.float32)
+        except Exception as e:
+            logger.error(f"Inference server batch of {total} failed: {str(e)}")
+            self.errors += len(taken)
+            probs = None
+
+        # Exactly one status per request; a client that vanished is dropped without touching the others
+        offset = 0
+        for conn, slot, n, _ in taken:
+            if probs is not None:
+                self.buffers.outputs[slot, :n] = probs[offset:offset + n]
+                offset += n
+            try:
+                conn.sendall(STATUS.pack(n if probs is not None else -1))
+            except OSError:
+                self._disconnect(conn, slot, selector, pending)
+
+        self.batch_histogram[total] += 1
+        self.wait_times.extend(dispatch_time - enqueued for _, _, _, enqueued in taken)
+
+    def serve_forever(self):
+        """Accept clients and batch their requests until the process is terminated"""
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        listener.bind(self.socket_path)
+        listener.listen(128)
+
+        selector = selectors.DefaultSelector()
+        selector.register(listener, selectors.EVENT_READ, None)
+        pending = []  # (conn, slot, image count, enqueue time)
+        logger.info(f"Inference server listening on {self.socket_path} (pid {os.getpid()})")
+
+        try:
+            while True:
+                timeout = None
+                if pending:
+                    timeout = max(0.0, pending[0][3] + self.max_wait_ms / 1000.0 - time.perf_counter())
+
+                for key, _ in selector.select(timeout):
+                    if key.data is None:
+                        self._accept(listener, selector)
+                        continue
+
+                    conn, slot = key.fileobj, key.data
+                    try:
+                        header = _recv_exact(conn, REQUEST.size)
+                    except OSError:
+                        header = b''
+                    if not header:
+                        self._disconnect(conn, slot, selector, pending)
+                        continue
+
+                    op, n = REQUEST.unpack(header)
+                    if op == OP_STATS:
+                        _send_json(conn, self.stats())
+                    elif 0 < n <= self.buffers.slot_images:
+                        pending.append((conn, slot, n, time.perf_counter()))
+                        self.requests += 1
+                    else:
+                        conn.sendall(STATUS.pack(-1))
+
+                queued = sum(request[2] for request in pending)
+                while pending and (queued >= self.max_batch_size or
+                                   time.perf_counter() - pending[0][3] >= self.max_wait_ms / 1000.0):
+                    self._dispatch(pending, selector)
+                    queued = sum(request[2] for request in pending)
+        finally:
+            selector.close()
+            listener.close()
+            self.close()
+
+    def close(self):
+        """Release the shared memory segment and socket"""
+        self.buffers.release()
+        try:
+            self.shm.close()
+            if getattr(self.shm, '_track', True):
+                # Before Python 3.13 unlink() also unregisters, so balance that for the untracked segment
+                from multiprocessing import resource_tracker
+                resource_tracker.register(self.shm._name, 'shared_memory')
+            self.shm.unlink()
+        except (OSError, BufferError):
+            pass
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+
+
+class _ServerConnection:
+    """One client connection and its dedicated shared-memory slot"""
+
+    def __init__(self, socket_path):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.connect(socket_path)
+        info = _recv_json(self.sock)
+        if 'error' in info:
+            self.sock.close()
+            raise RuntimeError(f"Inference server at {socket_path} refused connection: {info['error']}")
+
+        self.slot = info['slot']
+        self.slot_images = info['slot_images']
+        self.img_size = info['img_size']
+        self.num_outputs = info['num_outputs']
+        self.shm = _untracked_shared_memory(name=info['shm_name'])
+        buffers = SharedTensorSlots(self.shm, info['slots'], self.slot_images, self.img_size, self.num_outputs)
+        self.inputs = buffers.inputs[self.slot]
+        self.outputs = buffers.outputs[self.slot]
+
+    def infer(self, pixels):
+        """Send up to slot_images uint8 images and return their output rows"""
+        n = len(pixels)
+        self.inputs[:n] = pixels
+        self.sock.sendall(REQUEST.pack(OP_INFER, n))
+        status = _recv_exact(self.sock, STATUS.size)
+        if not status:
+            raise ConnectionError("Inference server closed the connection")
+        if STATUS.unpack(status)[0] != n:
+            raise RuntimeError("Inference server failed to process the request")
+        return self.outputs[:n].copy()
+
+    def stats(self):
+        self.sock.sendall(REQUEST.pack(OP_STATS, 0))
+        return _recv_json(self.sock)
+
+
+class RemoteBackend(InferenceBackend):
+    """Thin-client backend that forwards batches to inference server processes
+
+    Preprocessed batches are converted back to the original uint8 pixels (the exact
+    inverse of preprocess_input) so each image costs 150 KB of shared memory instead
+    of 600 KB; the server re-applies preprocessing.
+    """
+    name = 'remote'
+
+    def __init__(self, model_path, num_servers=1, connect_timeout=120.0):
+        # model_path is the server socket path; no model file is loaded in this process
+        self.model_path = model_path
+        self.socket_paths = [model_path] if num_servers <= 1 else [f"{model_path}.{i}" for i in range(num_servers)]
+        self.connect_timeout = connect_timeout
+        self._local = threading.local()
+        self._next_server = itertools.count(os.getpid())
+
+        # The first connection waits for the server to finish loading and provides the geometry
+        conn = self._connection()
+        self.input_size = conn.img_size
+        self.num_outputs = conn.num_outputs
+        logger.info(f"Connected to inference server(s) {self.socket_paths}")
+
+    def _connection(self):
+        """Return this thread's connection, spreading threads across server processes"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            socket_path = self.socket_paths[next(self._next_server) % len(self.socket_paths)]
+            deadline = time.time() + self.connect_timeout
+            while True:
+                try:
+                    conn = _ServerConnection(socket_path)
+                    break
+                except (FileNotFoundError, ConnectionRefusedError, ConnectionError):
+                    if time.time() >= deadline:
+                        raise
+                    time.sleep(0.5)
+            self._local.conn = conn
+        return conn
+
+    def forward(self, batch):
+        """Send a preprocessed batch to the server in slot-sized chunks"""
+        pixels = np.clip(np.rint((np.asarray(batch, dtype=np.float32) + 1.0) * 127.5), 0, 255).astype(np.uint8)
+        try:
+            conn = self._connection()
+            outputs = [conn.infer(pixels[start:start + conn.slot_images])
+                       for start in range(0, len(pixels), conn.slot_images)]
+        except (ConnectionError, BrokenPipeError):
+            # Drop the broken connection so the next call reconnects (e.g. after a server restart)
+            self._local.conn = None
+            raise
+        return np.concatenate(outputs)
+
+    def describe(self):
+        info = super().describe()
+        info['servers'] = self.socket_paths
+        try:
+            info['server_stats'] = self._connection().stats()
+        except Exception as e:
+            info['server_stats'] = {'error': str(e)}
+        return info
+
+
+def run_server(socket_path, detector_kwargs, slots, slot_images, max_batch_size, max_wait_ms, thread_plan=None):
+    """Process entry point: load and warm the detector, then serve until terminated"""
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    if thread_plan is not None:
+        # Must happen before crop_detection pulls in TensorFlow
+        apply_thread_budget(thread_plan)
+        detector_kwargs = dict(detector_kwargs, num_threads=thread_plan['intra_op_threads'],
+                               inter_op_threads=thread_plan['inter_op_threads'])
+
+    from crop_detection import CropDiseaseDetector
+    detector = CropDiseaseDetector(**detector_kwargs)
+    detector.warmup(extra_batch_sizes=detector.backend.batch_shapes(max_batch_size))
+    server = InferenceServer(socket_path, detector, slots=slots, slot_images=slot_images,
+                             max_batch_size=max_batch_size, max_wait_ms=max_wait_ms)
+    server.serve_forever()
+
+
+def start_servers(socket_path, processes, detector_kwargs, slots=64, slot_images=8, max_batch_size=32, max_wait_ms=5.0,
+                  pin_cpus=False):
+    """Start server processes, returning them; socket paths get a .<i> suffix when processes > 1
+
+    Each process gets an equal share of the CPU cores for its TensorFlow thread pools.
+    """
+    ctx = multiprocessing.get_context('spawn')
+    paths = [socket_path] if processes <= 1 else [f"{socket_path}.{i}" for i in range(processes)]
+    servers = []
+    for path in paths:
+        thread_plan = plan_thread_budget(workers=len(paths), worker_slot=len(servers), pin=pin_cpus)
+        process = ctx.Process(target=run_server, name=f"inference-server-{len(servers)}",
+                              args=(path, detector_kwargs, slots, slot_images, max_batch_size, max_wait_ms,
+                                    thread_plan))
+        process.start()
+        servers.append(process)
+    return servers
+
+
+def _selftest_client(socket_path, processes, class_indices, requests, seed, queue):
+    """Client process for --selftest: run predictions through the remote backend"""
+    from crop_detection import CropDiseaseDetector
+
+    detector = CropDiseaseDetector(socket_path, class_indices, backend='remote', num_servers=processes)
+    rng = np.random.default_rng(seed)
+    images = [rng.integers(0, 256, (detector.img_size, detector.img_size, 3), dtype=np.uint8) for _ in range(requests)]
+    start_time = time.perf_counter()
+    results = [detector.predict(img, top_k=3, return_probabilities=False) for img in images]
+    queue.put((seed, time.perf_counter() - start_time, [r['class'] for r in results]))
+
+
+def selftest(args, detector_kwargs):
+    """Run servers plus several client processes and check results against an in-process detector"""
+    from crop_detection import CropDiseaseDetector
+
+    servers = start_servers(args.socket, args.processes, detector_kwargs, args.slots, args.slot_images,
+                            args.max_batch, args.max_wait_ms, args.pin_cpus)
+    try:
+        ctx = multiprocessing.get_context('spawn')
+        queue = ctx.Queue()
+        clients = [ctx.Process(target=_selftest_client,
+                               args=(args.socket, args.processes, detector_kwargs['class_indices_path'],
+                                     args.requests, seed, queue))
+                   for seed in range(args.clients)]
+        for client in clients:
+            client.start()
+        outcomes = [queue.get(timeout=600) for _ in clients]
+        for client in clients:
+            client.join()
+
+        # Reference answers from a local detector on the same synthetic images
+        reference = CropDiseaseDetector(**detector_kwargs)
+        mismatches = 0
+        for seed, elapsed, classes in sorted(outcomes):
+            rng = np.random.default_rng(seed)
+            images = [rng.integers(0, 256, (reference.img_size, reference.img_size, 3), dtype=np.uint8)
+                      for _ in range(args.requests)]
+            expected = [r['class'] for r in reference.predict_batch(images, top_k=1)]
+            mismatches += sum(a != b for a, b in zip(classes, expected))
+            print(f"client {seed}: {args.requests} predictions in {elapsed:.2f}s")
+
+        probe = CropDiseaseDetector(args.socket, detector_kwargs['class_indices_path'], backend='remote',
+                                    num_servers=args.processes)
+        print(json.dumps(probe.backend.describe()['server_stats'], indent=2))
+        print(f"{'✅' if not mismatches else '⚠️'} {mismatches} mismatching predictions "
+              f"across {args.clients * args.requests} requests")
+    finally:
+        for server in servers:
+            server.terminate()
+            server.join()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run dedicated crop disease inference server processes")
+    parser.add_argument('--socket', default=os.path.join('/tmp', 'crop_inference.sock'))
+    parser.add_argument('--processes', type=int, default=1)
+    parser.add_argument('--model', default=os.path.join('models', 'plant_disease_model_best.keras'))
+    parser.add_argument('--class-indices', default=os.path.join('models', 'class_indices.json'))
+    parser.add_argument('--backend', choices=['keras', 'tflite'])
+    parser.add_argument('--inference-mode', choices=['keras', 'compiled'], default='compiled')
+    parser.add_argument('--max-batch', type=int, default=32)
+    parser.add_argument('--max-wait-ms', type=float, default=5.0)
+    parser.add_argument('--slots', type=int, default=64, help="Concurrent client connections per server")
+    parser.add_argument('--slot-images', type=int, default=8, help="Images per request per slot")
+    parser.add_argument('--pin-cpus', action='store_true', help="Pin each server process to its share of cores")
+    parser.add_argument('--selftest', action='store_true', help="Start servers plus client processes and verify")
+    parser.add_argument('--clients', type=int, default=4)
+    parser.add_argument('--requests', type=int, default=25)
+    args = parser.parse_args()
+
+    detector_kwargs = {
+        'model_path': args.model,
+        'class_indices_path': args.class_indices,
+        'backend': args.backend,
+        'inference_mode': args.inference_mode,
+    }
+    if args.selftest:
+        selftest(args, detector_kwargs)
+        return
+
+    # Stop the server processes when this supervisor is interrupted or terminated
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    servers = start_servers(args.socket, args.processes, detector_kwargs, args.slots, args.slot_images,
+                            args.max_batch, args.max_wait_ms, args.pin_cpus)
+    try:
+        for server in servers:
+            server.join()
+    except (KeyboardInterrupt, SystemExit):
+        pass
+    finally:
+        for server in servers:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
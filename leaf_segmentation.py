@@ -0,0 +1,97 @@
+# leaf_segmentation.py
+"""Lightweight leaf localization with OpenCV, no extra model.
+
+Leaves are separated from the background by color: vegetation is green to
+yellow-brown with some saturation in HSV, and greener than neutral on the
+a* axis of Lab. The mask is cleaned with morphology on a downsampled copy,
+touching leaves are split where the distance transform has separate peaks,
+and the external contours of the largest blobs become bounding boxes in
+original-image coordinates.
+"""
+import numpy as np
+
+
+def vegetation_mask(rgb):
+    """Binary mask of leaf-colored pixels in an RGB uint8 image"""
+    import cv2
+
+    hsv = cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV)
+    lab = cv2.cvtColor(rgb, cv2.COLOR_RGB2LAB)
+    hue, sat, val = hsv[..., 0], hsv[..., 1], hsv[..., 2]
+
+    # OpenCV hue is 0-179: ~10 is brown/orange (lesions, senescence), ~35-85 is green
+    leaf_hue = (hue >= 8) & (hue <= 90) & (sat >= 40) & (val >= 35)
+    greenish = (lab[..., 1] < 122) & (val >= 35)
+    mask = ((leaf_hue | greenish) * 255).astype(np.uint8)
+
+    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+    mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
+    mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel, iterations=2)
+    return mask
+
+
+def _split_touching(mask):
+    """Label connected leaves, splitting blobs whose distance transform has several peaks"""
+    import cv2
+
+    count, components = cv2.connectedComponents(mask)
+    if count <= 1:
+        return components
+
+    # Seeds are each blob's cores, taken relative to that blob's own thickness so
+    # small leaves keep a seed; watershed grows the seeds back out to the mask
+    dist = cv2.distanceTransform(mask, cv2.DIST_L2, 5)
+    peaks = np.zeros(count, dtype=np.float32)
+    np.maximum.at(peaks, components.ravel(), dist.ravel())
+    cores = ((dist >= 0.6 * peaks[components]) & (mask > 0)).astype(np.uint8)
+    seeds, markers = cv2.connectedComponents(cores)
+    if seeds <= count:
+        return components
+    markers = markers + 1
+    markers[(mask > 0) & (cores == 0)] = 0
+    markers = cv2.watershed(cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR), markers.astype(np.int32))
+    markers[markers <= 1] = 0
+    return markers
+
+
+def find_leaf_regions(rgb, max_regions=8, min_area_fraction=0.02, work_size=320, padding=0.08):
+    """Return up to max_regions leaf bounding boxes, largest first
+
+    Each region is a dict with 'box' [x, y, w, h] in the coordinates of rgb and
+    'area_fraction', the share of the frame its mask covers. Blobs smaller than
+    min_area_fraction of the frame are ignored, and boxes are grown by padding
+    (a fraction of their size) so the leaf edge stays in the crop.
+    """
+    import cv2
+
+    h, w = rgb.shape[:2]
+    scale = min(1.0, work_size / max(h, w))
+    small = cv2.resize(rgb, (max(1, int(w * scale)), max(1, int(h * scale))), interpolation=cv2.INTER_AREA) \
+        if scale < 1.0 else rgb
+    mask = vegetation_mask(small)
+    frame_area = float(mask.shape[0] * mask.shape[1])
+    min_area = min_area_fraction * frame_area
+
+    labels = _split_touching(mask)
+    regions = []
+    for label in np.unique(labels):
+        if label == 0:
+            continue
+        blob = (labels == label).astype(np.uint8)
+        area = float(blob.sum())
+        if area < min_area:
+            continue
+        contours, _ = cv2.findContours(blob, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        x, y, bw, bh = cv2.boundingRect(max(contours, key=cv2.contourArea))
+        regions.append((area, x, y, bw, bh))
+
+    regions.sort(reverse=True)
+    boxes = []
+    for area, x, y, bw, bh in regions[:max_regions]:
+        pad_x, pad_y = bw * padding, bh * padding
+        x0 = max(0, int((x - pad_x) / scale))
+        y0 = max(0, int((y - pad_y) / scale))
+        x1 = min(w, int(np.ceil((x + bw + pad_x) / scale)))
+        y1 = min(h, int(np.ceil((y + bh + pad_y) / scale)))
+        boxes.append({'box': [x0, y0, x1 - x0, y1 - y0], 'area_fraction': round(area / frame_area, 4)})
+    return boxes
@@ -0,0 +1,199 @@
+# perceptual_hash.py
+"""Perceptual hashing and a near-duplicate index for re-photographed leaves.
+
+Hashes are 64-bit dHash/pHash values computed on a small grayscale thumbnail, so
+two frames of the same leaf a few pixels apart land within a small Hamming
+distance. The index stores hashes in a fixed-capacity uint64 ring buffer and
+answers nearest-neighbour queries with a vectorized XOR + popcount scan. The
+prediction behind each hash is kept as compact top-k class ids and confidences
+in parallel arrays and rebuilt into a result dict when it is matched.
+"""
+import io
+import threading
+import logging
+import numpy as np
+from PIL import Image
+
+logger = logging.getLogger('crop_matters')
+
+HASH_METHODS = ('dhash', 'phash')
+
+# Bit counts for every 16-bit value, used when numpy has no bitwise_count (numpy < 2.0)
+_POPCOUNT_TABLE = np.unpackbits(np.arange(65536, dtype=np.uint16).view(np.uint8)).reshape(-1, 16).sum(axis=1, dtype=np.uint8)
+
+
+def popcount64(values):
+    """Number of set bits in each element of a uint64 array"""
+    values = np.ascontiguousarray(values, dtype=np.uint64)
+    if hasattr(np, 'bitwise_count'):
+        return np.bitwise_count(values)
+    return _POPCOUNT_TABLE[values.view(np.uint16)].reshape(values.shape + (4,)).sum(axis=-1, dtype=np.uint8)
+
+
+def _grayscale(source, size):
+    """Decode a path, bytes, PIL image or array into a float32 grayscale thumbnail of (w, h)"""
+    if isinstance(source, np.ndarray):
+        img = Image.fromarray(source.astype(np.uint8, copy=False))
+    elif isinstance(source, Image.Image):
+        img = source
+    elif isinstance(source, (bytes, bytearray, memoryview)):
+        img = Image.open(io.BytesIO(source))
+    else:
+        img = Image.open(source)
+
+    # Let the JPEG decoder skip detail the thumbnail does not need
+    if img.format == 'JPEG':
+        img.draft('L', (size[0] * 4, size[1] * 4))
+    return np.asarray(img.convert('L').resize(size, Image.BILINEAR), dtype=np.float32)
+
+
+def _pack_bits(bits):
+    """Pack a 64-element boolean array into one uint64"""
+    return int(np.packbits(bits.ravel()).view('>u8')[0])
+
+
+def dhash(source, hash_size=8):
+    """Difference hash: sign of horizontal gradients on a (hash_size+1) x hash_size thumbnail"""
+    pixels = _grayscale(source, (hash_size + 1, hash_size))
+    return _pack_bits(pixels[:, 1:] > pixels[:, :-1])
+
+
+def _dct_matrix(n):
+    """Orthonormal DCT-II basis as an (n, n) matrix"""
+    k = np.arange(n)[:, np.newaxis]
+    i = np.arange(n)[np.newaxis, :]
+    basis = np.cos(np.pi * (2 * i + 1) * k / (2 * n)) * np.sqrt(2.0 / n)
+    basis[0] /= np.sqrt(2.0)
+    return basis.astype(np.float32)
+
+
+_DCT_CACHE = {}
+
+
+def phash(source, hash_size=8, highfreq_factor=4):
+    """DCT hash: low-frequency DCT coefficients of a 32x32 thumbnail compared to their median"""
+    n = hash_size * highfreq_factor
+    basis = _DCT_CACHE.get(n)
+    if basis is None:
+        basis = _DCT_CACHE[n] = _dct_matrix(n)
+
+    pixels = _grayscale(source, (n, n))
+    low = (basis @ pixels @ basis.T)[:hash_size, :hash_size]
+    return _pack_bits(low > np.median(low))
+
+
+def image_hash(source, method='dhash'):
+    """Compute the configured perceptual hash for an image"""
+    if method == 'phash':
+        return phash(source)
+    if method == 'dhash':
+        return dhash(source)
+    raise ValueError(f"Unknown perceptual hash method: {method}")
+
+
+class PerceptualHashIndex:
+    """Fixed-capacity ring buffer of 64-bit hashes with Hamming-distance search
+
+    Each hash carries the top_k (class, confidence) pairs of its prediction; class
+    names are interned once, so an entry costs 8 + 6 * top_k bytes.
+    """
+
+    def __init__(self, capacity=200000, max_distance=6, method='dhash', top_k=5):
+        if method not in HASH_METHODS:
+            raise ValueError(f"Unknown perceptual hash method: {method}")
+        self.capacity = max(1, int(capacity))
+        self.max_distance = int(max_distance)
+        self.method = method
+        self.top_k = max(1, int(top_k))
+
+        self._hashes = np.zeros(self.capacity, dtype=np.uint64)
+        self._class_ids = np.full((self.capacity, self.top_k), -1, dtype=np.int16)
+        self._confidences = np.zeros((self.capacity, self.top_k), dtype=np.float32)
+        self._class_names = []
+        self._class_lookup = {}
+        self._count = 0
+        self._next = 0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self._lookups = 0
+        self._matches = 0
+        self._match_distances = np.zeros(65, dtype=np.int64)
+
+    def __len__(self):
+        return self._count
+
+    def hash(self, source):
+        """Hash an image with this index's method"""
+        return image_hash(source, self.method)
+
+    def add(self, hash_value, result):
+        """Insert a hash with its prediction, overwriting the oldest entry once the index is full
+
+        Only 'class', 'confidence' and 'top_k' of result are kept.
+        """
+        ranking = result.get('top_k') or [{'class': result['class'], 'confidence': result['confidence']}]
+        ranking = ranking[:self.top_k]
+        with self._lock:
+            slot = self._next
+            self._hashes[slot] = np.uint64(hash_value)
+            self._class_ids[slot] = -1
+            self._confidences[slot] = 0.0
+            for column, pred in enumerate(ranking):
+                self._class_ids[slot, column] = self._class_id(str(pred['class']))
+                self._confidences[slot, column] = float(pred['confidence'])
+            self._next = (self._next + 1) % self.capacity
+            self._count = min(self._count + 1, self.capacity)
+
+    def _class_id(self, name):
+        """Interned id of a class name (callers hold _lock)"""
+        class_id = self._class_lookup.get(name)
+        if class_id is None:
+            class_id = self._class_lookup[name] = len(self._class_names)
+            self._class_names.append(name)
+        return class_id
+
+    def _result(self, slot):
+        """Rebuild the prediction dict stored in a slot (callers hold _lock)"""
+        top_k = [{'class': self._class_names[class_id], 'confidence': float(confidence)}
+                 for class_id, confidence in zip(self._class_ids[slot], self._confidences[slot]) if class_id >= 0]
+        return {'class': top_k[0]['class'], 'confidence': top_k[0]['confidence'], 'top_k': top_k}
+
+    def search(self, hash_value, k=1, max_distance=None):
+        """Return up to k (distance, result) pairs within max_distance, nearest first"""
+        max_distance = self.max_distance if max_distance is None else max_distance
+        with self._lock:
+            if not self._count:
+                return []
+            distances = popcount64(self._hashes[:self._count] ^ np.uint64(hash_value))
+            candidates = np.flatnonzero(distances <= max_distance)
+            if candidates.size > k:
+                candidates = candidates[np.argpartition(distances[candidates], k - 1)[:k]]
+            candidates = candidates[np.argsort(distances[candidates], kind='stable')]
+            return [(int(distances[i]), self._result(i)) for i in candidates]
+
+    def lookup(self, hash_value, max_distance=None):
+        """Return (distance, result) for the nearest match within max_distance, or None"""
+        matches = self.search(hash_value, k=1, max_distance=max_distance)
+        with self._lock:
+            self._lookups += 1
+            if matches:
+                self._matches += 1
+                self._match_distances[matches[0][0]] += 1
+        return matches[0] if matches else None
+
+    def stats(self):
+        """Return index size and match metrics"""
+        with self._lock:
+            distances = {int(d): int(n) for d, n in enumerate(self._match_distances) if n}
+            return {
+                'method': self.method,
+                'entries': self._count,
+                'capacity': self.capacity,
+                'bytes': int(self._hashes.nbytes + self._class_ids.nbytes + self._confidences.nbytes),
+                'max_distance': self.max_distance,
+                'lookups': self._lookups,
+                'matches': self._matches,
+                'match_ratio': self._matches / self._lookups if self._lookups else 0.0,
+                'match_distance_histogram': distances,
+            }
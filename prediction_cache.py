@@ -0,0 +1,224 @@
+# prediction_cache.py
+"""Content-addressed cache for prediction results.
+
+Results are keyed by a hash of the uploaded image bytes, held in an LRU bounded
+by entry count, bytes and TTL, and optionally persisted as JSON files so they
+survive restarts. Concurrent requests for the same key share one computation.
+"""
+import os
+import json
+import time
+import hashlib
+import threading
+import collections
+import logging
+from concurrent.futures import Future
+
+logger = logging.getLogger('crop_matters')
+
+
+class PredictionCache:
+    """Thread-safe LRU cache with TTL, optional disk tier and in-flight coalescing"""
+
+    def __init__(self, max_entries=1024, max_bytes=64 * 1024 * 1024, ttl_seconds=3600, disk_dir=None, namespace=''):
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.ttl_seconds = ttl_seconds
+        self.disk_dir = disk_dir
+        self.namespace = namespace
+
+        self._entries = collections.OrderedDict()  # key -> (value, size, expires_at)
+        self._inflight = {}  # key -> Future
+        self._lock = threading.Lock()
+        self._bytes = 0
+
+        # Metrics
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self.prune_disk()
+
+    def make_key(self, data):
+        """Return the cache key for raw image bytes"""
+        digest = hashlib.sha256()
+        digest.update(self.namespace.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(data)
+        return digest.hexdigest()
+
+    def _expires_at(self, now):
+        return now + self.ttl_seconds if self.ttl_seconds else None
+
+    def _store(self, key, value, size, expires_at):
+        """Insert an entry and evict least-recently-used entries beyond the limits (lock held)"""
+        if key in self._entries:
+            self._bytes -= self._entries.pop(key)[1]
+        self._entries[key] = (value, size, expires_at)
+        self._bytes += size
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self._evictions += 1
+
+    def _lookup(self, key, now):
+        """Return a live in-memory value or None (lock held)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, size, expires_at = entry
+        if expires_at is not None and expires_at <= now:
+            del self._entries[key]
+            self._bytes -= size
+            self._evictions += 1
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _disk_path(self, key):
+        return os.path.join(self.disk_dir, f"{key}.json")
+
+    def _read_disk(self, key, now):
+        """Load a persisted entry if present and not expired"""
+        path = self._disk_path(key)
+        try:
+            if self.ttl_seconds and os.path.getmtime(path) + self.ttl_seconds <= now:
+                os.remove(path)
+                return None
+            with open(path, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Discarding unreadable prediction cache file {path}: {str(e)}")
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            return None
+
+    def _write_disk(self, key, payload):
+        """Persist an entry atomically"""
+        path = self._disk_path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Could not persist prediction cache entry: {str(e)}")
+
+    def prune_disk(self):
+        """Remove expired files from the disk tier"""
+        if not self.disk_dir or not self.ttl_seconds:
+            return
+        cutoff = time.time() - self.ttl_seconds
+        removed = 0
+        for name in os.listdir(self.disk_dir):
+            path = os.path.join(self.disk_dir, name)
+            try:
+                if os.path.getmtime(path) <= cutoff:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                continue
+        if removed:
+            logger.info(f"Pruned {removed} expired prediction cache files")
+
+    def get(self, key):
+        """Return the cached value for key, or None"""
+        now = time.time()
+        with self._lock:
+            value = self._lookup(key, now)
+            if value is not None:
+                self._hits += 1
+                return value
+
+        if self.disk_dir:
+            value = self._read_disk(key, now)
+            if value is not None:
+                payload = json.dumps(value)
+                with self._lock:
+                    self._disk_hits += 1
+                    self._store(key, value, len(payload), self._expires_at(now))
+                return value
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def put(self, key, value):
+        """Store a JSON-serializable value under key"""
+        payload = json.dumps(value)
+        with self._lock:
+            self._store(key, value, len(payload), self._expires_at(time.time()))
+        if self.disk_dir:
+            self._write_disk(key, payload)
+
+    def get_or_compute(self, key, compute_fn, should_cache=None):
+        """Return the cached value for key, computing it at most once across concurrent callers
+
+        should_cache(value) can veto storing a result (e.g. error results); callers that
+        were coalesced onto the computation still receive it.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._lock:
+            # Another caller may have finished computing since the lookup above
+            value = self._lookup(key, time.time())
+            if value is not None:
+                return value
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._inflight[key] = future
+            else:
+                self._coalesced += 1
+
+        if not owner:
+            return future.result()
+
+        try:
+            value = compute_fn()
+            if should_cache is None or should_cache(value):
+                self.put(key, value)
+            future.set_result(value)
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+
+    def stats(self):
+        """Return hit ratio, size and eviction metrics
+
+        hit_ratio counts coalesced requests as hits since they did not run inference.
+        """
+        with self._lock:
+            hits = self._hits + self._disk_hits
+            lookups = hits + self._misses
+            hits += self._coalesced
+            return {
+                'entries': len(self._entries),
+                'bytes': self._bytes,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+                'ttl_seconds': self.ttl_seconds,
+                'hits': self._hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'coalesced': self._coalesced,
+                'evictions': self._evictions,
+                'inflight': len(self._inflight),
+                'hit_ratio': hits / lookups if lookups else 0.0,
+                'disk_tier': bool(self.disk_dir),
+            }
@@ -0,0 +1,218 @@
+# prediction_jobs.py
+"""Asynchronous prediction jobs with stage progress.
+
+A job is queued by the web request and run on a small local thread pool; the
+client follows it by polling or over a Server-Sent Events stream. Job records
+live in memory by default, or in a SQLite file so that any gunicorn worker can
+answer status requests for a job another worker is running - no external broker
+is needed either way.
+
+Stages: queued -> decoding -> inferring -> rendering -> done | failed
+"""
+import json
+import time
+import uuid
+import sqlite3
+import threading
+import collections
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger('crop_disease_detector')
+
+TERMINAL_STATES = ('done', 'failed')
+
+
+class MemoryJobStore:
+    """Job records in a process-local dict"""
+
+    def __init__(self):
+        self._jobs = {}
+        self._changed = threading.Condition()
+
+    def create(self, job):
+        with self._changed:
+            self._jobs[job['id']] = dict(job)
+            self._changed.notify_all()
+
+    def update(self, job_id, **fields):
+        with self._changed:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return
+            job.update(fields, version=job['version'] + 1, updated_at=time.time())
+            self._changed.notify_all()
+
+    def get(self, job_id):
+        with self._changed:
+            job = self._jobs.get(job_id)
+            return dict(job) if job is not None else None
+
+    def wait(self, job_id, version, timeout):
+        """Block until the job's version moves past version or the timeout expires"""
+        with self._changed:
+            self._changed.wait_for(lambda: self._jobs.get(job_id, {}).get('version', version) != version, timeout)
+        return self.get(job_id)
+
+    def prune(self, older_than):
+        with self._changed:
+            expired = [job_id for job_id, job in self._jobs.items()
+                       if job['state'] in TERMINAL_STATES and job['updated_at'] < older_than]
+            for job_id in expired:
+                del self._jobs[job_id]
+        return len(expired)
+
+    def counts(self):
+        with self._changed:
+            counts = {}
+            for job in self._jobs.values():
+                counts[job['state']] = counts.get(job['state'], 0) + 1
+            return counts
+
+
+class SQLiteJobStore:
+    """Job records in a SQLite file shared by every worker process on the host"""
+
+    POLL_INTERVAL = 0.2
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        with self._connect() as db:
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("""CREATE TABLE IF NOT EXISTS jobs (
+                id TEXT PRIMARY KEY, state TEXT, stage TEXT, version INTEGER,
+                created_at REAL, updated_at REAL, result TEXT, error TEXT)""")
+
+    def _connect(self):
+        return sqlite3.connect(self.db_path, timeout=10)
+
+    def create(self, job):
+        with self._connect() as db:
+            db.execute("INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                       (job['id'], job['state'], job['stage'], job['version'], job['created_at'],
+                        job['updated_at'], json.dumps(job['result']), job['error']))
+
+    def update(self, job_id, **fields):
+        if 'result' in fields:
+            fields['result'] = json.dumps(fields['result'], default=str)
+        assignments = ', '.join(f"{name} = ?" for name in fields)
+        with self._connect() as db:
+            db.execute(f"UPDATE jobs SET {assignments}, version = version + 1, updated_at = ? WHERE id = ?",
+                       list(fields.values()) + [time.time(), job_id])
+
+    def get(self, job_id):
+        with self._connect() as db:
+            db.row_factory = sqlite3.Row
+            row = db.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = dict(row)
+        job['result'] = json.loads(job['result']) if job['result'] else None
+        return job
+
+    def wait(self, job_id, version, timeout):
+        """Poll until the job's version moves past version or the timeout expires"""
+        deadline = time.time() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job['version'] != version or time.time() >= deadline:
+                return job
+            time.sleep(self.POLL_INTERVAL)
+
+    def prune(self, older_than):
+        with self._connect() as db:
+            cursor = db.execute("DELETE FROM jobs WHERE state IN ('done', 'failed') AND updated_at < ?", (older_than,))
+            return cursor.rowcount
+
+    def counts(self):
+        with self._connect() as db:
+            return dict(db.execute("SELECT state, COUNT(*) FROM jobs GROUP BY state").fetchall())
+
+
+class JobQueue:
+    """Run job functions on a local thread pool and record their stage progress
+
+    run_fn(payload, progress) does the work, calling progress(stage) as it moves
+    through stages, and returns the JSON-serializable result.
+    """
+
+    def __init__(self, run_fn, workers=2, db_path=None, max_pending=256, ttl_seconds=3600):
+        self.run_fn = run_fn
+        self.store = SQLiteJobStore(db_path) if db_path else MemoryJobStore()
+        self.max_pending = max_pending
+        self.ttl_seconds = ttl_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max(1, int(workers)), thread_name_prefix='prediction-job')
+        self._lock = threading.Lock()
+        self._pending = 0
+
+        # Metrics
+        self._submitted = 0
+        self._rejected = 0
+        self._queue_times = collections.deque(maxlen=1024)
+        self._run_times = collections.deque(maxlen=1024)
+
+    def submit(self, payload):
+        """Queue a job and return its id, or None when the queue is full"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self._rejected += 1
+                return None
+            self._pending += 1
+            self._submitted += 1
+
+        now = time.time()
+        job_id = uuid.uuid4().hex
+        self.store.create({'id': job_id, 'state': 'queued', 'stage': 'queued', 'version': 0,
+                           'created_at': now, 'updated_at': now, 'result': None, 'error': None})
+        self._executor.submit(self._run, job_id, payload, now)
+        return job_id
+
+    def _run(self, job_id, payload, submitted_at):
+        started_at = time.time()
+        try:
+            self.store.update(job_id, state='running')
+            result = self.run_fn(payload, lambda stage: self.store.update(job_id, stage=stage))
+            self.store.update(job_id, state='done', stage='done', result=result)
+        except Exception as e:
+            logger.error(f"Prediction job {job_id} failed: {str(e)}")
+            self.store.update(job_id, state='failed', stage='failed', error=str(e))
+        finally:
+            with self._lock:
+                self._pending -= 1
+                self._queue_times.append(started_at - submitted_at)
+                self._run_times.append(time.time() - started_at)
+            self.store.prune(time.time() - self.ttl_seconds)
+
+    def get(self, job_id):
+        """Return the job record, or None if it is unknown or expired"""
+        return self.store.get(job_id)
+
+    def follow(self, job_id, timeout=300.0, heartbeat=15.0):
+        """Yield the job record on every change until it finishes; yields None as a keep-alive"""
+        deadline = time.time() + timeout
+        job = self.store.get(job_id)
+        version = None
+        while job is not None:
+            if job['version'] != version:
+                version = job['version']
+                yield job
+            else:
+                yield None
+            if job['state'] in TERMINAL_STATES or time.time() >= deadline:
+                return
+            job = self.store.wait(job_id, version, min(heartbeat, max(0.0, deadline - time.time())))
+
+    def stats(self):
+        """Return queue depth, job counts by state and queue/run time averages"""
+        with self._lock:
+            queue_times = list(self._queue_times)
+            run_times = list(self._run_times)
+            stats = {'pending': self._pending, 'max_pending': self.max_pending,
+                     'submitted': self._submitted, 'rejected': self._rejected}
+        stats.update({
+            'store': 'sqlite' if isinstance(self.store, SQLiteJobStore) else 'memory',
+            'states': self.store.counts(),
+            'mean_queue_ms': 1000.0 * sum(queue_times) / len(queue_times) if queue_times else 0.0,
+            'mean_run_ms': 1000.0 * sum(run_times) / len(run_times) if run_times else 0.0,
+        })
+        return stats
@@ -0,0 +1,73 @@
+# test_embedding_index.py
+"""Regression tests for appends to one EmbeddingIndex from several instances."""
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from embedding_index import EmbeddingIndex
+
+
+def _vectors(seed, rows, dim=16):
+    return np.random.default_rng(seed).normal(size=(rows, dim)).astype(np.float32)
+
+
+def _assert_aligned(index, expected):
+    """Every id's own vector must come back as its best match"""
+    assert len(index) == len(expected)
+    for row_id, vector in expected.items():
+        best = index.search(vector, k=1, exact=True)[0]
+        assert best['id'] == row_id
+        assert best['score'] > 0.99
+
+
+def test_two_instances_appending_to_one_path(tmp_path):
+    path = str(tmp_path / 'index')
+    a, b = EmbeddingIndex(path), EmbeddingIndex(path)
+    vectors = _vectors(0, 4)
+    a.add(['a0'], vectors[:1])
+    b.add(['b0', 'b1'], vectors[1:3])
+    a.add(['a1'], vectors[3:])
+
+    expected = {'a0': vectors[0], 'b0': vectors[1], 'b1': vectors[2], 'a1': vectors[3]}
+    _assert_aligned(a, expected)
+    _assert_aligned(b, expected)
+    _assert_aligned(EmbeddingIndex(path), expected)
+    assert 'b1' in a
+
+
+def test_append_trims_interrupted_rows(tmp_path):
+    path = str(tmp_path / 'index')
+    index = EmbeddingIndex(path)
+    vectors = _vectors(1, 3)
+    index.add(['r0'], vectors[:1])
+
+    # A crash after the matrix write leaves a row without its sidecar line, plus a torn line
+    with open(f"{path}.f16", 'ab') as f:
+        f.write(vectors[1].astype(np.float16).tobytes())
+    with open(f"{path}.ids.jsonl", 'a') as f:
+        f.write('{"id": "tor')
+
+    reopened = EmbeddingIndex(path)
+    assert len(reopened) == 1
+    reopened.add(['r2'], vectors[2:])
+    _assert_aligned(EmbeddingIndex(path), {'r0': vectors[0], 'r2': vectors[2]})
+
+
+def test_ivf_lists_stay_aligned_across_instances(tmp_path):
+    path = str(tmp_path / 'index')
+    a = EmbeddingIndex(path)
+    vectors = _vectors(2, 240)
+    a.add([f"a{i}" for i in range(200)], vectors[:200])
+    b = EmbeddingIndex(path)
+    a.train_ivf(nlist=8)
+    b.add([f"b{i}" for i in range(40)], vectors[200:])
+
+    assert os.path.getsize(f"{path}.ivf.i32") == 240 * 4
+    for index in (a, b, EmbeddingIndex(path)):
+        assert len(index) == 240
+        for row in (0, 150, 210, 239):
+            row_id = f"a{row}" if row < 200 else f"b{row - 200}"
+            assert index.search(vectors[row], k=1, nprobe=8)[0]['id'] == row_id
@@ -0,0 +1,78 @@
+# test_inference_server.py
+"""Regression tests for InferenceServer batch replies when clients fail or vanish."""
+import os
+import sys
+import socket
+import selectors
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from inference_server import InferenceServer, STATUS
+
+
+class _FakeDetector:
+    img_size = 8
+    class_names = ['a', 'b', 'c']
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    def _forward(self, batch):
+        if self.fail:
+            raise RuntimeError("forward failed")
+        return np.tile(np.arange(3, dtype=np.float32), (len(batch), 1))
+
+
+def _serve(detector, clients):
+    """Server plus (server end, client end, slot) socket pairs registered like accepted clients"""
+    server = InferenceServer(os.path.join('/tmp', 'unused.sock'), detector, slots=4, slot_images=2)
+    selector = selectors.DefaultSelector()
+    pairs = []
+    for _ in range(clients):
+        server_end, client_end = socket.socketpair()
+        slot = server.free_slots.popleft()
+        selector.register(server_end, selectors.EVENT_READ, slot)
+        server.clients += 1
+        pairs.append((server_end, client_end, slot))
+    return server, selector, pairs
+
+
+def _status(sock):
+    sock.settimeout(1.0)
+    value = STATUS.unpack(sock.recv(STATUS.size))[0]
+    sock.setblocking(False)
+    try:
+        extra = sock.recv(64)
+    except BlockingIOError:
+        extra = b''
+    return value, extra
+
+
+def test_vanished_client_does_not_desync_the_rest_of_the_batch():
+    server, selector, pairs = _serve(_FakeDetector(), 3)
+    try:
+        pending = [(server_end, slot, 1, 0.0) for server_end, _, slot in pairs]
+        pairs[1][1].close()
+        server._dispatch(pending, selector)
+
+        for index in (0, 2):
+            assert _status(pairs[index][1]) == (1, b'')
+            assert np.array_equal(server.buffers.outputs[pairs[index][2], 0], [0, 1, 2])
+        assert server.clients == 2
+        assert pairs[1][2] in server.free_slots
+        assert pairs[1][0] not in [key.fileobj for key in selector.get_map().values()]
+    finally:
+        server.close()
+
+
+def test_failed_forward_answers_every_client_once():
+    server, selector, pairs = _serve(_FakeDetector(fail=True), 2)
+    try:
+        server._dispatch([(server_end, slot, 1, 0.0) for server_end, _, slot in pairs], selector)
+        for _, client_end, _ in pairs:
+            assert _status(client_end) == (-1, b'')
+        assert server.errors == 2
+    finally:
+        server.close()
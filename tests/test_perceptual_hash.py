@@ -0,0 +1,36 @@
+# test_perceptual_hash.py
+"""Tests for the compact prediction storage of PerceptualHashIndex."""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from perceptual_hash import PerceptualHashIndex
+
+
+def _result(name, confidence):
+    return {'class': name, 'confidence': confidence, 'tta': {'views': 8},
+            'top_k': [{'class': name, 'confidence': confidence}, {'class': 'Other', 'confidence': 1 - confidence}]}
+
+
+def test_lookup_rebuilds_the_stored_ranking():
+    index = PerceptualHashIndex(capacity=4, max_distance=2, top_k=3)
+    index.add(0b1011, _result('Tomato___healthy', 0.75))
+
+    distance, result = index.lookup(0b1010)
+    assert distance == 1
+    assert result == {'class': 'Tomato___healthy', 'confidence': 0.75,
+                      'top_k': [{'class': 'Tomato___healthy', 'confidence': 0.75},
+                                {'class': 'Other', 'confidence': 0.25}]}
+    assert index.lookup(0b0100) is None
+
+
+def test_ring_buffer_overwrites_oldest_entry():
+    index = PerceptualHashIndex(capacity=2, max_distance=0, top_k=1)
+    for hash_value, name in ((1, 'a'), (2, 'b'), (3, 'c')):
+        index.add(hash_value, _result(name, 0.5))
+
+    assert len(index) == 2
+    assert index.lookup(1) is None
+    assert index.lookup(3)[1]['top_k'] == [{'class': 'c', 'confidence': 0.5}]
+    assert index.stats()['bytes'] == 2 * (8 + 2 + 4)
@@ -0,0 +1,100 @@
+# thread_budget.py
+"""CPU thread budgeting for TensorFlow across worker processes.
+
+Each TensorFlow runtime sizes its intra-op and inter-op pools to every visible
+core, so N gunicorn workers on one box oversubscribe the CPU N times over. A
+budget splits the cores available to this process evenly across workers, sizes
+the intra-op pool to the worker's share, keeps the inter-op pool small, and can
+optionally pin the worker to its own block of cores.
+
+Workers claim slots with non-blocking file locks, so live workers get distinct
+core blocks without coordination and a restarted worker reuses the slot its
+predecessor released.
+"""
+import os
+import tempfile
+import logging
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+logger = logging.getLogger('crop_disease_detector')
+
+# (slot, open lock file) held for the life of the process
+_slot_lock = None
+
+
+def available_cpus():
+    """CPU ids this process is allowed to run on"""
+    if hasattr(os, 'sched_getaffinity'):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def claim_worker_slot(workers, lock_dir=None, name='crop_inference'):
+    """Claim the lowest free slot in [0, workers), or None if all are taken or locking is unsupported"""
+    global _slot_lock
+    if _slot_lock is not None:
+        return _slot_lock[0]
+    if fcntl is None:
+        return None
+
+    lock_dir = lock_dir or tempfile.gettempdir()
+    for slot in range(workers):
+        lock_file = open(os.path.join(lock_dir, f"{name}.cpu{slot}.lock"), 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            continue
+        _slot_lock = (slot, lock_file)
+        return slot
+    return None
+
+
+def plan_thread_budget(workers=1, worker_slot=None, intra_op_threads=None, inter_op_threads=None, pin=False):
+    """Split this process's cores across workers and return the per-worker thread plan
+
+    intra_op_threads/inter_op_threads override the computed pool sizes. With pin=True
+    the worker claims a slot (unless worker_slot is given) and is assigned its block of cores.
+    """
+    cpus = available_cpus()
+    workers = max(1, int(workers))
+    share = max(1, len(cpus) // workers)
+
+    if pin and worker_slot is None:
+        worker_slot = claim_worker_slot(workers)
+
+    affinity = None
+    if pin and worker_slot is not None:
+        start = (worker_slot % workers) * share
+        affinity = cpus[start:start + share] or cpus
+
+    return {
+        'cpus_available': len(cpus),
+        'workers': workers,
+        'worker_slot': worker_slot,
+        'cores_per_worker': share,
+        'intra_op_threads': int(intra_op_threads or share),
+        # One inter-op thread suffices for a single sequential graph; two once a worker has many cores
+        'inter_op_threads': int(inter_op_threads or (2 if share >= 8 else 1)),
+        'affinity': affinity,
+        'pinned': False,
+    }
+
+
+def apply_thread_budget(plan):
+    """Pin the process to the plan's cores and cap OpenMP pools; call before TensorFlow is imported"""
+    os.environ.setdefault('OMP_NUM_THREADS', str(plan['intra_op_threads']))
+    if plan['affinity'] and hasattr(os, 'sched_setaffinity'):
+        try:
+            os.sched_setaffinity(0, plan['affinity'])
+            plan['pinned'] = True
+        except OSError as e:
+            logger.warning(f"Could not pin worker to CPUs {plan['affinity']}: {str(e)}")
+    logger.info(f"Thread budget: {plan['intra_op_threads']} intra-op / {plan['inter_op_threads']} inter-op threads "
+                f"for worker slot {plan['worker_slot']} of {plan['workers']} "
+                f"({plan['cpus_available']} CPUs, pinned {plan['pinned']})")
+    return plan